@@ -11,29 +11,96 @@ This ensures RC uses actual released versions with full traceability.
 
 Environment variables:
 - DRY_RUN: Set to 'true' to print without writing file
-- GITHUB_TOKEN: Optional GitHub token for higher API rate limits
+- GITHUB_TOKEN: Optional GitHub token for higher API rate limits (also enables
+  resolving all commits with a single GraphQL query)
+- GITHUB_TOKENS: Optional comma-separated GitHub tokens, rotated round-robin
+  together with GITHUB_TOKEN to spread requests across rate-limit buckets
+- MANIFEST_CACHE: Optional path to a SQLite file caching the commits GitHub
+  version tags resolve to across runs (restored in CI via actions/cache)
 """
 
+import functools
+import json
 import os
 import re
+import sqlite3
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import Any, Iterator
 
 import requests
 import yaml
+from common import TokenPool, atomic_write, send_with_backoff
+from requests.adapters import HTTPAdapter
+
+# Prefer the libyaml-backed loader/dumper; fall back to pure Python if PyYAML
+# was built without libyaml
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+# orjson decodes DockerHub/GitHub payloads several times faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Semver tag: X.Y.Z or vX.Y.Z (with optional pre-release)
+_SEMVER_RE = re.compile(r"^v?(\d+\.\d+\.\d+)(-\w+)?$")
+
+# GitHub repository URL -> 'owner/name' (optional trailing '.git' or '/')
+_GITHUB_REPO_RE = re.compile(r"^https?://(?:www\.)?github\.com/([^/]+/[^/?#]+?)(?:\.git)?/?$")
+
+# Maximum number of services queried concurrently against DockerHub/GitHub
+MAX_WORKERS = 10
+
+# Upper bound on DockerHub tag pages scanned per image when matching 'latest'
+MAX_TAG_PAGES = 10
+
+# Manifest cache lifetime (seconds). Only Git tag commits are persisted:
+# DockerHub tags ('latest', '15-alpine', '2', ...) can be re-pushed at any
+# time, so they are resolved again on every run
+CACHE_TTL = 30 * 86400
+
+# Shared session: keeps one pooled keep-alive connection set per host
+# (hub.docker.com, api.github.com) instead of a new TCP+TLS handshake per call.
+# Pool size matches MAX_WORKERS so concurrent lookups don't discard connections.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=MAX_WORKERS))
+
+
+TOKEN_POOL = TokenPool.from_env()
+
+
+def _json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when available."""
+    return orjson.loads(response.content) if orjson else response.json()
+
+
+def request_with_backoff(method: str, url: str, **kwargs) -> requests.Response:
+    """Send a request through SESSION with retries, rotating pooled GitHub tokens."""
+    return send_with_backoff(SESSION, method, url, token_pool=TOKEN_POOL, **kwargs)
 
 
 def _get_github_headers() -> dict:
-    """Get GitHub API headers with optional auth token."""
+    """Get GitHub API headers with the next token from the pool (if any)."""
     headers = {"Accept": "application/vnd.github.v3+json"}
-    github_token = os.environ.get("GITHUB_TOKEN")
+    github_token = TOKEN_POOL.get_next_token()
     if github_token:
         headers["Authorization"] = f"token {github_token}"
     return headers
 
 
+@functools.lru_cache(maxsize=None)
 def _parse_github_repo(repo_url: str) -> str | None:
     """Parse GitHub repo path from URL.
 
@@ -43,14 +110,8 @@ def _parse_github_repo(repo_url: str) -> str | None:
     Returns:
         Repo path (e.g., 'linto-ai/linto-studio') or None
     """
-    if not repo_url or "github.com" not in repo_url:
-        return None
-
-    parsed = urlparse(repo_url)
-    path = parsed.path.strip("/")
-    if path.endswith(".git"):
-        path = path[:-4]
-    return path
+    match = _GITHUB_REPO_RE.match(repo_url) if repo_url else None
+    return match.group(1) if match else None
 
 
 def get_github_commit_for_tag(repo_url: str, tag: str) -> tuple[str | None, str | None]:
@@ -74,9 +135,9 @@ def get_github_commit_for_tag(repo_url: str, tag: str) -> tuple[str | None, str
     for try_tag in tags_to_try:
         url = f"https://api.github.com/repos/{path}/git/ref/tags/{try_tag}"
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = request_with_backoff("GET", url, headers=headers, timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 # Could be a direct commit or an annotated tag
                 obj = data.get("object", {})
                 if obj.get("type") == "commit":
@@ -85,9 +146,9 @@ def get_github_commit_for_tag(repo_url: str, tag: str) -> tuple[str | None, str
                     # Need to dereference the tag to get the commit
                     tag_url = obj.get("url")
                     if tag_url:
-                        tag_response = requests.get(tag_url, headers=headers, timeout=10)
+                        tag_response = request_with_backoff("GET", tag_url, headers=headers, timeout=10)
                         if tag_response.status_code == 200:
-                            tag_data = tag_response.json()
+                            tag_data = _json(tag_response)
                             return tag_data.get("object", {}).get("sha"), None
                         elif tag_response.status_code == 403:
                             return None, "rate-limited"
@@ -122,9 +183,9 @@ def get_github_commit_by_date(repo_url: str, until_date: str) -> tuple[str | Non
     params = {"until": until_date, "per_page": 1}
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        response = request_with_backoff("GET", url, headers=headers, params=params, timeout=10)
         if response.status_code == 200:
-            commits = response.json()
+            commits = _json(response)
             if commits and len(commits) > 0:
                 return commits[0].get("sha"), None
             return None, "no-commits"
@@ -154,16 +215,16 @@ def get_github_default_branch_commit(repo_url: str) -> tuple[str | None, str | N
     # First get the default branch
     url = f"https://api.github.com/repos/{path}"
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = request_with_backoff("GET", url, headers=headers, timeout=10)
         if response.status_code == 200:
-            repo_data = response.json()
+            repo_data = _json(response)
             default_branch = repo_data.get("default_branch", "main")
 
             # Get the latest commit on that branch
             branch_url = f"https://api.github.com/repos/{path}/branches/{default_branch}"
-            branch_response = requests.get(branch_url, headers=headers, timeout=10)
+            branch_response = request_with_backoff("GET", branch_url, headers=headers, timeout=10)
             if branch_response.status_code == 200:
-                branch_data = branch_response.json()
+                branch_data = _json(branch_response)
                 return branch_data.get("commit", {}).get("sha"), None
             elif branch_response.status_code == 403:
                 return None, "rate-limited"
@@ -175,106 +236,328 @@ def get_github_default_branch_commit(repo_url: str) -> tuple[str | None, str | N
     return None, "not-found"
 
 
-def get_dockerhub_tag_digest(image: str, tag: str) -> str | None:
-    """Get the digest for a specific tag from DockerHub.
+# Commit selection shared by tag refs: lightweight tags point at a commit,
+# annotated tags point at a Tag object that must be dereferenced once.
+_GRAPHQL_TAG_TARGET = "target { ... on Commit { oid } ... on Tag { target { oid } } }"
+
+
+def _build_commits_query(lookups: list[tuple[str, dict]]) -> str:
+    """Build one aliased GraphQL query covering every commit lookup.
+
+    Each lookup gets a ``rN: repository(...)`` block selecting the version tag
+    (with and without 'v' prefix), the default branch head and, when a push
+    date is known, the last default-branch commit before that date.
+    """
+    blocks = []
+    for index, (repo_path, version_info) in enumerate(lookups):
+        owner, name = repo_path.split("/", 1)
+        fields = []
+
+        if version_info["version"]:
+            tag = version_info["tag"]
+            tags_to_try = [tag, f"v{tag}"] if not tag.startswith("v") else [tag, tag[1:]]
+            for tag_index, try_tag in enumerate(tags_to_try):
+                qualified = json.dumps(f"refs/tags/{try_tag}")
+                fields.append(f"tag{tag_index}: ref(qualifiedName: {qualified}) {{ {_GRAPHQL_TAG_TARGET} }}")
+
+        history = ""
+        if version_info.get("last_pushed"):
+            until = json.dumps(version_info["last_pushed"])
+            history = f" history(first: 1, until: {until}) {{ nodes {{ oid }} }}"
+        fields.append(f"head: defaultBranchRef {{ target {{ ... on Commit {{ oid{history} }} }} }}")
+
+        blocks.append(
+            f"r{index}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ {' '.join(fields)} }}"
+        )
+
+    return "query { " + " ".join(blocks) + " }"
+
+
+def _pick_commit_from_graphql(repo_data: dict | None, version_info: dict) -> tuple[str | None, str | None, str | None]:
+    """Apply the tag -> date -> head strategy order to one GraphQL result."""
+    if not repo_data:
+        return None, None, "not-found"
+
+    for key in ("tag0", "tag1"):
+        target = (repo_data.get(key) or {}).get("target") or {}
+        # Annotated tags nest the commit one level deeper
+        oid = (target.get("target") or {}).get("oid") or target.get("oid")
+        if oid:
+            return oid, "tag", None
+
+    head = ((repo_data.get("head") or {}).get("target")) or {}
+    history = (head.get("history") or {}).get("nodes") or []
+    if history and history[0].get("oid"):
+        return history[0]["oid"], "date", None
+    if head.get("oid"):
+        return head["oid"], "head", None
+
+    return None, None, "not-found"
+
+
+def get_github_commits_graphql(
+    lookups: list[tuple[str, dict]],
+) -> list[tuple[str | None, str | None, str | None]] | None:
+    """Resolve commits for many services with a single GitHub GraphQL request.
+
+    GraphQL requires authentication, so this is only used when GITHUB_TOKEN
+    is set.
+
+    Args:
+        lookups: List of (repo_url, version_info) pairs
+
+    Returns:
+        List of (commit_sha, commit_source, error_reason) in input order, or
+        None if the batch query could not be performed (caller should fall back
+        to the REST helpers)
+    """
+    headers = _get_github_headers()
+    if "Authorization" not in headers or not lookups:
+        return None
+
+    results: list[tuple[str | None, str | None, str | None]] = [(None, None, "no-repo")] * len(lookups)
+    queried: list[tuple[int, str, dict]] = []
+    for index, (repo_url, version_info) in enumerate(lookups):
+        path = _parse_github_repo(repo_url)
+        if path and "/" in path:
+            queried.append((index, path, version_info))
+
+    if not queried:
+        return results
+
+    query = _build_commits_query([(path, version_info) for _, path, version_info in queried])
+    try:
+        response = request_with_backoff("POST", GITHUB_GRAPHQL_URL, headers=headers, json={"query": query}, timeout=30)
+    except requests.RequestException:
+        return None
+
+    if response.status_code == 403:
+        for index, _, _ in queried:
+            results[index] = (None, None, "rate-limited")
+        return results
+    if response.status_code != 200:
+        return None
+
+    payload = _json(response)
+    data = payload.get("data")
+    if data is None:
+        # Whole-query failure (e.g., rate limit or schema error)
+        errors = payload.get("errors") or []
+        if any(error.get("type") == "RATE_LIMITED" for error in errors):
+            for index, _, _ in queried:
+                results[index] = (None, None, "rate-limited")
+            return results
+        return None
+
+    for alias_index, (index, _, version_info) in enumerate(queried):
+        results[index] = _pick_commit_from_graphql(data.get(f"r{alias_index}"), version_info)
+
+    return results
+
+
+@dataclass(frozen=True, slots=True)
+class TagInfo:
+    """A DockerHub tag and the digest it points to (first image, usually amd64)."""
+
+    name: str
+    digest: str
+    last_pushed: str | None = None
+
+
+class ManifestCache:
+    """SQLite cache of the commits GitHub version tags resolve to.
+
+    Persists across RC builds so warm runs skip the tag-to-commit lookups.
+    Disabled (all lookups miss, writes are ignored) when no path is given.
+    """
+
+    def __init__(self, path: str | None):
+        self._conn = None
+        self._lock = threading.Lock()
+        if not path:
+            return
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS commits(repo TEXT, tag TEXT, sha TEXT, fetched REAL, ttl REAL,"
+            " PRIMARY KEY(repo, tag))"
+        )
+
+    def _fetch_one(self, query: str, params: tuple) -> tuple | None:
+        if self._conn is None:
+            return None
+        with self._lock:
+            return self._conn.execute(query, (*params, time.time())).fetchone()
+
+    def _store(self, query: str, params: tuple) -> None:
+        if self._conn is None:
+            return
+        with self._lock:
+            self._conn.execute(query, params)
+
+    def get_commit(self, repo_url: str, tag: str) -> str | None:
+        """Get a cached commit SHA for a Git tag if it has not expired."""
+        row = self._fetch_one(
+            "SELECT sha FROM commits WHERE repo = ? AND tag = ? AND fetched + ttl > ?",
+            (repo_url, tag),
+        )
+        return row[0] if row else None
+
+    def put_commit(self, repo_url: str, tag: str, sha: str) -> None:
+        """Store the commit SHA a Git tag resolved to."""
+        self._store(
+            "INSERT OR REPLACE INTO commits VALUES (?, ?, ?, ?, ?)",
+            (repo_url, tag, sha, time.time(), CACHE_TTL),
+        )
+
+
+MANIFEST_CACHE = ManifestCache(os.environ.get("MANIFEST_CACHE"))
+
+
+def get_dockerhub_tag(image: str, tag: str) -> TagInfo | None:
+    """Get a single tag from DockerHub.
 
     Args:
         image: Full image name (e.g., 'mongo' or 'lintoai/studio-api')
         tag: Tag name (e.g., 'latest' or '6.0.2')
 
     Returns:
-        Digest string or None if not found
+        TagInfo or None if not found
     """
     namespace, name = image.split("/") if "/" in image else ("library", image)
     url = f"https://hub.docker.com/v2/repositories/{namespace}/{name}/tags/{tag}"
 
     try:
-        response = requests.get(url, timeout=30)
+        response = request_with_backoff("GET", url, timeout=30)
         if response.status_code == 200:
-            data = response.json()
+            data = _json(response)
             images = data.get("images", [])
-            if images:
-                return images[0].get("digest")
+            if images and images[0].get("digest"):
+                return TagInfo(tag, images[0]["digest"], data.get("tag_last_pushed"))
     except requests.RequestException:
         pass
 
     return None
 
 
-def get_dockerhub_tags(image: str, page_size: int = 100) -> list[dict]:
-    """Get all tags from DockerHub for an image.
+def get_dockerhub_tag_digest(image: str, tag: str) -> str | None:
+    """Get the digest for a specific tag from DockerHub.
 
     Args:
-        image: Full image name (e.g., 'lintoai/studio-api')
-        page_size: Number of tags per page
+        image: Full image name (e.g., 'mongo' or 'lintoai/studio-api')
+        tag: Tag name (e.g., 'latest' or '6.0.2')
 
     Returns:
-        List of tag info dicts with 'name' and 'digest' keys
+        Digest string or None if not found
     """
-    namespace, name = image.split("/") if "/" in image else ("library", image)
-    url = f"https://hub.docker.com/v2/repositories/{namespace}/{name}/tags"
+    tag_info = get_dockerhub_tag(image, tag)
+    return tag_info.digest if tag_info else None
+
+
+@functools.lru_cache(maxsize=256)
+def _fetch_dockerhub_tags_page(url: str) -> tuple[tuple[TagInfo, ...], str | None]:
+    """Fetch one page of tags from DockerHub (cached for the lifetime of the run).
+
+    Returns:
+        Tuple of (tags, next_page_url)
+
+    Raises:
+        requests.RequestException: On network or HTTP errors (not cached)
+    """
+    response = request_with_backoff("GET", url, timeout=30)
+    response.raise_for_status()
+    data = _json(response)
 
     tags = []
-    try:
-        response = requests.get(url, params={"page_size": page_size}, timeout=30)
-        response.raise_for_status()
-        data = response.json()
+    for tag in data.get("results", []):
+        tag_name = tag.get("name")
+        # Get digest from images array (first one, usually amd64)
+        images = tag.get("images", [])
+        digest = images[0].get("digest") if images else None
+
+        if tag_name and digest:
+            tags.append(TagInfo(tag_name, digest, tag.get("tag_last_pushed")))
+
+    return tuple(tags), data.get("next")
+
+
+def iter_dockerhub_tag_pages(image: str, page_size: int = 100) -> Iterator[tuple[TagInfo, ...]]:
+    """Iterate over DockerHub tags page by page, most recently pushed first.
+
+    Args:
+        image: Full image name (e.g., 'lintoai/studio-api')
+        page_size: Number of tags per page
 
-        for tag in data.get("results", []):
-            tag_name = tag.get("name")
-            # Get digest from images array (first one, usually amd64)
-            images = tag.get("images", [])
-            digest = images[0].get("digest") if images else None
+    Yields:
+        Tuples of TagInfo
+    """
+    namespace, name = image.split("/") if "/" in image else ("library", image)
+    url = f"https://hub.docker.com/v2/repositories/{namespace}/{name}/tags?page_size={page_size}&ordering=last_updated"
 
-            if tag_name and digest:
-                tags.append({
-                    "name": tag_name,
-                    "digest": digest,
-                    "last_pushed": tag.get("tag_last_pushed"),
-                })
+    for _ in range(MAX_TAG_PAGES):
+        try:
+            tags, url = _fetch_dockerhub_tags_page(url)
+        except requests.RequestException as e:
+            print(f"  Warning: Could not fetch tags for {image}: {e}", file=sys.stderr)
+            return
+        yield tags
+        if not url:
+            return
 
-    except requests.RequestException as e:
-        print(f"  Warning: Could not fetch tags for {image}: {e}", file=sys.stderr)
 
-    return tags
+def _semver_key(tag: str) -> tuple[tuple[int, ...], bool, str]:
+    """Sort key for semver tags: numeric X.Y.Z, releases above pre-releases."""
+    match = _SEMVER_RE.match(tag)
+    numbers = tuple(int(part) for part in match.group(1).split("."))
+    prerelease = match.group(2)
+    return numbers, prerelease is None, prerelease or ""
 
 
-def find_version_tag_for_latest(image: str) -> dict | None:
+def find_version_tag_for_latest(image: str, previous: dict | None = None) -> dict | None:
     """Find the semver tag that matches the 'latest' digest.
 
+    Tag pages are scanned newest first and scanning stops after the first page
+    containing a match, since version tags are pushed together with 'latest'.
+
     Args:
         image: Full image name (e.g., 'lintoai/studio-api')
+        previous: Entry for this service from the previous rc.yaml, reused
+            as-is when 'latest' still points at the same digest
 
     Returns:
         Dict with version info or None if not found
     """
-    tags = get_dockerhub_tags(image)
-    if not tags:
-        return None
-
     # Find the 'latest' tag and its digest
-    latest_digest = None
-    latest_pushed = None
-    for tag in tags:
-        if tag["name"] == "latest":
-            latest_digest = tag["digest"]
-            latest_pushed = tag["last_pushed"]
-            break
-
-    if not latest_digest:
+    latest = get_dockerhub_tag(image, "latest")
+    if not latest:
         print(f"  Warning: No 'latest' tag found for {image}", file=sys.stderr)
         return None
 
-    # Find semver tags with the same digest
-    # Semver pattern: X.Y.Z or vX.Y.Z (with optional pre-release)
-    semver_pattern = re.compile(r"^v?(\d+\.\d+\.\d+)(-\w+)?$")
+    latest_digest = latest.digest
+    latest_pushed = latest.last_pushed
+
+    # Unchanged since the last RC build: skip the tag scan and GitHub lookups
+    if previous and previous.get("digest") == latest_digest and previous.get("tag"):
+        previous_commit = previous.get("commit")
+        if previous_commit and not previous_commit.startswith("<"):
+            previous_tag = previous["tag"]
+            return {
+                "tag": previous_tag,
+                "digest": latest_digest,
+                "version": previous_tag.lstrip("v") if previous_tag != "latest" else None,
+                "last_pushed": latest_pushed,
+                "commit": previous_commit,
+                "commit_source": "unchanged",
+            }
 
+    # Find semver tags with the same digest
     matching_versions = []
-    for tag in tags:
-        if tag["digest"] == latest_digest and tag["name"] != "latest":
-            match = semver_pattern.match(tag["name"])
-            if match:
-                matching_versions.append(tag["name"])
+    for page in iter_dockerhub_tag_pages(image):
+        for tag in page:
+            if tag.digest == latest_digest and tag.name != "latest" and _SEMVER_RE.match(tag.name):
+                matching_versions.append(tag.name)
+        if matching_versions:
+            break
 
     if not matching_versions:
         # No semver match, return latest info anyway
@@ -286,10 +569,8 @@ def find_version_tag_for_latest(image: str) -> dict | None:
             "commit": None,
         }
 
-    # Sort versions and pick the highest (most recent)
-    # Simple sort works for most cases, could use packaging.version for robustness
-    matching_versions.sort(reverse=True)
-    version_tag = matching_versions[0]
+    # Pick the highest version (numeric comparison, so 1.10.0 > 1.9.0)
+    version_tag = max(matching_versions, key=_semver_key)
 
     return {
         "tag": version_tag,
@@ -300,6 +581,78 @@ def find_version_tag_for_latest(image: str) -> dict | None:
     }
 
 
+def resolve_service_commit(repo_url: str, version_info: dict) -> tuple[str | None, str | None, str | None]:
+    """Resolve the Git commit for a service image from GitHub.
+
+    Strategies are tried in order: version tag, Docker push date, default branch head.
+
+    Args:
+        repo_url: GitHub repository URL
+        version_info: Version info returned by find_version_tag_for_latest
+
+    Returns:
+        Tuple of (commit_sha, commit_source, error_reason)
+    """
+    commit_sha = None
+    commit_error = None
+
+    # Strategy 1: Try to get commit from version tag
+    if version_info["version"]:
+        commit_sha, commit_error = get_github_commit_for_tag(repo_url, version_info["tag"])
+        if commit_sha:
+            return commit_sha, "tag", None
+
+    # Strategy 2: Try to get commit by Docker push date
+    if commit_error != "rate-limited" and version_info.get("last_pushed"):
+        commit_sha, commit_error = get_github_commit_by_date(repo_url, version_info["last_pushed"])
+        if commit_sha:
+            return commit_sha, "date", None
+
+    # Strategy 3: Fallback to latest commit on default branch
+    if commit_error != "rate-limited":
+        commit_sha, commit_error = get_github_default_branch_commit(repo_url)
+        if commit_sha:
+            return commit_sha, "head", None
+
+    return None, None, commit_error
+
+
+def resolve_commits(lookups: list[tuple[str, dict]]) -> list[tuple[str | None, str | None, str | None]]:
+    """Resolve Git commits for a batch of services.
+
+    Version tags already resolved in the manifest cache are answered locally.
+    The rest use one GraphQL round-trip when possible, otherwise the REST
+    strategy ladder runs for each service concurrently.
+
+    Args:
+        lookups: List of (repo_url, version_info) pairs
+
+    Returns:
+        List of (commit_sha, commit_source, error_reason) in input order
+    """
+    results: list[tuple[str | None, str | None, str | None] | None] = []
+    for repo_url, version_info in lookups:
+        cached = MANIFEST_CACHE.get_commit(repo_url, version_info["tag"]) if version_info["version"] else None
+        results.append((cached, "tag", None) if cached else None)
+
+    pending = [index for index, result in enumerate(results) if result is None]
+    pending_lookups = [lookups[index] for index in pending]
+
+    fetched = get_github_commits_graphql(pending_lookups)
+    if fetched is None:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            fetched = list(executor.map(lambda lookup: resolve_service_commit(*lookup), pending_lookups))
+
+    for index, result in zip(pending, fetched):
+        repo_url, version_info = lookups[index]
+        commit_sha, commit_source, _ = result
+        if commit_sha and commit_source == "tag":
+            MANIFEST_CACHE.put_commit(repo_url, version_info["tag"], commit_sha)
+        results[index] = result
+
+    return results
+
+
 def create_rc_file(versions_dir: Path, dry_run: bool = False) -> Path | None:
     """Create the RC version file by querying DockerHub.
 
@@ -317,23 +670,66 @@ def create_rc_file(versions_dir: Path, dry_run: bool = False) -> Path | None:
         sys.exit(1)
 
     with open(latest_file) as f:
-        versions = yaml.safe_load(f)
+        versions = yaml.load(f, Loader=SafeLoader)
 
     print("Querying DockerHub for service versions...")
     print()
 
+    # Previous RC entries, reused for services whose 'latest' digest is unchanged
+    previous_linto = {}
+    rc_file = versions_dir / "rc.yaml"
+    if rc_file.exists():
+        with open(rc_file) as f:
+            previous_linto = (yaml.load(f, Loader=SafeLoader) or {}).get("linto", {})
+
     # Track versions for RC naming
     service_versions = {}
     all_have_versions = True
 
-    # Update all linto service tags
-    for service, config in versions.get("linto", {}).items():
-        image = config.get("image")
-        if not image:
-            continue
-
-        print(f"  {service} ({image})...")
-        version_info = find_version_tag_for_latest(image)
+    # Submit every DockerHub lookup (linto versions + database/LLM digests) as
+    # one batch so all sections share the same fan-out; results are applied
+    # and printed in file order afterwards
+    linto_services = [(service, config) for service, config in versions.get("linto", {}).items() if config.get("image")]
+    previous_entries = [
+        previous if (previous := previous_linto.get(service)) and previous.get("image") == config["image"] else None
+        for service, config in linto_services
+    ]
+    digest_sections = {
+        section: [(service, config) for service, config in versions.get(section, {}).items() if config.get("image")]
+        for section in ("databases", "llm")
+    }
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        version_futures = [
+            executor.submit(find_version_tag_for_latest, config["image"], previous)
+            for (_, config), previous in zip(linto_services, previous_entries)
+        ]
+        # One request per unique (image, tag), shared by every service using it
+        digest_pairs = dict.fromkeys(
+            (config["image"], config.get("tag", "latest"))
+            for services in digest_sections.values()
+            for _, config in services
+        )
+        digest_futures = {pair: executor.submit(get_dockerhub_tag_digest, *pair) for pair in digest_pairs}
+        results = [future.result() for future in version_futures]
+        digests = {pair: future.result() for pair, future in digest_futures.items()}
+
+    # Resolve commits for every service in one batch (reused entries already have one)
+    lookups = [
+        (config["repo"], version_info)
+        for (_, config), version_info in zip(linto_services, results)
+        if version_info and config.get("repo") and not version_info.get("commit")
+    ]
+    for (_, version_info), (commit_sha, commit_source, commit_error) in zip(lookups, resolve_commits(lookups)):
+        if commit_sha:
+            version_info["commit"] = commit_sha
+            version_info["commit_source"] = commit_source
+        elif commit_error:
+            # Store placeholder with error reason
+            version_info["commit"] = f"<{commit_error}>"
+            version_info["commit_source"] = commit_error
+
+    for (service, config), version_info in zip(linto_services, results):
+        print(f"  {service} ({config['image']})...")
 
         if version_info:
             old_tag = config.get("tag", "latest")
@@ -344,51 +740,17 @@ def create_rc_file(versions_dir: Path, dry_run: bool = False) -> Path | None:
             if version_info.get("digest"):
                 config["digest"] = version_info["digest"]
 
-            # Get commit SHA from GitHub
-            repo_url = config.get("repo", "")
-            commit_sha = None
-            commit_source = None
-            commit_error = None
-
-            if repo_url:
-                # Strategy 1: Try to get commit from version tag
-                if version_info["version"]:
-                    commit_sha, commit_error = get_github_commit_for_tag(repo_url, version_info["tag"])
-                    if commit_sha:
-                        commit_source = "tag"
-
-                # Strategy 2: Try to get commit by Docker push date
-                if not commit_sha and commit_error != "rate-limited" and version_info.get("last_pushed"):
-                    commit_sha, commit_error = get_github_commit_by_date(repo_url, version_info["last_pushed"])
-                    if commit_sha:
-                        commit_source = "date"
-
-                # Strategy 3: Fallback to latest commit on default branch
-                if not commit_sha and commit_error != "rate-limited":
-                    commit_sha, commit_error = get_github_default_branch_commit(repo_url)
-                    if commit_sha:
-                        commit_source = "head"
-
-                # Store commit or placeholder
-                if commit_sha:
-                    version_info["commit"] = commit_sha
-                    version_info["commit_source"] = commit_source
-                    config["commit"] = commit_sha
-                elif commit_error:
-                    # Store placeholder with error reason
-                    placeholder = f"<{commit_error}>"
-                    version_info["commit"] = placeholder
-                    version_info["commit_source"] = commit_error
-                    config["commit"] = placeholder
+            # Store commit or placeholder
+            if version_info.get("commit"):
+                config["commit"] = version_info["commit"]
 
             service_versions[service] = version_info
 
-            digest_short = version_info["digest"][:19] + "..." if version_info.get("digest") else ""
             if version_info.get("commit"):
                 if version_info["commit"].startswith("<"):
                     commit_str = version_info["commit"]
                 else:
-                    commit_str = f"{version_info['commit'][:7]} ({commit_source})"
+                    commit_str = f"{version_info['commit'][:7]} ({version_info['commit_source']})"
             else:
                 commit_str = "-"
 
@@ -401,41 +763,21 @@ def create_rc_file(versions_dir: Path, dry_run: bool = False) -> Path | None:
             print(f"    Could not determine version, keeping {config.get('tag', 'latest')}")
             all_have_versions = False
 
-    # Fetch digests for databases (no commit needed)
-    print()
-    print("Fetching database digests...")
-    for service, config in versions.get("databases", {}).items():
-        image = config.get("image")
-        tag = config.get("tag", "latest")
-        if not image:
-            continue
-
-        print(f"  {service} ({image}:{tag})...", end=" ")
-        digest = get_dockerhub_tag_digest(image, tag)
-
-        if digest:
-            config["digest"] = digest
-            print(f"digest: {digest[:19]}...")
-        else:
-            print("digest not found")
-
-    # Fetch digests for LLM services (no commit needed)
-    print()
-    print("Fetching LLM digests...")
-    for service, config in versions.get("llm", {}).items():
-        image = config.get("image")
-        tag = config.get("tag", "latest")
-        if not image:
-            continue
-
-        print(f"  {service} ({image}:{tag})...", end=" ")
-        digest = get_dockerhub_tag_digest(image, tag)
-
-        if digest:
-            config["digest"] = digest
-            print(f"digest: {digest[:19]}...")
-        else:
-            print("digest not found")
+    # Apply digests for databases and LLM services (no commit needed)
+    for section, label in (("databases", "database"), ("llm", "LLM")):
+        print()
+        print(f"Fetching {label} digests...")
+        for service, config in digest_sections[section]:
+            image = config["image"]
+            tag = config.get("tag", "latest")
+            digest = digests[(image, tag)]
+            print(f"  {service} ({image}:{tag})...", end=" ")
+
+            if digest:
+                config["digest"] = digest
+                print(f"digest: {digest[:19]}...")
+            else:
+                print("digest not found")
 
     # Generate RC version name
     now = datetime.now(timezone.utc)
@@ -474,8 +816,7 @@ def create_rc_file(versions_dir: Path, dry_run: bool = False) -> Path | None:
         return None
 
     # Write RC file
-    rc_file = versions_dir / "rc.yaml"
-    with open(rc_file, "w") as f:
+    with atomic_write(rc_file) as f:
         f.write("# LinTO Platform - Release Candidate Version\n")
         f.write("#\n")
         f.write("# This file is automatically generated by querying DockerHub.\n")
@@ -488,7 +829,9 @@ def create_rc_file(versions_dir: Path, dry_run: bool = False) -> Path | None:
 
         # Write YAML content (excluding internal metadata)
         versions_to_write = {k: v for k, v in versions.items() if not k.startswith("_")}
-        yaml.dump(versions_to_write, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        yaml.dump(
+            versions_to_write, f, default_flow_style=False, sort_keys=False, allow_unicode=True, Dumper=SafeDumper
+        )
 
     return rc_file
 
@@ -0,0 +1,195 @@
+"""Helpers shared by the version-maintenance scripts.
+
+Each script is run directly (``python scripts/<name>.py``), so this directory
+is on ``sys.path`` and the helpers are imported as ``from common import ...``.
+"""
+
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, TextIO
+
+import requests
+
+# Retry policy for rate-limited (403/429) and 5xx responses
+MAX_RETRIES = 5
+MAX_RETRY_WAIT = 120  # seconds; longer resets are reported as rate-limited
+
+
+@contextmanager
+def atomic_write(path: Path, buffering: int = -1) -> Iterator[TextIO]:
+    """Open a temp file next to path and atomically replace path on success.
+
+    Readers never observe a partially written file; on error the original is
+    left untouched.
+
+    Args:
+        path: File to replace
+        buffering: Buffer size for the temp file (as for open())
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", buffering=buffering) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+class TokenPool:
+    """Round-robin pool of GitHub tokens with per-token rate-limit tracking.
+
+    Tokens whose remaining quota is low are skipped until their reset time,
+    and tokens rejected with 401 are disabled for the rest of the run.
+    """
+
+    LOW_REMAINING = 10
+
+    def __init__(self, tokens: list[str]):
+        self._tokens = list(dict.fromkeys(tokens))
+        self._remaining: dict[str, int | None] = dict.fromkeys(self._tokens)
+        self._reset_at: dict[str, float] = dict.fromkeys(self._tokens, 0.0)
+        self._disabled: set[str] = set()
+        self._index = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "TokenPool":
+        """Build the pool from GITHUB_TOKENS (comma-separated) and GITHUB_TOKEN."""
+        tokens = [token.strip() for token in os.environ.get("GITHUB_TOKENS", "").split(",") if token.strip()]
+        github_token = os.environ.get("GITHUB_TOKEN", "").strip()
+        if github_token:
+            tokens.append(github_token)
+        return cls(tokens)
+
+    def get_next_token(self) -> str | None:
+        """Get the next healthy token.
+
+        Returns:
+            A token, the enabled token that resets soonest if all are exhausted,
+            or None if the pool has no usable token
+        """
+        with self._lock:
+            now = time.time()
+            for _ in range(len(self._tokens)):
+                token = self._tokens[self._index]
+                self._index = (self._index + 1) % len(self._tokens)
+                if token in self._disabled:
+                    continue
+                remaining = self._remaining[token]
+                if remaining is not None and remaining <= self.LOW_REMAINING and self._reset_at[token] > now:
+                    continue
+                return token
+
+            enabled = [token for token in self._tokens if token not in self._disabled]
+            return min(enabled, key=self._reset_at.__getitem__) if enabled else None
+
+    def sync(self, token: str, response: requests.Response) -> None:
+        """Update a token's health from a GitHub response."""
+        with self._lock:
+            if token not in self._remaining:
+                return
+            if response.status_code == 401:
+                self._disabled.add(token)
+                return
+            remaining = response.headers.get("X-RateLimit-Remaining", "")
+            reset = response.headers.get("X-RateLimit-Reset", "")
+            if remaining.isdigit():
+                self._remaining[token] = int(remaining)
+            if reset.isdigit():
+                self._reset_at[token] = float(reset)
+
+
+def _retry_delay(response: requests.Response, backoff: float) -> float:
+    """Compute how long to wait before retrying a throttled/failed response.
+
+    Prefers Retry-After (DockerHub 429, GitHub secondary limits), then
+    X-RateLimit-Reset (GitHub primary limit), then exponential backoff with jitter.
+    """
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+
+    reset = response.headers.get("X-RateLimit-Reset", "")
+    if reset.isdigit() and response.headers.get("X-RateLimit-Remaining") == "0":
+        return max(int(reset) - time.time(), 0) + 1
+
+    return backoff + random.uniform(0, backoff)
+
+
+def _is_retryable(response: requests.Response) -> bool:
+    """Check if a response is a transient failure worth retrying."""
+    if response.status_code == 429 or response.status_code >= 500:
+        return True
+    # GitHub signals rate limiting with 403; other 403s are permission errors
+    if response.status_code == 403:
+        return "Retry-After" in response.headers or response.headers.get("X-RateLimit-Remaining") == "0"
+    return False
+
+
+def send_with_backoff(
+    session: requests.Session,
+    method: str,
+    url: str,
+    max_retries: int = MAX_RETRIES,
+    token_pool: TokenPool | None = None,
+    **kwargs,
+) -> requests.Response:
+    """Send a request through session, retrying rate-limited and 5xx responses.
+
+    Waits longer than MAX_RETRY_WAIT are not slept through: the last response
+    is returned so the caller can report the service as rate-limited.
+
+    Args:
+        session: Session the request is sent through
+        method: HTTP method (e.g., 'GET')
+        url: Request URL
+        max_retries: Maximum number of retries after the first attempt
+        token_pool: GitHub tokens to track and rotate through when the
+            request is authenticated with one of them
+        **kwargs: Passed through to requests.Session.request
+
+    Returns:
+        The final response
+
+    Raises:
+        requests.RequestException: If the last attempt fails at the network level
+    """
+    backoff = 1.0
+    for attempt in range(max_retries + 1):
+        auth = (kwargs.get("headers") or {}).get("Authorization", "")
+        token = auth.removeprefix("token ") if token_pool is not None and auth.startswith("token ") else None
+        try:
+            response = session.request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == max_retries:
+                raise
+            time.sleep(backoff + random.uniform(0, backoff))
+            backoff *= 2
+            continue
+
+        if token:
+            token_pool.sync(token, response)
+
+        if attempt == max_retries or not _is_retryable(response):
+            return response
+
+        # Rate-limited on one token: switch to another pooled token before waiting
+        if token and response.status_code in (403, 429):
+            next_token = token_pool.get_next_token()
+            if next_token and next_token != token:
+                kwargs["headers"] = {**kwargs["headers"], "Authorization": f"token {next_token}"}
+                continue
+
+        delay = _retry_delay(response, backoff)
+        if delay > MAX_RETRY_WAIT:
+            return response
+        time.sleep(delay)
+        backoff *= 2
+
+    return response
@@ -18,6 +18,14 @@ from pathlib import Path
 
 import yaml
 
+# Prefer the libyaml-backed loader/dumper; fall back to pure Python if PyYAML
+# was built without libyaml
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 
 def create_release(version: str, dry_run: bool = False) -> None:
     """Create a stable platform release from the RC.
@@ -40,7 +48,7 @@ def create_release(version: str, dry_run: bool = False) -> None:
 
     # Load RC versions
     with open(source_file) as f:
-        versions = yaml.safe_load(f)
+        versions = yaml.load(f, Loader=SafeLoader)
 
     print(f"Creating release: {version}")
     print(f"Source: {source_file}")
@@ -104,7 +112,9 @@ def create_release(version: str, dry_run: bool = False) -> None:
 
         # Remove internal metadata before dumping
         versions_to_write = {k: v for k, v in versions.items() if not k.startswith("_")}
-        yaml.dump(versions_to_write, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        yaml.dump(
+            versions_to_write, f, default_flow_style=False, sort_keys=False, allow_unicode=True, Dumper=SafeDumper
+        )
 
     print(f"Created: {release_file}")
 
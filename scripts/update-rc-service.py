@@ -7,16 +7,47 @@ Environment variables:
 - SERVICE: Service name to update (required)
 - TAG: Docker tag (default: 'latest')
 - COMMIT_SHA: Git commit SHA (optional, will be fetched if not provided)
+- DIGEST: Image digest (optional, skips the DockerHub lookup when provided)
 - GITHUB_TOKEN: GitHub token for API requests (optional, increases rate limit)
 """
 
+import fcntl
 import os
 import sys
 from pathlib import Path
+from typing import Any
 from urllib.parse import urlparse
 
 import requests
 import yaml
+from common import atomic_write, send_with_backoff
+
+# Prefer the libyaml-backed loader/dumper; fall back to pure Python if PyYAML
+# was built without libyaml
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+# orjson decodes DockerHub/GitHub payloads several times faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Shared session so DockerHub calls reuse a keep-alive connection
+SESSION = requests.Session()
+
+
+def _json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when available."""
+    return orjson.loads(response.content) if orjson else response.json()
+
+
+def request_with_backoff(method: str, url: str, **kwargs) -> requests.Response:
+    """Send a request through SESSION, retrying rate-limited and 5xx responses."""
+    return send_with_backoff(SESSION, method, url, **kwargs)
 
 
 def get_dockerhub_tag_info(image: str, tag: str) -> dict | None:
@@ -25,9 +56,9 @@ def get_dockerhub_tag_info(image: str, tag: str) -> dict | None:
     url = f"https://hub.docker.com/v2/repositories/{namespace}/{name}/tags/{tag}"
 
     try:
-        response = requests.get(url, timeout=30)
+        response = request_with_backoff("GET", url, timeout=30)
         if response.status_code == 200:
-            data = response.json()
+            data = _json(response)
             images = data.get("images", [])
             digest = images[0].get("digest") if images else None
             return {
@@ -45,6 +76,7 @@ def main():
     service = os.environ.get("SERVICE")
     tag = os.environ.get("TAG", "latest")
     commit_sha = os.environ.get("COMMIT_SHA")
+    digest = os.environ.get("DIGEST", "").strip()
 
     if not service:
         print("Error: SERVICE environment variable is required", file=sys.stderr)
@@ -58,9 +90,14 @@ def main():
         print(f"Error: {rc_file} not found", file=sys.stderr)
         sys.exit(1)
 
+    # Serialize concurrent updates: hold an exclusive lock across the whole
+    # read-modify-write (released automatically when the process exits)
+    lock_file = open(rc_file.with_name(rc_file.name + ".lock"), "w")
+    fcntl.flock(lock_file, fcntl.LOCK_EX)
+
     # Load rc.yaml
     with open(rc_file) as f:
-        versions = yaml.safe_load(f)
+        versions = yaml.load(f, Loader=SafeLoader)
 
     # Find service in linto section
     if service not in versions.get("linto", {}):
@@ -78,17 +115,25 @@ def main():
     print(f"  Image: {image}")
     print(f"  Tag: {tag}")
 
-    # Fetch digest from DockerHub
-    tag_info = get_dockerhub_tag_info(image, tag)
-
-    if tag_info:
+    # Skip the DockerHub lookup when Jenkins passed the digest it just pushed.
+    # The digest recorded in rc.yaml is not reused: the same tag + commit can be
+    # rebuilt and re-pushed (e.g., a base image refresh) under a new digest
+    if digest:
         config["tag"] = tag
-        if tag_info.get("digest"):
-            config["digest"] = tag_info["digest"]
-            print(f"  Digest: {tag_info['digest'][:19]}...")
+        config["digest"] = digest
+        print(f"  Digest: {digest[:19]}... (provided)")
     else:
-        print("  Warning: Could not fetch digest from DockerHub", file=sys.stderr)
-        config["tag"] = tag
+        # Fetch digest from DockerHub
+        tag_info = get_dockerhub_tag_info(image, tag)
+
+        if tag_info:
+            config["tag"] = tag
+            if tag_info.get("digest"):
+                config["digest"] = tag_info["digest"]
+                print(f"  Digest: {tag_info['digest'][:19]}...")
+        else:
+            print("  Warning: Could not fetch digest from DockerHub", file=sys.stderr)
+            config["tag"] = tag
 
     # Set commit if provided
     if commit_sha:
@@ -96,8 +141,8 @@ def main():
         print(f"  Commit: {commit_sha[:7]}")
 
     # Save rc.yaml
-    with open(rc_file, "w") as f:
-        yaml.dump(versions, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    with atomic_write(rc_file) as f:
+        yaml.dump(versions, f, default_flow_style=False, sort_keys=False, allow_unicode=True, Dumper=SafeDumper)
 
     print(f"\nUpdated {rc_file}")
 
@@ -6,28 +6,181 @@ This script is triggered by:
 2. Manual workflow_dispatch (with optional service and tag)
 3. Scheduled sync (no inputs - syncs all from DockerHub)
 
-Environment variables:
-- SERVICE: Service name to update (optional)
-- TAG: Tag to set (optional, defaults to 'latest')
-- COMMIT_SHA: Git commit SHA (optional, for tracking)
-- REPO: Source repository (optional, for tracking)
-- VERSIONS_FILE: Which file to update ('versions.yaml' or 'versions-unstable.yaml')
+Each setting can be passed as a command-line flag or an environment variable
+(flags take precedence):
+- SERVICE (--service): Service name to update (optional)
+- TAG (--tag): Tag to set (optional, defaults to 'latest')
+- COMMIT_SHA (--commit-sha): Git commit SHA (optional, for tracking)
+- REPO (--repo): Source repository (optional, for tracking)
+- VERSIONS_FILE (--versions-file): Which file to update ('versions.yaml' or 'versions-unstable.yaml')
+- SYNC_WORKERS (--jobs): Maximum number of concurrent DockerHub/GitHub lookups (default: 20)
+
+Other environment variables:
+- GITHUB_TOKEN: GitHub token for higher API rate limits (optional)
+- GITHUB_TOKENS: Comma-separated GitHub tokens, rotated round-robin together with GITHUB_TOKEN (optional)
+- HTTP_CACHE: JSON file persisting DockerHub/GitHub responses and ETags across runs (optional)
+- WAIT_ON_RATELIMIT: Set to '1' to wait for the GitHub rate limit to reset instead of skipping lookups
 """
 
+import argparse
+import copy
+import functools
+import json
 import os
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import Any
+from urllib.parse import urlencode
 
 import requests
 import yaml
+from common import TokenPool, atomic_write, send_with_backoff
+from requests.adapters import HTTPAdapter
+
+# Prefer the libyaml-backed loader/dumper; fall back to pure Python if PyYAML
+# was built without libyaml
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+# Maximum number of concurrent DockerHub/GitHub lookups when syncing all services.
+# The default covers every service in the versions files, so a full sync puts
+# all lookups in flight at once instead of in waves.
+SYNC_WORKERS = int(os.environ.get("SYNC_WORKERS", "20"))
+
+# GitHub repository URL -> 'owner/name' (optional trailing '.git' or '/')
+_GITHUB_REPO_RE = re.compile(r"^https?://(?:www\.)?github\.com/([^/]+/[^/?#]+?)(?:\.git)?/?$")
+
+# Comment header written at the top of each versions file
+VERSIONS_HEADER = (
+    "# LinTO Platform - Software Versions\n"
+    "# Type: {platform_type}\n"
+    "#\n"
+    "# Available version files in versions/ directory:\n"
+    "#   - rc.yaml             : Release Candidate (versioned tags + digest + commit)\n"
+    "#   - latest.yaml          : Latest stable (latest tags + digest)\n"
+    "#   - latest-unstable.yaml : Development (latest-unstable tags + digest)\n"
+    "#   - platform.YYYY.MM.yaml: Stable releases\n"
+    "#\n"
+    "# DO NOT EDIT MANUALLY - This file is auto-generated\n"
+    "# Last updated: {updated}\n\n"
+)
+
+# Block-style YAML in file order, wide enough that digests and URLs never wrap
+YAML_DUMP_OPTIONS = {
+    "Dumper": SafeDumper,
+    "default_flow_style": False,
+    "sort_keys": False,
+    "allow_unicode": True,
+    "width": 120,
+}
+
+# Tag info resolved so far in this run, keyed by (image, tag); shared between
+# versions files so each DockerHub tag is fetched at most once
+_TAG_INFO_CACHE: dict[tuple[str, str], dict] = {}
+_TAG_INFO_LOCK = threading.Lock()
+
+# Shared session so DockerHub/GitHub calls reuse keep-alive connections across
+# services and worker threads
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+TOKEN_POOL = TokenPool.from_env()
+
+
+def request_with_backoff(method: str, url: str, **kwargs) -> requests.Response:
+    """Send a request through SESSION with retries, rotating pooled GitHub tokens.
+
+    The final response is returned so callers keep their status handling.
+    """
+    return send_with_backoff(SESSION, method, url, token_pool=TOKEN_POOL, **kwargs)
+
+
+class ResponseCache:
+    """Thread-safe store of DockerHub/GitHub response validators and bodies, keyed by URL.
+
+    Entries hold the ETag/Last-Modified and Cache-Control expiry of a 200
+    response plus its decoded body, so repeat lookups are served locally while
+    fresh and sent as conditional requests afterwards. When a path is given,
+    entries are loaded from and saved to that JSON file.
+    """
+
+    def __init__(self, path: str = ""):
+        self.path = Path(path) if path else None
+        self._entries: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+        if self.path and self.path.exists():
+            try:
+                self._entries = json.loads(self.path.read_text())
+            except (OSError, ValueError) as e:
+                print(f"Warning: Ignoring unreadable HTTP cache {self.path}: {e}", file=sys.stderr)
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: str, entry: dict) -> None:
+        with self._lock:
+            self._entries[key] = entry
+
+    def save(self) -> None:
+        """Write entries back to the cache file, if one is configured."""
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, atomic_write(self.path) as f:
+            json.dump(self._entries, f)
+
+
+RESPONSE_CACHE = ResponseCache(os.environ.get("HTTP_CACHE", "").strip())
+
+
+class GitHubBudget:
+    """Thread-safe GitHub rate-limit budget, tracked from X-RateLimit-* response headers.
+
+    Lets lookups stop before sending requests that would only come back 403
+    once the quota is spent.
+    """
+
+    def __init__(self):
+        self.remaining: int | None = None
+        self.reset = 0.0
+        self._lock = threading.Lock()
+
+    def update(self, headers) -> None:
+        remaining = headers.get("X-RateLimit-Remaining", "")
+        reset = headers.get("X-RateLimit-Reset", "")
+        if remaining.isdigit() and reset.isdigit():
+            with self._lock:
+                self.remaining = int(remaining)
+                self.reset = float(reset)
+
+    def wait_time(self) -> float:
+        """Seconds until the budget resets if it is exhausted, else 0."""
+        with self._lock:
+            if self.remaining is None or self.remaining > 0:
+                return 0.0
+            return max(self.reset - time.time(), 0.0)
+
+
+GITHUB_BUDGET = GitHubBudget()
+WAIT_ON_RATELIMIT = os.environ.get("WAIT_ON_RATELIMIT", "").strip() == "1"
 
 
 def _get_github_headers() -> dict:
-    """Get headers for GitHub API requests."""
+    """Get GitHub API headers with the next token from the pool (if any)."""
     headers = {"Accept": "application/vnd.github.v3+json"}
-    github_token = os.environ.get("GITHUB_TOKEN")
+    github_token = TOKEN_POOL.get_next_token()
     if github_token:
         headers["Authorization"] = f"token {github_token}"
     return headers
@@ -35,14 +188,104 @@ def _get_github_headers() -> dict:
 
 def _parse_github_repo(repo_url: str) -> str | None:
     """Parse GitHub repo path from URL."""
-    if not repo_url or "github.com" not in repo_url:
+    match = _GITHUB_REPO_RE.match(repo_url) if repo_url else None
+    return match.group(1) if match else None
+
+
+def _max_age(cache_control: str) -> int | None:
+    """Parse a Cache-Control header into a freshness lifetime in seconds.
+
+    Returns:
+        None if the response must not be stored, else max-age (0 when absent
+        or when the response must be revalidated on every use)
+    """
+    directives = {}
+    for part in cache_control.lower().split(","):
+        name, _, value = part.strip().partition("=")
+        directives[name] = value
+    if "no-store" in directives:
         return None
+    if "no-cache" in directives:
+        return 0
+    max_age = directives.get("max-age", "")
+    return int(max_age) if max_age.isdigit() else 0
+
+
+def _cached_get(url: str, params: dict | None = None, timeout: int = 30, **kwargs) -> tuple[int, Any]:
+    """GET a JSON URL through RESPONSE_CACHE, honoring Cache-Control and validators.
+
+    Responses still fresh per their max-age are returned without a request;
+    stale ones are revalidated with If-None-Match/If-Modified-Since, and a 304
+    reuses the cached body.
+
+    Args:
+        url: Request URL
+        params: Query parameters (part of the cache key)
+        timeout: Request timeout in seconds
+        **kwargs: Passed through to request_with_backoff (e.g., headers, hooks)
 
-    parsed = urlparse(repo_url)
-    path = parsed.path.strip("/")
-    if path.endswith(".git"):
-        path = path[:-4]
-    return path
+    Returns:
+        Tuple of (status_code, decoded JSON body or None)
+
+    Raises:
+        requests.RequestException: On network errors
+    """
+    key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+    headers = dict(kwargs.pop("headers", None) or {})
+
+    cached = RESPONSE_CACHE.get(key)
+    if cached:
+        if cached.get("expires", 0) > time.time():
+            return 200, cached["body"]
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = request_with_backoff("GET", url, headers=headers, params=params, timeout=timeout, **kwargs)
+    max_age = _max_age(response.headers.get("Cache-Control", ""))
+    if response.status_code == 304 and cached:
+        if max_age:
+            RESPONSE_CACHE.put(key, {**cached, "expires": time.time() + max_age})
+        return 200, cached["body"]
+    if response.status_code != 200:
+        return response.status_code, None
+
+    data = response.json()
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if max_age is not None and (etag or last_modified or max_age):
+        RESPONSE_CACHE.put(
+            key,
+            {"etag": etag, "last_modified": last_modified, "expires": time.time() + max_age, "body": data},
+        )
+    return 200, data
+
+
+def _github_get(url: str, params: dict | None = None) -> tuple[int, Any]:
+    """GET a GitHub API URL through the response cache.
+
+    A 304 Not Modified is not counted against the GitHub rate limit. Once the
+    budget is exhausted, returns 403 without a request, or sleeps until the
+    reset when WAIT_ON_RATELIMIT is set.
+
+    Returns:
+        Tuple of (status_code, decoded JSON body or None)
+    """
+    wait = GITHUB_BUDGET.wait_time()
+    if wait:
+        if not WAIT_ON_RATELIMIT:
+            return 403, None
+        print(f"  GitHub rate limit exhausted, waiting {wait:.0f}s for reset...", file=sys.stderr)
+        time.sleep(wait + 1)
+
+    return _cached_get(
+        url,
+        params,
+        timeout=10,
+        headers=_get_github_headers(),
+        hooks={"response": lambda response, *args, **kwargs: GITHUB_BUDGET.update(response.headers)},
+    )
 
 
 def get_github_commit_for_tag(repo_url: str, tag: str) -> tuple[str | None, str | None]:
@@ -52,29 +295,26 @@ def get_github_commit_for_tag(repo_url: str, tag: str) -> tuple[str | None, str
         return None, "no-repo"
 
     tags_to_try = [tag, f"v{tag}"] if not tag.startswith("v") else [tag, tag[1:]]
-    headers = _get_github_headers()
 
     for try_tag in tags_to_try:
         url = f"https://api.github.com/repos/{path}/git/ref/tags/{try_tag}"
         try:
-            response = requests.get(url, headers=headers, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
+            status, data = _github_get(url)
+            if status == 200:
                 obj = data.get("object", {})
                 if obj.get("type") == "commit":
                     return obj.get("sha"), None
                 elif obj.get("type") == "tag":
                     tag_url = obj.get("url")
                     if tag_url:
-                        tag_response = requests.get(tag_url, headers=headers, timeout=10)
-                        if tag_response.status_code == 200:
-                            tag_data = tag_response.json()
+                        tag_status, tag_data = _github_get(tag_url)
+                        if tag_status == 200:
                             return tag_data.get("object", {}).get("sha"), None
-                        elif tag_response.status_code == 403:
+                        elif tag_status == 403:
                             return None, "rate-limited"
-            elif response.status_code == 403:
+            elif status == 403:
                 return None, "rate-limited"
-            elif response.status_code == 404:
+            elif status == 404:
                 continue
         except requests.RequestException:
             return None, "error"
@@ -82,24 +322,23 @@ def get_github_commit_for_tag(repo_url: str, tag: str) -> tuple[str | None, str
     return None, "no-tag"
 
 
+@functools.lru_cache(maxsize=None)
 def get_github_commit_by_date(repo_url: str, until_date: str) -> tuple[str | None, str | None]:
-    """Get the most recent commit SHA before a given date."""
+    """Get the most recent commit SHA before a given date (cached for the run)."""
     path = _parse_github_repo(repo_url)
     if not path:
         return None, "no-repo"
 
-    headers = _get_github_headers()
     url = f"https://api.github.com/repos/{path}/commits"
     params = {"until": until_date, "per_page": 1}
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
-        if response.status_code == 200:
-            commits = response.json()
+        status, commits = _github_get(url, params)
+        if status == 200:
             if commits and len(commits) > 0:
                 return commits[0].get("sha"), None
             return None, "no-commits"
-        elif response.status_code == 403:
+        elif status == 403:
             return None, "rate-limited"
     except requests.RequestException:
         return None, "error"
@@ -110,6 +349,9 @@ def get_github_commit_by_date(repo_url: str, until_date: str) -> tuple[str | Non
 def get_dockerhub_tag_info(image: str, tag: str) -> dict | None:
     """Get tag info including digest from DockerHub.
 
+    Tags already seen in this run (directly or through a tags listing) are
+    answered from _TAG_INFO_CACHE without a request.
+
     Args:
         image: Full image name (e.g., 'lintoai/studio-api')
         tag: Tag name (e.g., 'latest')
@@ -117,26 +359,91 @@ def get_dockerhub_tag_info(image: str, tag: str) -> dict | None:
     Returns:
         Dict with tag info or None if not found
     """
+    with _TAG_INFO_LOCK:
+        if (image, tag) in _TAG_INFO_CACHE:
+            return _TAG_INFO_CACHE[image, tag]
+
     namespace, name = image.split("/") if "/" in image else ("library", image)
     url = f"https://hub.docker.com/v2/repositories/{namespace}/{name}/tags/{tag}"
 
     try:
-        response = requests.get(url, timeout=30)
-        if response.status_code == 200:
-            data = response.json()
+        status, data = _cached_get(url)
+        if status == 200:
             images = data.get("images", [])
             digest = images[0].get("digest") if images else None
-            return {
+            tag_info = {
                 "tag": tag,
                 "digest": digest,
                 "last_pushed": data.get("tag_last_pushed"),
             }
+            with _TAG_INFO_LOCK:
+                _TAG_INFO_CACHE[image, tag] = tag_info
+            return tag_info
     except requests.RequestException as e:
         print(f"  Warning: Could not fetch tag info for {image}:{tag}: {e}", file=sys.stderr)
 
     return None
 
 
+@functools.lru_cache(maxsize=None)
+def get_dockerhub_recent_tags(image: str) -> dict[str, dict]:
+    """Get tag info for the 100 most recently updated tags of an image.
+
+    One listing request covers several tags of the same image instead of one
+    request per tag; older tags are looked up individually by the caller.
+    Cached for the lifetime of the run.
+
+    Args:
+        image: Full image name (e.g., 'postgres')
+
+    Returns:
+        Dict mapping tag name to tag info (same shape as get_dockerhub_tag_info)
+    """
+    namespace, name = image.split("/") if "/" in image else ("library", image)
+    url = f"https://hub.docker.com/v2/repositories/{namespace}/{name}/tags?page_size=100&ordering=last_updated"
+
+    try:
+        status, data = _cached_get(url)
+    except requests.RequestException as e:
+        print(f"  Warning: Could not fetch tags for {image}: {e}", file=sys.stderr)
+        return {}
+    if status != 200:
+        print(f"  Warning: Could not fetch tags for {image}: HTTP {status}", file=sys.stderr)
+        return {}
+
+    tags: dict[str, dict] = {}
+    for tag in data.get("results", []):
+        images = tag.get("images", [])
+        tags[tag["name"]] = {
+            "tag": tag["name"],
+            "digest": images[0].get("digest") if images else None,
+            "last_pushed": tag.get("tag_last_pushed"),
+        }
+
+    with _TAG_INFO_LOCK:
+        _TAG_INFO_CACHE.update({(image, name): tag_info for name, tag_info in tags.items()})
+    return tags
+
+
+def get_dockerhub_tags_info(image: str, tags: list[str]) -> dict[str, dict | None]:
+    """Get tag info for several tags of one image.
+
+    Tags already resolved in this run are reused. A single remaining tag uses
+    the per-tag endpoint (cheaper than listing images with long tag
+    histories); several share the first page of the tags listing (the 100 most
+    recently updated), with a per-tag fallback for tags not on it.
+
+    Returns:
+        Dict mapping each requested tag to its info, or None if not found
+    """
+    with _TAG_INFO_LOCK:
+        known = {tag: _TAG_INFO_CACHE[image, tag] for tag in tags if (image, tag) in _TAG_INFO_CACHE}
+
+    if len(tags) - len(known) > 1:
+        known = {**get_dockerhub_recent_tags(image), **known}
+    return {tag: known.get(tag) or get_dockerhub_tag_info(image, tag) for tag in tags}
+
+
 def get_dockerhub_latest_tag(image: str) -> str | None:
     """Get the latest tag from DockerHub for an image.
 
@@ -150,7 +457,7 @@ def get_dockerhub_latest_tag(image: str) -> str | None:
     url = f"https://hub.docker.com/v2/repositories/{namespace}/{name}/tags"
 
     try:
-        response = requests.get(url, params={"page_size": 100}, timeout=30)
+        response = request_with_backoff("GET", url, params={"page_size": 100}, timeout=30)
         response.raise_for_status()
         data = response.json()
 
@@ -168,7 +475,25 @@ def get_dockerhub_latest_tag(image: str) -> str | None:
         return None
 
 
-def update_service_version(versions: dict, service: str, tag: str, digest: str | None = None, commit: str | None = None) -> bool:
+def _build_service_index(versions: dict) -> dict[str, str]:
+    """Map each service name to the section ('linto', 'databases', 'llm') holding it.
+
+    Earlier sections win if a name appears in several, matching the scan order.
+    """
+    index: dict[str, str] = {}
+    for section in ("llm", "databases", "linto"):
+        index.update(dict.fromkeys(versions.get(section) or {}, section))
+    return index
+
+
+def update_service_version(
+    versions: dict,
+    service: str,
+    tag: str,
+    digest: str | None = None,
+    commit: str | None = None,
+    index: dict[str, str] | None = None,
+) -> bool:
     """Update a specific service version in the versions dict.
 
     Args:
@@ -177,126 +502,190 @@ def update_service_version(versions: dict, service: str, tag: str, digest: str |
         tag: New tag to set
         digest: Docker image digest (optional)
         commit: Git commit SHA (optional)
+        index: Pre-built service index from _build_service_index (optional)
 
     Returns:
         True if updated, False if service not found
     """
-    # Find service in any section
-    for section in ["linto", "databases", "llm"]:
-        if service in versions.get(section, {}):
-            config = versions[section][service]
-            old_tag = config.get("tag")
-            config["tag"] = tag
+    section = (index if index is not None else _build_service_index(versions)).get(service)
+    if section is None:
+        print(f"Warning: Service '{service}' not found in versions.yaml", file=sys.stderr)
+        return False
+
+    config = versions[section][service]
+    old_tag = config.get("tag")
+    config["tag"] = tag
+
+    if digest:
+        config["digest"] = digest
+    if commit:
+        config["commit"] = commit
+
+    digest_str = f", digest: {digest[:19]}..." if digest else ""
+    print(f"Updated {service}: {old_tag} -> {tag}{digest_str}")
+    return True
+
+
+def _is_unchanged(config: dict, tag: str, tag_info: dict, needs_commit: bool = False) -> bool:
+    """Check if DockerHub reports the same tag and digest already recorded in config.
+
+    With needs_commit, the recorded commit must also be resolved (not missing
+    or a '<rate-limited>' placeholder) for the entry to count as unchanged.
+    """
+    if not tag_info.get("digest") or config.get("tag") != tag or config.get("digest") != tag_info["digest"]:
+        return False
+    if needs_commit:
+        commit = config.get("commit")
+        return bool(commit) and not commit.startswith("<")
+    return True
 
-            if digest:
-                config["digest"] = digest
-            if commit:
-                config["commit"] = commit
 
-            digest_str = f", digest: {digest[:19]}..." if digest else ""
-            print(f"Updated {service}: {old_tag} -> {tag}{digest_str}")
-            return True
+def _fetch_linto_service(
+    image: str, target_tag: str, repo_url: str, current: dict | None = None
+) -> tuple[dict | None, str | None, str | None]:
+    """Fetch DockerHub tag info and the matching GitHub commit for a LinTO service.
+
+    The GitHub lookup is skipped when the digest matches the one already
+    recorded in current (the service's existing config).
+
+    Returns:
+        Tuple of (tag_info, commit_sha, commit_error); commit_error is
+        'unchanged' when the recorded entry is still up to date
+    """
+    tag_info = get_dockerhub_tag_info(image, target_tag)
+    if tag_info and current and _is_unchanged(current, target_tag, tag_info, needs_commit=bool(repo_url)):
+        return tag_info, None, "unchanged"
+    if not tag_info or not repo_url or not tag_info.get("last_pushed"):
+        return tag_info, None, None
 
-    print(f"Warning: Service '{service}' not found in versions.yaml", file=sys.stderr)
-    return False
+    # Try by date (most reliable for 'latest' tag)
+    commit_sha, err = get_github_commit_by_date(repo_url, tag_info["last_pushed"])
+    return tag_info, commit_sha, err
 
 
-def sync_all_from_dockerhub(versions: dict, target_tag: str = "latest") -> int:
+def sync_all_from_dockerhub(versions: dict, target_tag: str = "latest", max_workers: int = SYNC_WORKERS) -> int:
     """Sync all service versions from DockerHub including databases and LLM.
 
+    Lookups for all sections run concurrently; results are applied to the
+    versions dict afterwards, in file order, on the calling thread.
+
     Args:
         versions: The versions dictionary
         target_tag: Tag to fetch for linto services (e.g., 'latest' or 'latest-unstable')
+        max_workers: Maximum number of concurrent DockerHub/GitHub lookups
 
     Returns:
         Number of services updated
     """
+    sections = {
+        section: [(service, config) for service, config in versions.get(section, {}).items() if config.get("image")]
+        for section in ("linto", "databases", "llm")
+    }
+
+    # Databases and LLM services use their own tags, just fetch digests: group
+    # the wanted tags by image so each image is looked up once
+    image_tags: dict[str, list[str]] = {}
+    for section in ("databases", "llm"):
+        for _, config in sections[section]:
+            tags = image_tags.setdefault(config["image"], [])
+            if config.get("tag", "latest") not in tags:
+                tags.append(config.get("tag", "latest"))
+
+    # No more threads than lookups to run
+    job_count = len(sections["linto"]) + len(image_tags)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, job_count))) as executor:
+        linto_futures = [
+            executor.submit(_fetch_linto_service, config["image"], target_tag, config.get("repo", ""), config)
+            for _, config in sections["linto"]
+        ]
+        image_futures = {
+            image: executor.submit(get_dockerhub_tags_info, image, tags) for image, tags in image_tags.items()
+        }
+        results = {"linto": [future.result() for future in linto_futures]}
+        tag_infos = {image: future.result() for image, future in image_futures.items()}
+
+    for section in ("databases", "llm"):
+        results[section] = [tag_infos[config["image"]][config.get("tag", "latest")] for _, config in sections[section]]
+
     updated = 0
 
     # Sync LinTO services
     print("  LinTO services:")
-    for service, config in versions.get("linto", {}).items():
-        image = config.get("image")
-        if not image:
-            continue
-
-        print(f"    {service}...", end=" ")
-
-        # Get tag info including digest
-        tag_info = get_dockerhub_tag_info(image, target_tag)
-
-        if tag_info:
+    for (service, config), (tag_info, commit_sha, err) in zip(sections["linto"], results["linto"]):
+        if err == "unchanged":
+            result = f"{target_tag} (unchanged)"
+        elif tag_info:
             config["tag"] = tag_info["tag"]
             if tag_info.get("digest"):
                 config["digest"] = tag_info["digest"]
 
-            # Try to get commit from GitHub
-            repo_url = config.get("repo", "")
-            commit_sha = None
-            commit_source = None
-
-            if repo_url and tag_info.get("last_pushed"):
-                # Try by date first (most reliable for 'latest' tag)
-                commit_sha, err = get_github_commit_by_date(repo_url, tag_info["last_pushed"])
-                if commit_sha:
-                    commit_source = "date"
-                elif err == "rate-limited":
-                    config["commit"] = "<rate-limited>"
-
             if commit_sha:
                 config["commit"] = commit_sha
+            elif err == "rate-limited":
+                config["commit"] = "<rate-limited>"
 
             digest_str = tag_info["digest"][:19] + "..." if tag_info.get("digest") else "-"
             commit_str = commit_sha[:7] if commit_sha else ("-" if "commit" not in config else config["commit"])
-            print(f"{target_tag} (digest: {digest_str}, commit: {commit_str})")
+            result = f"{target_tag} (digest: {digest_str}, commit: {commit_str})"
             updated += 1
         else:
-            print(f"not found, keeping {config.get('tag', 'latest')}")
-
-    # Sync databases (use their own tags, just fetch digest)
-    print("  Databases:")
-    for service, config in versions.get("databases", {}).items():
-        image = config.get("image")
-        tag = config.get("tag", "latest")
-        if not image:
-            continue
+            result = f"not found, keeping {config.get('tag', 'latest')}"
+        print(f"    {service}... {result}")
 
-        print(f"    {service}...", end=" ")
+    for section, label in (("databases", "Databases"), ("llm", "LLM services")):
+        print(f"  {label}:")
+        for (service, config), tag_info in zip(sections[section], results[section]):
+            tag = config.get("tag", "latest")
 
-        tag_info = get_dockerhub_tag_info(image, tag)
+            if tag_info and _is_unchanged(config, tag, tag_info):
+                result = f"{tag} (unchanged)"
+            elif tag_info and tag_info.get("digest"):
+                config["digest"] = tag_info["digest"]
+                result = f"{tag} (digest: {tag_info['digest'][:19]}...)"
+                updated += 1
+            else:
+                result = f"{tag} (digest: not found)"
+            print(f"    {service}... {result}")
 
-        if tag_info and tag_info.get("digest"):
-            config["digest"] = tag_info["digest"]
-            digest_str = tag_info["digest"][:19] + "..."
-            print(f"{tag} (digest: {digest_str})")
-            updated += 1
-        else:
-            print(f"{tag} (digest: not found)")
-
-    # Sync LLM services (use their own tags, just fetch digest)
-    print("  LLM services:")
-    for service, config in versions.get("llm", {}).items():
-        image = config.get("image")
-        tag = config.get("tag", "latest")
-        if not image:
-            continue
+    return updated
 
-        print(f"    {service}...", end=" ")
 
-        tag_info = get_dockerhub_tag_info(image, tag)
+def prefetch_dockerhub_tags(targets: list[tuple[Path, str]], max_workers: int = SYNC_WORKERS) -> None:
+    """Resolve every DockerHub tag a full sync of the given files will need, once.
 
-        if tag_info and tag_info.get("digest"):
-            config["digest"] = tag_info["digest"]
-            digest_str = tag_info["digest"][:19] + "..."
-            print(f"{tag} (digest: {digest_str})")
-            updated += 1
-        else:
-            print(f"{tag} (digest: not found)")
+    LinTO images appear in every file under a different target tag ('latest',
+    'latest-unstable'), so their tags are looked up together through one tags
+    listing; database and LLM tags are shared outright. Results land in the
+    tag info cache used by the per-file syncs.
 
-    return updated
+    Args:
+        targets: (versions file, target tag) pairs about to be synced
+        max_workers: Maximum number of concurrent DockerHub lookups
+    """
+    image_tags: dict[str, list[str]] = {}
+    for versions_file, target_tag in targets:
+        if not versions_file.exists():
+            continue
+        with open(versions_file) as f:
+            versions = yaml.load(f, Loader=SafeLoader) or {}
+        for section in ("linto", "databases", "llm"):
+            for config in (versions.get(section) or {}).values():
+                if not config.get("image"):
+                    continue
+                tag = target_tag if section == "linto" else config.get("tag", "latest")
+                tags = image_tags.setdefault(config["image"], [])
+                if tag not in tags:
+                    tags.append(tag)
+
+    if not image_tags:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(image_tags)))) as executor:
+        list(executor.map(get_dockerhub_tags_info, image_tags, image_tags.values()))
 
 
-def update_versions_file(versions_file: Path, service: str, tag: str, commit_sha: str, repo: str) -> None:
+def update_versions_file(
+    versions_file: Path, service: str, tag: str, commit_sha: str, repo: str, jobs: int = SYNC_WORKERS
+) -> None:
     """Update a single versions file.
 
     Args:
@@ -305,6 +694,7 @@ def update_versions_file(versions_file: Path, service: str, tag: str, commit_sha
         tag: Tag to set
         commit_sha: Git commit SHA (for tracking)
         repo: Source repository (for tracking)
+        jobs: Maximum number of concurrent lookups when syncing all
     """
     if not versions_file.exists():
         print(f"Warning: {versions_file} not found, skipping", file=sys.stderr)
@@ -314,62 +704,72 @@ def update_versions_file(versions_file: Path, service: str, tag: str, commit_sha
 
     # Load versions
     with open(versions_file) as f:
-        versions = yaml.safe_load(f)
+        versions = yaml.load(f, Loader=SafeLoader)
+    original = copy.deepcopy(versions)
 
     # Update based on inputs
     if service:
         # Update specific service - fetch digest for the tag
-        for section in ["linto", "databases", "llm"]:
-            if service in versions.get(section, {}):
-                image = versions[section][service].get("image")
-                if image:
-                    tag_info = get_dockerhub_tag_info(image, tag)
-                    digest = tag_info.get("digest") if tag_info else None
-                    update_service_version(versions, service, tag, digest, commit_sha)
-                break
-        else:
-            update_service_version(versions, service, tag, None, commit_sha)
+        index = _build_service_index(versions)
+        section = index.get(service)
+        image = versions[section][service].get("image") if section else None
+        if image:
+            tag_info = get_dockerhub_tag_info(image, tag)
+            digest = tag_info.get("digest") if tag_info else None
+            update_service_version(versions, service, tag, digest, commit_sha, index)
+        elif not section:
+            update_service_version(versions, service, tag, None, commit_sha, index)
     else:
         # Sync all from DockerHub
-        updated = sync_all_from_dockerhub(versions, tag)
+        updated = sync_all_from_dockerhub(versions, tag, max_workers=jobs)
         print(f"Updated {updated} services in {versions_file.name}")
 
-    # Update metadata
-    versions["_updated"] = datetime.now(timezone.utc).isoformat()
+    # Leave the file (and its timestamp) alone when nothing moved
+    if versions == original:
+        print(f"No changes in {versions_file.name}")
+        return
+
+    updated_at = datetime.now(timezone.utc).isoformat()
 
     # Determine header based on file
     is_unstable = "unstable" in versions_file.name
     platform_type = "Development (latest-unstable)" if is_unstable else "Release Candidate (latest)"
 
-    # Write back
-    with open(versions_file, "w") as f:
-        f.write("# LinTO Platform - Software Versions\n")
-        f.write(f"# Type: {platform_type}\n")
-        f.write("#\n")
-        f.write("# Available version files in versions/ directory:\n")
-        f.write("#   - rc.yaml             : Release Candidate (versioned tags + digest + commit)\n")
-        f.write("#   - latest.yaml          : Latest stable (latest tags + digest)\n")
-        f.write("#   - latest-unstable.yaml : Development (latest-unstable tags + digest)\n")
-        f.write("#   - platform.YYYY.MM.yaml: Stable releases\n")
-        f.write("#\n")
-        f.write("# DO NOT EDIT MANUALLY - This file is auto-generated\n")
-        f.write(f"# Last updated: {versions['_updated']}\n\n")
-
-        # Remove internal metadata before dumping
-        versions_to_write = {k: v for k, v in versions.items() if not k.startswith("_")}
-        yaml.dump(versions_to_write, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    # Write back through one 64KB buffer (header and YAML body go out in a
+    # single write for typical file sizes), replacing the file atomically
+    with atomic_write(versions_file, buffering=1 << 16) as f:
+        f.write(VERSIONS_HEADER.format(platform_type=platform_type, updated=updated_at))
+
+        # Skip internal metadata keys (if any) without copying the common case
+        internal = [k for k in versions if k.startswith("_")]
+        versions_to_write = {k: v for k, v in versions.items() if k not in internal} if internal else versions
+        yaml.dump(versions_to_write, f, **YAML_DUMP_OPTIONS)
 
     print(f"Saved {versions_file}")
 
 
 def main():
     """Main entry point."""
-    # Load environment variables
-    service = os.environ.get("SERVICE", "").strip()
-    tag = os.environ.get("TAG", "").strip() or "latest"
-    commit_sha = os.environ.get("COMMIT_SHA", "").strip()
-    repo = os.environ.get("REPO", "").strip()
-    versions_file_env = os.environ.get("VERSIONS_FILE", "").strip()
+    # Flags default to the environment variables set by the workflow
+    parser = argparse.ArgumentParser(description="Update versions files from DockerHub or GitHub events")
+    parser.add_argument("--service", default=os.environ.get("SERVICE", ""), help="Service to update (default: all)")
+    parser.add_argument("--tag", default=os.environ.get("TAG", ""), help="Tag to set (default: latest)")
+    parser.add_argument("--commit-sha", default=os.environ.get("COMMIT_SHA", ""), help="Git commit SHA")
+    parser.add_argument("--repo", default=os.environ.get("REPO", ""), help="Source repository")
+    parser.add_argument(
+        "--versions-file", default=os.environ.get("VERSIONS_FILE", ""), help="Single file to update (default: both)"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=SYNC_WORKERS, help=f"Concurrent DockerHub/GitHub lookups (default: {SYNC_WORKERS})"
+    )
+    args = parser.parse_args()
+
+    service = args.service.strip()
+    tag = args.tag.strip() or "latest"
+    commit_sha = args.commit_sha.strip()
+    repo = args.repo.strip()
+    versions_file_env = args.versions_file.strip()
+    jobs = max(1, args.jobs)
 
     script_dir = Path(__file__).parent
     base_dir = script_dir.parent
@@ -393,14 +793,21 @@ def main():
     if repo:
         print(f"Repo: {repo}")
 
+    # Adjust tag for unstable file
+    targets = [
+        (versions_file, "latest-unstable" if "unstable" in versions_file.name and tag == "latest" else tag)
+        for versions_file in versions_files
+    ]
+
+    # Full syncs of several files share their DockerHub lookups
+    if not service and len(targets) > 1:
+        prefetch_dockerhub_tags(targets, max_workers=jobs)
+
     # Update each file
-    for versions_file in versions_files:
-        # Adjust tag for unstable file
-        file_tag = tag
-        if "unstable" in versions_file.name and tag == "latest":
-            file_tag = "latest-unstable"
+    for versions_file, file_tag in targets:
+        update_versions_file(versions_file, service, file_tag, commit_sha, repo, jobs)
 
-        update_versions_file(versions_file, service, file_tag, commit_sha, repo)
+    RESPONSE_CACHE.save()
 
     print("\nDone!")
 
@@ -1,8 +1,30 @@
 """Shared utilities for backend renderers."""
 
+import copy
+import functools
+from collections.abc import Callable
 from typing import Any
 
-from linto.model.service import ServiceDefinition
+from linto.model.service import HealthcheckConfig, ServiceDefinition, VolumeMount
+
+# Traefik label templates, formatted with the router context built in _traefik_labels
+_BASE_LABEL_TPLS = (
+    "traefik.enable=true",
+    "traefik.http.routers.{router}.entrypoints={entrypoint}",
+    "traefik.http.services.{router}.loadbalancer.server.port={port}",
+)
+# Catch-all route gets a lower priority than prefixed routes
+_ROOT_ROUTE_TPLS = (
+    "traefik.http.routers.{router}.rule=Host(`{domain}`)",
+    "traefik.http.routers.{router}.priority=1",
+)
+_PREFIX_ROUTE_TPLS = ("traefik.http.routers.{router}.rule=Host(`{domain}`) && PathPrefix(`{endpoint}`)",)
+_TLS_TPLS = ("traefik.http.routers.{router}.tls=true",)
+_ACME_TPLS = ("traefik.http.routers.{router}.tls.certresolver=leresolver",)
+_STRIP_PREFIX_TPLS = (
+    "traefik.http.middlewares.{router}_strip.stripPrefix.prefixes={endpoint}",
+    "traefik.http.routers.{router}.middlewares={router}_strip",
+)
 
 
 def generate_traefik_labels(
@@ -26,41 +48,91 @@ def generate_traefik_labels(
         server_port: Backend server port
 
     Returns:
-        List of Traefik label strings
+        List of Traefik label strings (a fresh list the caller may extend)
     """
-    router_name = service_name.replace("-", "_")
-    entrypoint = "websecure" if tls_enabled else "web"
-
-    labels = [
-        "traefik.enable=true",
-        f"traefik.http.routers.{router_name}.entrypoints={entrypoint}",
-        f"traefik.http.services.{router_name}.loadbalancer.server.port={server_port}",
-    ]
-
-    # Route rule
-    if endpoint == "/":
-        labels.append(f"traefik.http.routers.{router_name}.rule=Host(`{domain}`)")
-        # Lower priority for catch-all route
-        labels.append(f"traefik.http.routers.{router_name}.priority=1")
-    else:
-        labels.append(f"traefik.http.routers.{router_name}.rule=Host(`{domain}`) && PathPrefix(`{endpoint}`)")
+    return list(_traefik_labels(service_name, endpoint, domain, strip_prefix, tls_enabled, tls_mode, server_port))
+
+
+@functools.lru_cache(maxsize=512)
+def _traefik_labels(
+    service_name: str,
+    endpoint: str,
+    domain: str,
+    strip_prefix: bool,
+    tls_enabled: bool,
+    tls_mode: str,
+    server_port: int,
+) -> tuple[str, ...]:
+    """Build Traefik labels, memoized on the routing arguments.
 
+    Returns an immutable tuple so cached results cannot be altered by callers.
+    """
+    ctx = {
+        "router": service_name.replace("-", "_"),
+        "entrypoint": "websecure" if tls_enabled else "web",
+        "port": server_port,
+        "domain": domain,
+        "endpoint": endpoint,
+    }
+
+    # Select template groups in label order; the catch-all route never strips
+    templates = _BASE_LABEL_TPLS + (_ROOT_ROUTE_TPLS if endpoint == "/" else _PREFIX_ROUTE_TPLS)
     if tls_enabled:
-        labels.append(f"traefik.http.routers.{router_name}.tls=true")
+        templates += _TLS_TPLS
         # ACME uses cert resolver
         if tls_mode == "acme":
-            labels.append(f"traefik.http.routers.{router_name}.tls.certresolver=leresolver")
-
+            templates += _ACME_TPLS
     if strip_prefix and endpoint != "/":
-        middleware_name = f"{router_name}_strip"
-        labels.extend(
-            [
-                f"traefik.http.middlewares.{middleware_name}.stripPrefix.prefixes={endpoint}",
-                f"traefik.http.routers.{router_name}.middlewares={middleware_name}",
-            ]
-        )
+        templates += _STRIP_PREFIX_TPLS
 
-    return labels
+    return tuple(template.format_map(ctx) for template in templates)
+
+
+def _format_volumes(volumes: list[VolumeMount]) -> list[str]:
+    return [f"{v.source}:{v.target}{':ro' if v.read_only else ''}" for v in volumes]
+
+
+def _format_healthcheck(healthcheck: HealthcheckConfig) -> dict[str, Any]:
+    return {
+        "test": healthcheck.test,
+        "interval": healthcheck.interval,
+        "timeout": healthcheck.timeout,
+        "retries": healthcheck.retries,
+        "start_period": healthcheck.start_period,
+    }
+
+
+# (attribute, converter) pairs copied into Compose service dicts when set, in
+# output order; attributes map to keys of the same name
+_COMPOSE_FIELDS: tuple[tuple[str, Callable[[Any], Any] | None], ...] = (
+    ("depends_on", None),
+    ("networks", None),
+    ("volumes", _format_volumes),
+    ("environment", None),
+    ("ports", None),
+    ("expose", None),
+    ("command", None),
+    ("healthcheck", _format_healthcheck),
+)
+
+# Same fields without depends_on, which Swarm does not honor
+_SWARM_FIELDS = tuple(field for field in _COMPOSE_FIELDS if field[0] != "depends_on")
+
+
+def _copy_service_fields(
+    svc: dict[str, Any],
+    service: ServiceDefinition,
+    fields: tuple[tuple[str, Callable[[Any], Any] | None], ...],
+) -> None:
+    """Copy set service attributes into svc, converting them where needed.
+
+    Unconverted values are shallow-copied: service definitions may be shared
+    through the catalog's factory caches, so rendered dicts must not alias them.
+    """
+    for attr, convert in fields:
+        value = getattr(service, attr)
+        if value:
+            svc[attr] = convert(value) if convert else copy.copy(value)
 
 
 def service_to_compose_dict(
@@ -83,35 +155,7 @@ def service_to_compose_dict(
         "restart": service.restart,
     }
 
-    if service.depends_on:
-        svc["depends_on"] = service.depends_on
-
-    if service.networks:
-        svc["networks"] = service.networks
-
-    if service.volumes:
-        svc["volumes"] = [f"{v.source}:{v.target}{':ro' if v.read_only else ''}" for v in service.volumes]
-
-    if service.environment:
-        svc["environment"] = service.environment
-
-    if service.ports:
-        svc["ports"] = service.ports
-
-    if service.expose:
-        svc["expose"] = service.expose
-
-    if service.command:
-        svc["command"] = service.command
-
-    if service.healthcheck:
-        svc["healthcheck"] = {
-            "test": service.healthcheck.test,
-            "interval": service.healthcheck.interval,
-            "timeout": service.healthcheck.timeout,
-            "retries": service.healthcheck.retries,
-            "start_period": service.healthcheck.start_period,
-        }
+    _copy_service_fields(svc, service, _COMPOSE_FIELDS)
 
     # Add Traefik labels if endpoint is specified
     labels: list[str] = []
@@ -157,80 +201,36 @@ def service_to_swarm_dict(
 
     # Swarm does not use depends_on the same way as Compose
     # Instead, we rely on healthchecks and restart policies
-
-    if service.networks:
-        svc["networks"] = service.networks
-
-    if service.volumes:
-        svc["volumes"] = [f"{v.source}:{v.target}{':ro' if v.read_only else ''}" for v in service.volumes]
-
-    if service.environment:
-        svc["environment"] = service.environment
-
-    # In Swarm, ports are typically exposed via Traefik
-    # Only infrastructure services like traefik expose ports directly
-    if service.ports:
-        svc["ports"] = service.ports
-
-    if service.expose:
-        svc["expose"] = service.expose
-
-    if service.command:
-        svc["command"] = service.command
-
-    if service.healthcheck:
-        svc["healthcheck"] = {
-            "test": service.healthcheck.test,
-            "interval": service.healthcheck.interval,
-            "timeout": service.healthcheck.timeout,
-            "retries": service.healthcheck.retries,
-            "start_period": service.healthcheck.start_period,
-        }
+    # In Swarm, ports are typically exposed via Traefik; only infrastructure
+    # services like traefik expose ports directly
+    _copy_service_fields(svc, service, _SWARM_FIELDS)
 
     # Build deploy section
     deploy: dict[str, Any] = {}
 
     if service.deploy:
-        deploy["mode"] = service.deploy.mode
-        deploy["replicas"] = service.deploy.replicas
+        deploy_config = service.deploy
+        deploy["mode"] = deploy_config.mode
+        deploy["replicas"] = deploy_config.replicas
 
-        if service.deploy.placement_constraints:
+        if deploy_config.placement_constraints:
             deploy["placement"] = {
-                "constraints": service.deploy.placement_constraints,
+                "constraints": deploy_config.placement_constraints,
             }
 
-        if service.deploy.resources:
-            resources: dict[str, Any] = {}
-            if service.deploy.resources.limits:
-                limits = {}
-                if service.deploy.resources.limits.cpus:
-                    limits["cpus"] = service.deploy.resources.limits.cpus
-                if service.deploy.resources.limits.memory:
-                    limits["memory"] = service.deploy.resources.limits.memory
-                if limits:
-                    resources["limits"] = limits
-            if service.deploy.resources.reservations:
-                reservations = {}
-                if service.deploy.resources.reservations.cpus:
-                    reservations["cpus"] = service.deploy.resources.reservations.cpus
-                if service.deploy.resources.reservations.memory:
-                    reservations["memory"] = service.deploy.resources.reservations.memory
-                if reservations:
-                    resources["reservations"] = reservations
+        if deploy_config.resources:
+            lim = deploy_config.resources.limits
+            res = deploy_config.resources.reservations
+            limits = {k: v for k, v in (("cpus", lim.cpus), ("memory", lim.memory)) if v} if lim else {}
+            reservations = {k: v for k, v in (("cpus", res.cpus), ("memory", res.memory)) if v} if res else {}
+            resources = {k: v for k, v in (("limits", limits), ("reservations", reservations)) if v}
             if resources:
                 deploy["resources"] = resources
 
-        if service.deploy.restart_policy:
-            restart_policy: dict[str, Any] = {
-                "condition": service.deploy.restart_policy.condition,
-            }
-            if service.deploy.restart_policy.delay:
-                restart_policy["delay"] = service.deploy.restart_policy.delay
-            if service.deploy.restart_policy.max_attempts:
-                restart_policy["max_attempts"] = service.deploy.restart_policy.max_attempts
-            if service.deploy.restart_policy.window:
-                restart_policy["window"] = service.deploy.restart_policy.window
-            deploy["restart_policy"] = restart_policy
+        policy = deploy_config.restart_policy
+        if policy:
+            optional = (("delay", policy.delay), ("max_attempts", policy.max_attempts), ("window", policy.window))
+            deploy["restart_policy"] = {"condition": policy.condition, **{k: v for k, v in optional if v}}
     else:
         # Default deploy config
         deploy["mode"] = "replicated"
@@ -292,3 +292,30 @@ def generate_traefik_dynamic_config(domain: str) -> dict[str, Any]:
             },
         }
     }
+
+
+# Text of generate_traefik_dynamic_config as dumped by yaml (block style,
+# sorted keys); domains are validated hostnames so no quoting is needed
+_TRAEFIK_DYNAMIC_YAML_TPL = """\
+tls:
+  certificates:
+  - certFile: /certs/{domain}.pem
+    keyFile: /certs/{domain}-key.pem
+  stores:
+    default:
+      defaultCertificate:
+        certFile: /certs/{domain}.pem
+        keyFile: /certs/{domain}-key.pem
+"""
+
+
+def format_traefik_dynamic_config(domain: str) -> str:
+    """Render the Traefik dynamic TLS configuration as YAML text.
+
+    Args:
+        domain: Domain name for certificates
+
+    Returns:
+        YAML document equal to dumping generate_traefik_dynamic_config(domain)
+    """
+    return _TRAEFIK_DYNAMIC_YAML_TPL.format(domain=domain)
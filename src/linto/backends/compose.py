@@ -1,5 +1,10 @@
 """Docker Compose renderer and operations."""
 
+import copy
+import functools
+import os
+import shutil
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -8,7 +13,7 @@ from rich.console import Console
 from rich.table import Table
 
 from linto.backends.base import (
-    generate_traefik_dynamic_config,
+    format_traefik_dynamic_config,
     service_to_compose_dict,
 )
 from linto.catalog.services import (
@@ -41,192 +46,276 @@ from linto.catalog.services import (
     _vllm_service,
     get_streaming_stt_service,
 )
-from linto.model.profile import ProfileConfig, TLSMode
-from linto.model.validation import ValidationError, load_profile, save_profile
+from linto.model.profile import ProfileConfig
+from linto.model.service import ServiceDefinition
+from linto.model.validation import ValidationError, load_profile, save_profile, validate_profile_exists
+from linto.tls.acme import setup_acme_storage
+from linto.tls.custom import import_custom_certs
 from linto.tls.mkcert import generate_certs
 from linto.utils.docker import run_docker_compose
 from linto.utils.secrets import generate_secrets
 
-console = Console()
-
-
-def render_compose(profile: ProfileConfig) -> dict[str, Any]:
-    """Render docker-compose.yml as a dictionary."""
-    # Ensure secrets are populated
-    profile = generate_secrets(profile)
-
-    services: dict[str, Any] = {}
-    networks: dict[str, Any] = {"linto": {"driver": "bridge"}}
-    volumes: dict[str, Any] = {}
+# Prefer the libyaml-backed dumper; fall back to pure Python if PyYAML was
+# built without libyaml
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
 
-    tls_mode = profile.tls_mode.value if isinstance(profile.tls_mode, TLSMode) else profile.tls_mode
 
-    # Always add traefik
-    traefik = _traefik_service(profile.domain, tls_mode)
-    services[traefik.name] = service_to_compose_dict(traefik, profile.domain, tls_mode)
-
-    # Add Studio services
-    if profile.studio_enabled:
-        networks.update(STUDIO_NETWORKS)
-
-        mongodb = _studio_mongodb_service()
-        services[mongodb.name] = service_to_compose_dict(mongodb, profile.domain, tls_mode)
-        volumes["studio_mongodb_data"] = {}
-
-        api = _studio_api_service(
-            domain=profile.domain,
-            image_tag=profile.image_tag,
-            jwt_secret=profile.jwt_secret or "",
-            jwt_refresh_secret=profile.jwt_refresh_secret or "",
-            super_admin_email=profile.super_admin_email,
-            super_admin_password=profile.super_admin_password or "",
-            live_session_enabled=profile.live_session_enabled,
-            llm_enabled=profile.llm_enabled,
-            stt_enabled=profile.stt_enabled,
-        )
-        services[api.name] = service_to_compose_dict(api, profile.domain, tls_mode)
-
-        frontend = _studio_frontend_service(
-            domain=profile.domain,
-            image_tag=profile.image_tag,
-        )
-        services[frontend.name] = service_to_compose_dict(frontend, profile.domain, tls_mode)
+class _ComposeDumper(SafeDumper):
+    """Dumper for rendered compose dicts.
 
-        websocket = _studio_websocket_service(
-            domain=profile.domain,
-            image_tag=profile.image_tag,
-            jwt_secret=profile.jwt_secret or "",
-        )
-        services[websocket.name] = service_to_compose_dict(websocket, profile.domain, tls_mode)
-
-    # Add STT services
-    if profile.stt_enabled:
-        networks.update(STT_NETWORKS)
-
-        # API Gateway for service discovery
-        api_gateway = _api_gateway_service(image_tag=profile.image_tag)
-        services[api_gateway.name] = service_to_compose_dict(api_gateway, profile.domain, tls_mode)
-
-        stt_mongo = _stt_mongo_service()
-        services[stt_mongo.name] = service_to_compose_dict(stt_mongo, profile.domain, tls_mode)
-        volumes["stt_mongodb_data"] = {}
-
-        redis = _task_broker_redis_service(profile.redis_password or "")
-        services[redis.name] = service_to_compose_dict(redis, profile.domain, tls_mode)
-        volumes["task_broker_redis_data"] = {}
-
-        whisper_api = _stt_whisper_service(
-            image_tag=profile.image_tag,
-            redis_password=profile.redis_password or "",
-        )
-        services[whisper_api.name] = service_to_compose_dict(whisper_api, profile.domain, tls_mode)
-
-        whisper_workers = _stt_whisper_workers_service(
-            image_tag=profile.image_tag,
-            redis_password=profile.redis_password or "",
-        )
-        services[whisper_workers.name] = service_to_compose_dict(whisper_workers, profile.domain, tls_mode)
+    Rendered dicts are plain trees, so alias tracking is skipped. Quoting is
+    still decided by the emitter's implicit resolver (e.g. "3.8" stays quoted).
+    """
 
-        diarization = _diarization_pyannote_service(
-            image_tag=profile.image_tag,
-            redis_password=profile.redis_password or "",
-        )
-        services[diarization.name] = service_to_compose_dict(diarization, profile.domain, tls_mode)
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
 
-    # Add Live Session services
-    if profile.live_session_enabled:
-        networks.update(SESSION_NETWORKS)
 
-        session_postgres = _session_postgres_service(profile.session_postgres_password or "")
-        services[session_postgres.name] = service_to_compose_dict(session_postgres, profile.domain, tls_mode)
-        volumes["session_postgres_data"] = {}
+# Map str straight to a scalar node, skipping represent_str's extra call
+_ComposeDumper.add_representer(str, lambda dumper, data: dumper.represent_scalar("tag:yaml.org,2002:str", data))
+# Hand dicts over as an items view: keys are emitted in insertion order
+# without represent_mapping first copying them into a list
+_ComposeDumper.add_representer(
+    dict, lambda dumper, data: dumper.represent_mapping("tag:yaml.org,2002:map", data.items())
+)
 
-        session_migration = _session_postgres_migration_service(
-            image_tag=profile.image_tag,
-            password=profile.session_postgres_password or "",
-        )
-        services[session_migration.name] = service_to_compose_dict(session_migration, profile.domain, tls_mode)
+console = Console()
 
-        session_broker = _session_broker_service()
-        services[session_broker.name] = service_to_compose_dict(session_broker, profile.domain, tls_mode)
 
-        session_api = _session_api_service(
-            domain=profile.domain,
-            image_tag=profile.image_tag,
-            session_postgres_password=profile.session_postgres_password or "",
-            session_crypt_key=profile.session_crypt_key or "",
-        )
-        services[session_api.name] = service_to_compose_dict(session_api, profile.domain, tls_mode)
+def _openai_api_base(profile: ProfileConfig) -> str:
+    """OpenAI API base for the LLM gateway, defaulting to the bundled vLLM."""
+    if profile.vllm_enabled and not profile.openai_api_base:
+        return "http://vllm-service:8000/v1"
+    return profile.openai_api_base or ""
 
-        session_scheduler = _session_scheduler_service(
-            image_tag=profile.image_tag,
-            session_postgres_password=profile.session_postgres_password or "",
-        )
-        services[session_scheduler.name] = service_to_compose_dict(session_scheduler, profile.domain, tls_mode)
 
-        session_transcriber = _session_transcriber_service(
-            domain=profile.domain,
+def _streaming_stt_services(profile: ProfileConfig) -> list[ServiceDefinition]:
+    """Build one streaming STT service per configured variant."""
+    return [
+        get_streaming_stt_service(
+            variant=variant,
             image_tag=profile.image_tag,
-            replicas=profile.session_transcriber_replicas,
-            session_crypt_key=profile.session_crypt_key or "",
+            gpu_architecture=profile.kyutai_gpu_architecture,
         )
-        services[session_transcriber.name] = service_to_compose_dict(session_transcriber, profile.domain, tls_mode)
-        volumes["session_audio_data"] = {}
-
-        # Add streaming STT services
-        for variant in profile.streaming_stt_variants:
-            stt_service = get_streaming_stt_service(
-                variant=variant,
-                image_tag=profile.image_tag,
-                gpu_architecture=profile.kyutai_gpu_architecture,
-            )
-            services[stt_service.name] = service_to_compose_dict(stt_service, profile.domain, tls_mode)
+        for variant in profile.streaming_stt_variants
+    ]
+
+
+def _no_kwargs(profile: ProfileConfig) -> dict[str, Any]:
+    return {}
+
+
+# (factory, profile -> factory keyword arguments, volume created with it)
+_ServiceEntry = tuple[Callable[..., ServiceDefinition], Callable[[ProfileConfig], dict[str, Any]], str | None]
+
+# Feature blocks in output order:
+# (enabled, networks, service entries, extra services built after the entries)
+_SERVICE_BLOCKS: tuple[
+    tuple[
+        Callable[[ProfileConfig], bool],
+        dict[str, Any],
+        tuple[_ServiceEntry, ...],
+        Callable[[ProfileConfig], list[ServiceDefinition]] | None,
+    ],
+    ...,
+] = (
+    # Traefik is always deployed
+    (
+        lambda p: True,
+        {},
+        ((_traefik_service, lambda p: {"domain": p.domain, "tls_mode": p.tls_mode_str}, None),),
+        None,
+    ),
+    # Studio
+    (
+        lambda p: p.studio_enabled,
+        STUDIO_NETWORKS,
+        (
+            (_studio_mongodb_service, _no_kwargs, "studio_mongodb_data"),
+            (
+                _studio_api_service,
+                lambda p: {
+                    "domain": p.domain,
+                    "image_tag": p.image_tag,
+                    "jwt_secret": p.jwt_secret or "",
+                    "jwt_refresh_secret": p.jwt_refresh_secret or "",
+                    "super_admin_email": p.super_admin_email,
+                    "super_admin_password": p.super_admin_password or "",
+                    "live_session_enabled": p.live_session_enabled,
+                    "llm_enabled": p.llm_enabled,
+                    "stt_enabled": p.stt_enabled,
+                },
+                None,
+            ),
+            (_studio_frontend_service, lambda p: {"domain": p.domain, "image_tag": p.image_tag}, None),
+            (
+                _studio_websocket_service,
+                lambda p: {"domain": p.domain, "image_tag": p.image_tag, "jwt_secret": p.jwt_secret or ""},
+                None,
+            ),
+        ),
+        None,
+    ),
+    # STT, with the API Gateway for service discovery
+    (
+        lambda p: p.stt_enabled,
+        STT_NETWORKS,
+        (
+            (_api_gateway_service, lambda p: {"image_tag": p.image_tag}, None),
+            (_stt_mongo_service, _no_kwargs, "stt_mongodb_data"),
+            (
+                _task_broker_redis_service,
+                lambda p: {"redis_password": p.redis_password or ""},
+                "task_broker_redis_data",
+            ),
+            (
+                _stt_whisper_service,
+                lambda p: {"image_tag": p.image_tag, "redis_password": p.redis_password or ""},
+                None,
+            ),
+            (
+                _stt_whisper_workers_service,
+                lambda p: {"image_tag": p.image_tag, "redis_password": p.redis_password or ""},
+                None,
+            ),
+            (
+                _diarization_pyannote_service,
+                lambda p: {"image_tag": p.image_tag, "redis_password": p.redis_password or ""},
+                None,
+            ),
+        ),
+        None,
+    ),
+    # Live Session, followed by the streaming STT variants
+    (
+        lambda p: p.live_session_enabled,
+        SESSION_NETWORKS,
+        (
+            (
+                _session_postgres_service,
+                lambda p: {"password": p.session_postgres_password or ""},
+                "session_postgres_data",
+            ),
+            (
+                _session_postgres_migration_service,
+                lambda p: {"image_tag": p.image_tag, "password": p.session_postgres_password or ""},
+                None,
+            ),
+            (_session_broker_service, _no_kwargs, None),
+            (
+                _session_api_service,
+                lambda p: {
+                    "domain": p.domain,
+                    "image_tag": p.image_tag,
+                    "session_postgres_password": p.session_postgres_password or "",
+                    "session_crypt_key": p.session_crypt_key or "",
+                },
+                None,
+            ),
+            (
+                _session_scheduler_service,
+                lambda p: {"image_tag": p.image_tag, "session_postgres_password": p.session_postgres_password or ""},
+                None,
+            ),
+            (
+                _session_transcriber_service,
+                lambda p: {
+                    "domain": p.domain,
+                    "image_tag": p.image_tag,
+                    "replicas": p.session_transcriber_replicas,
+                    "session_crypt_key": p.session_crypt_key or "",
+                },
+                "session_audio_data",
+            ),
+        ),
+        _streaming_stt_services,
+    ),
+    # LLM, with a Celery worker for async tasks
+    (
+        lambda p: p.llm_enabled,
+        LLM_NETWORKS,
+        (
+            (_llm_postgres_service, lambda p: {"password": p.llm_postgres_password or ""}, "llm_postgres_data"),
+            (_llm_redis_service, lambda p: {"password": p.llm_redis_password or ""}, "llm_redis_data"),
+            (
+                _llm_gateway_api_service,
+                lambda p: {
+                    "image_tag": p.image_tag,
+                    "openai_api_base": _openai_api_base(p),
+                    "openai_api_token": p.openai_api_token or "",
+                    "redis_password": p.llm_redis_password or "",
+                },
+                "llm_models_cache",
+            ),
+            (
+                _llm_celery_worker_service,
+                lambda p: {
+                    "image_tag": p.image_tag,
+                    "redis_password": p.llm_redis_password or "",
+                    "openai_api_base": _openai_api_base(p),
+                    "openai_api_token": p.openai_api_token or "",
+                },
+                None,
+            ),
+            (_llm_gateway_frontend_service, lambda p: {"domain": p.domain, "image_tag": p.image_tag}, None),
+        ),
+        None,
+    ),
+    # Self-hosted vLLM backing the LLM gateway
+    (
+        lambda p: p.llm_enabled and p.vllm_enabled,
+        {},
+        ((_vllm_service, _no_kwargs, "vllm_models_cache"),),
+        None,
+    ),
+)
 
-    # Add LLM services
-    if profile.llm_enabled:
-        networks.update(LLM_NETWORKS)
 
-        llm_postgres = _llm_postgres_service(profile.llm_postgres_password or "")
-        services[llm_postgres.name] = service_to_compose_dict(llm_postgres, profile.domain, tls_mode)
-        volumes["llm_postgres_data"] = {}
+def render_compose(profile: ProfileConfig) -> dict[str, Any]:
+    """Render docker-compose.yml as a dictionary.
 
-        llm_redis = _llm_redis_service(profile.llm_redis_password or "")
-        services[llm_redis.name] = service_to_compose_dict(llm_redis, profile.domain, tls_mode)
-        volumes["llm_redis_data"] = {}
+    Renders are memoized on the profile contents; each call gets its own copy.
+    """
+    return copy.deepcopy(_render_compose_cached(profile.model_dump_json()))
 
-        # Determine OpenAI API base
-        openai_api_base = profile.openai_api_base
-        if profile.vllm_enabled and not openai_api_base:
-            openai_api_base = "http://vllm-service:8000/v1"
 
-        llm_gateway = _llm_gateway_api_service(
-            image_tag=profile.image_tag,
-            openai_api_base=openai_api_base or "",
-            openai_api_token=profile.openai_api_token or "",
-            redis_password=profile.llm_redis_password or "",
-        )
-        services[llm_gateway.name] = service_to_compose_dict(llm_gateway, profile.domain, tls_mode)
-        volumes["llm_models_cache"] = {}
+@functools.lru_cache(maxsize=8)
+def _render_compose_cached(profile_json: str) -> dict[str, Any]:
+    """Render a profile given as its JSON dump (shared result, do not mutate)."""
+    return _render_compose(ProfileConfig.model_validate_json(profile_json))
 
-        # Celery worker for async tasks
-        llm_celery = _llm_celery_worker_service(
-            image_tag=profile.image_tag,
-            redis_password=profile.llm_redis_password or "",
-            openai_api_base=openai_api_base or "",
-            openai_api_token=profile.openai_api_token or "",
-        )
-        services[llm_celery.name] = service_to_compose_dict(llm_celery, profile.domain, tls_mode)
 
-        llm_frontend = _llm_gateway_frontend_service(
-            domain=profile.domain,
-            image_tag=profile.image_tag,
-        )
-        services[llm_frontend.name] = service_to_compose_dict(llm_frontend, profile.domain, tls_mode)
+def _render_compose(profile: ProfileConfig) -> dict[str, Any]:
+    """Build the docker-compose.yml dictionary for a profile."""
+    # Ensure secrets are populated
+    profile = generate_secrets(profile)
 
-        if profile.vllm_enabled:
-            vllm = _vllm_service()
-            services[vllm.name] = service_to_compose_dict(vllm, profile.domain, tls_mode)
-            volumes["vllm_models_cache"] = {}
+    built: list[ServiceDefinition] = []
+    networks: dict[str, Any] = {"linto": {"driver": "bridge"}}
+    volume_names: list[str] = []
+
+    tls_mode = profile.tls_mode_str
+
+    # Factories are only called for enabled blocks, so disabled features never
+    # build their definitions
+    for enabled, block_networks, entries, expand in _SERVICE_BLOCKS:
+        if not enabled(profile):
+            continue
+        networks.update(block_networks)
+        for factory, kwargs, volume in entries:
+            built.append(factory(**kwargs(profile)))
+            if volume:
+                volume_names.append(volume)
+        if expand:
+            built.extend(expand(profile))
+
+    # Convert in one pass; each volume gets its own empty mapping so the dumper
+    # does not emit YAML aliases for a shared object
+    services = {svc.name: service_to_compose_dict(svc, profile.domain, tls_mode) for svc in built}
+    volumes: dict[str, Any] = {name: {} for name in volume_names}
 
     return {
         "version": "3.8",
@@ -261,41 +350,36 @@ def generate_compose(
     profile = generate_secrets(profile)
     save_profile(profile, base_dir)
 
-    tls_mode = profile.tls_mode.value if isinstance(profile.tls_mode, TLSMode) else profile.tls_mode
+    tls_mode = profile.tls_mode_str
+    linto_root = base_dir / ".linto"
 
     # Determine output directory
     if output_dir:
         compose_dir = Path(output_dir)
     else:
-        compose_dir = base_dir / ".linto" / "render" / "compose" / profile_name
+        compose_dir = linto_root / "render" / "compose" / profile_name
 
-    compose_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(compose_dir)
 
     # Generate TLS certificates if needed
     if tls_mode == "mkcert":
-        certs_dir = base_dir / ".linto" / "tls" / "certs"
+        certs_dir = linto_root / "tls" / "certs"
         cert_path, key_path = generate_certs(profile.domain, certs_dir)
         console.print(f"[green]Generated TLS certificates in {certs_dir}[/green]")
 
         # Create Traefik dynamic config
-        traefik_dynamic_dir = base_dir / ".linto" / "traefik" / "dynamic"
-        traefik_dynamic_dir.mkdir(parents=True, exist_ok=True)
-        dynamic_config = generate_traefik_dynamic_config(profile.domain)
+        traefik_dynamic_dir = linto_root / "traefik" / "dynamic"
+        _ensure_dir(traefik_dynamic_dir)
         dynamic_config_path = traefik_dynamic_dir / "tls.yml"
-        with dynamic_config_path.open("w") as f:
-            yaml.dump(dynamic_config, f, default_flow_style=False)
+        dynamic_config_path.write_text(format_traefik_dynamic_config(profile.domain))
 
     elif tls_mode == "acme":
         # Setup ACME storage
-        from linto.tls.acme import setup_acme_storage
-
         setup_acme_storage(base_dir)
         console.print("[green]Prepared ACME storage for Let's Encrypt[/green]")
 
     elif tls_mode == "custom":
         # Import custom certificates
-        from linto.tls.custom import import_custom_certs
-
         if profile.custom_cert_path and profile.custom_key_path:
             import_custom_certs(
                 cert_path=Path(profile.custom_cert_path),
@@ -306,34 +390,30 @@ def generate_compose(
             console.print("[green]Imported custom TLS certificates[/green]")
 
             # Create Traefik dynamic config
-            traefik_dynamic_dir = base_dir / ".linto" / "traefik" / "dynamic"
-            traefik_dynamic_dir.mkdir(parents=True, exist_ok=True)
-            dynamic_config = generate_traefik_dynamic_config(profile.domain)
+            traefik_dynamic_dir = linto_root / "traefik" / "dynamic"
+            _ensure_dir(traefik_dynamic_dir)
             dynamic_config_path = traefik_dynamic_dir / "tls.yml"
-            with dynamic_config_path.open("w") as f:
-                yaml.dump(dynamic_config, f, default_flow_style=False)
+            dynamic_config_path.write_text(format_traefik_dynamic_config(profile.domain))
 
     # Create LLM config directories if LLM enabled
     if profile.llm_enabled:
-        llm_hydra_dir = base_dir / ".linto" / "llm" / "hydra-conf"
-        llm_prompts_dir = base_dir / ".linto" / "llm" / "prompts"
-        llm_hydra_dir.mkdir(parents=True, exist_ok=True)
-        llm_prompts_dir.mkdir(parents=True, exist_ok=True)
+        llm_hydra_dir = linto_root / "llm" / "hydra-conf"
+        llm_prompts_dir = linto_root / "llm" / "prompts"
+        _ensure_dir(llm_hydra_dir)
+        _ensure_dir(llm_prompts_dir)
 
-    # Render compose
-    compose_dict = render_compose(profile)
+    # Render compose (only dumped below, so the shared cached render is safe)
+    compose_dict = _render_compose_cached(profile.model_dump_json())
 
     # Write docker-compose.yml
     compose_path = compose_dir / "docker-compose.yml"
-    with compose_path.open("w") as f:
-        yaml.dump(compose_dict, f, default_flow_style=False, sort_keys=False)
+    compose_path.write_text(yaml.dump(compose_dict, Dumper=_ComposeDumper, default_flow_style=False, sort_keys=False))
 
     # Write .env file with non-sensitive vars
     env_path = compose_dir / ".env"
-    with env_path.open("w") as f:
-        f.write(f"COMPOSE_PROJECT_NAME=linto-{profile_name}\n")
-        f.write(f"DOMAIN={profile.domain}\n")
-        f.write(f"IMAGE_TAG={profile.image_tag}\n")
+    env_path.write_text(
+        f"COMPOSE_PROJECT_NAME=linto-{profile_name}\nDOMAIN={profile.domain}\nIMAGE_TAG={profile.image_tag}\n"
+    )
 
     # Print summary
     _print_summary(profile, compose_path)
@@ -341,25 +421,37 @@ def generate_compose(
     return compose_path
 
 
+def _ensure_dir(path: Path) -> None:
+    """Create a directory and its parents unless it already exists."""
+    # A single stat on re-generation, where the directories are already there
+    if not path.is_dir():
+        path.mkdir(parents=True, exist_ok=True)
+
+
+_YES_NO = {True: "Yes", False: "No"}
+
+
 def _print_summary(profile: ProfileConfig, compose_path: Path) -> None:
     """Print a summary table of the generated configuration."""
     table = Table(title="Deployment Summary")
     table.add_column("Setting", style="cyan")
     table.add_column("Value", style="green")
 
-    tls_mode = profile.tls_mode.value if isinstance(profile.tls_mode, TLSMode) else profile.tls_mode
-
-    table.add_row("Profile", profile.name)
-    table.add_row("Backend", "Docker Compose")
-    table.add_row("Domain", profile.domain)
-    table.add_row("Image Tag", profile.image_tag)
-    table.add_row("TLS Mode", tls_mode)
-    table.add_row("Studio Enabled", "Yes" if profile.studio_enabled else "No")
-    table.add_row("STT Enabled", "Yes" if profile.stt_enabled else "No")
-    table.add_row("Live Session Enabled", "Yes" if profile.live_session_enabled else "No")
-    table.add_row("LLM Enabled", "Yes" if profile.llm_enabled else "No")
-    table.add_row("Admin Email", profile.super_admin_email)
-    table.add_row("Output", str(compose_path))
+    rows = (
+        ("Profile", profile.name),
+        ("Backend", "Docker Compose"),
+        ("Domain", profile.domain),
+        ("Image Tag", profile.image_tag),
+        ("TLS Mode", profile.tls_mode_str),
+        ("Studio Enabled", _YES_NO[profile.studio_enabled]),
+        ("STT Enabled", _YES_NO[profile.stt_enabled]),
+        ("Live Session Enabled", _YES_NO[profile.live_session_enabled]),
+        ("LLM Enabled", _YES_NO[profile.llm_enabled]),
+        ("Admin Email", profile.super_admin_email),
+        ("Output", str(compose_path)),
+    )
+    for setting, value in rows:
+        table.add_row(setting, value)
 
     console.print(table)
 
@@ -376,8 +468,11 @@ def apply_compose(profile_name: str, base_dir: Path | None = None) -> None:
 
     compose_dir = base_dir / ".linto" / "render" / "compose" / profile_name
 
-    # Generate if not present
-    if not (compose_dir / "docker-compose.yml").exists():
+    # Generate if not present or older than the profile it was rendered from
+    # (generate_compose saves the profile before writing the compose file)
+    compose_file = os.path.join(compose_dir, "docker-compose.yml")
+    profile_path = validate_profile_exists(profile_name, base_dir)
+    if not os.path.isfile(compose_file) or os.path.getmtime(profile_path) > os.path.getmtime(compose_file):
         console.print("[yellow]Generating deployment artifacts...[/yellow]")
         generate_compose(profile_name, base_dir=base_dir)
 
@@ -413,7 +508,7 @@ def destroy_compose(
 
     compose_dir = base_dir / ".linto" / "render" / "compose" / profile_name
 
-    if not (compose_dir / "docker-compose.yml").exists():
+    if not os.path.isfile(os.path.join(compose_dir, "docker-compose.yml")):
         raise ValidationError(
             "PROFILE_NOT_FOUND",
             f"No deployment found for profile '{profile_name}'",
@@ -429,8 +524,6 @@ def destroy_compose(
         console.print(f"[red]Warning: docker compose down returned {result.returncode}[/red]")
 
     if remove_files:
-        import shutil
-
         shutil.rmtree(compose_dir)
         console.print(f"[yellow]Removed generated files in {compose_dir}[/yellow]")
 
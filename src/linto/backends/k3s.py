@@ -1,7 +1,21 @@
 """Kubernetes (k3s) backend using Helm charts."""
 
+import collections
+import copy
+import functools
+import gzip
+import hashlib
 import importlib.resources
+import json
+import os
+import re
+import shutil
 import subprocess
+import threading
+import urllib.request
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
@@ -9,18 +23,56 @@ import yaml
 from rich.console import Console
 from rich.table import Table
 
-from linto.model.profile import GPUMode, ProfileConfig, StreamingSTTVariant, TLSMode
+from linto.model.profile import GPUMode, ProfileConfig, StreamingSTTVariant
 from linto.model.validation import ValidationError, load_profile, save_profile
-from linto.utils.cmd import run_cmd
-from linto.utils.kubeconfig import KubeconfigContext
+from linto.utils.cmd import get_show_commands, quote_arg, run_cmd
+from linto.utils.kubeconfig import kubeconfig_args
 from linto.utils.secrets import generate_secrets
 
+# Prefer the libyaml-backed dumper; fall back to pure Python if PyYAML was
+# built without libyaml
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
+# orjson parses and serializes the TLS secret backups faster than stdlib json;
+# it is optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 stderr_console = Console(stderr=True)
 
+# kubectl and helm are looked up on PATH once rather than on every spawn.
+# Commands run with close_fds=False: Python opens descriptors as
+# non-inheritable, so children gain nothing and the spawn skips closing them
+_KUBECTL = shutil.which("kubectl") or "kubectl"
+_HELM = shutil.which("helm") or "helm"
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, using orjson when available."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode an object as compact JSON bytes, using orjson when available."""
+    return orjson.dumps(obj) if orjson else json.dumps(obj, separators=(",", ":")).encode()
+
+
+@functools.cache
+def get_charts_dir() -> Path:
+    """Get the path to Helm charts directory, resolved once per process.
+
+    LINTO_CHARTS_DIR overrides the lookup when set.
+    """
+    override = os.environ.get("LINTO_CHARTS_DIR")
+    if override:
+        return Path(override)
 
-def _get_charts_dir() -> Path:
-    """Get the path to Helm charts directory."""
     # First try: installed package with importlib.resources
     try:
         # For Python 3.11+
@@ -48,16 +100,28 @@ def _get_charts_dir() -> Path:
     raise FileNotFoundError("Helm charts directory not found")
 
 
-# Lazy initialization
-_charts_dir: Path | None = None
+# Prerequisite probes: (command, timeout, message if it fails, message if it cannot run)
+_PREREQUISITE_PROBES: tuple[tuple[list[str], int, str, str], ...] = (
+    (
+        [_KUBECTL, "version", "--client", "--output=json"],
+        10,
+        "kubectl not properly configured",
+        "kubectl not found",
+    ),
+    ([_HELM, "version", "--short"], 10, "helm not properly configured", "helm not found"),
+    ([_KUBECTL, "cluster-info"], 15, "Kubernetes cluster not accessible", "Cannot connect to Kubernetes cluster"),
+)
 
 
-def get_charts_dir() -> Path:
-    """Get charts directory with lazy initialization."""
-    global _charts_dir
-    if _charts_dir is None:
-        _charts_dir = _get_charts_dir()
-    return _charts_dir
+def _run_probe(kube: list[str], cmd: list[str], timeout: int, failed: str, unavailable: str) -> str | None:
+    """Run a prerequisite probe and return the problem it reveals, if any."""
+    try:
+        result = subprocess.run(
+            [cmd[0], *kube, *cmd[1:]], capture_output=True, check=False, timeout=timeout, close_fds=False
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return unavailable
+    return failed if result.returncode != 0 else None
 
 
 def check_k3s_prerequisites(profile: ProfileConfig | None = None) -> list[str]:
@@ -69,85 +133,194 @@ def check_k3s_prerequisites(profile: ProfileConfig | None = None) -> list[str]:
     Returns:
         List of missing prerequisites (empty if all present)
     """
-    kubeconfig = profile.kubeconfig if profile else None
+    # Cluster access uses the profile's kubeconfig
+    kube = kubeconfig_args(profile.kubeconfig if profile else None)
 
-    missing = []
+    # The probes are independent, so they run concurrently
+    with ThreadPoolExecutor(max_workers=len(_PREREQUISITE_PROBES)) as pool:
+        problems = list(pool.map(lambda probe: _run_probe(kube, *probe), _PREREQUISITE_PROBES))
 
-    # Check kubectl
+    return [problem for problem in problems if problem]
+
+
+def ensure_namespace(namespace: str, kubeconfig: dict | None = None) -> bool:
+    """Ensure the namespace exists, creating it if necessary.
+
+    Args:
+        namespace: Kubernetes namespace name
+        kubeconfig: Optional kubeconfig dict to use
+
+    Returns:
+        True if namespace exists or was created
+    """
+    kube = kubeconfig_args(kubeconfig)
     try:
+        # Create first: one kubectl call whether or not the namespace exists
         result = subprocess.run(
-            ["kubectl", "version", "--client", "--output=json"],
+            [_KUBECTL, *kube, "create", "namespace", namespace],
             capture_output=True,
+            text=True,
             check=False,
             timeout=10,
+            close_fds=False,
         )
-        if result.returncode != 0:
-            missing.append("kubectl not properly configured")
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        missing.append("kubectl not found")
+        if result.returncode == 0 or "AlreadyExists" in result.stderr:
+            return True
 
-    # Check helm
-    try:
+        # Creation may be forbidden while the namespace already exists
         result = subprocess.run(
-            ["helm", "version", "--short"],
+            [_KUBECTL, *kube, "get", "namespace", namespace],
             capture_output=True,
             check=False,
             timeout=10,
+            close_fds=False,
         )
-        if result.returncode != 0:
-            missing.append("helm not properly configured")
+        return result.returncode == 0
     except (subprocess.TimeoutExpired, FileNotFoundError):
-        missing.append("helm not found")
+        return False
 
-    # Check cluster access (using profile's kubeconfig if available)
-    with KubeconfigContext(kubeconfig):
-        try:
-            result = subprocess.run(
-                ["kubectl", "cluster-info"],
-                capture_output=True,
-                check=False,
-                timeout=15,
-            )
-            if result.returncode != 0:
-                missing.append("Kubernetes cluster not accessible")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            missing.append("Cannot connect to Kubernetes cluster")
 
-    return missing
+# Helm --timeout for waited installs, overridable with LINTO_HELM_TIMEOUT
+# (a Go duration such as "20m" or "1h30m")
+HELM_TIMEOUT_ENV = "LINTO_HELM_TIMEOUT"
+DEFAULT_HELM_TIMEOUT = "15m"
+_DURATION_RE = re.compile(r"(?:(\d+)h)?(?:(\d+)m)?(?:(\d+)s)?")
+# Extra time given to the helm process so helm reports its own timeout first
+_HELM_TIMEOUT_GRACE = 60
 
 
-def ensure_namespace(namespace: str, kubeconfig: dict | None = None) -> bool:
-    """Ensure the namespace exists, creating it if necessary.
+def get_helm_timeout() -> tuple[str, int]:
+    """Get the Helm install timeout.
+
+    Returns:
+        Tuple of (helm --timeout value, subprocess timeout in seconds)
+    """
+    timeout = os.environ.get(HELM_TIMEOUT_ENV) or DEFAULT_HELM_TIMEOUT
+    match = _DURATION_RE.fullmatch(timeout)
+    if not match or not any(match.groups()):
+        console.print(f"[yellow]Ignoring invalid {HELM_TIMEOUT_ENV}={timeout!r}, using {DEFAULT_HELM_TIMEOUT}[/yellow]")
+        timeout = DEFAULT_HELM_TIMEOUT
+        match = _DURATION_RE.fullmatch(timeout)
+    hours, minutes, seconds = (int(group or 0) for group in match.groups())
+    return timeout, hours * 3600 + minutes * 60 + seconds + _HELM_TIMEOUT_GRACE
+
+
+# Lines of helm output kept for the error message when an install fails
+_HELM_OUTPUT_TAIL = 100
+
+
+def _run_helm_streaming(cmd: list[str], timeout: int, input: str | None = None) -> tuple[int, str]:
+    """Run a long helm command, echoing its output as it is produced.
+
+    Only the last lines of output are retained, so memory stays constant
+    however verbose the install is.
 
     Args:
-        namespace: Kubernetes namespace name
-        kubeconfig: Optional kubeconfig dict to use
+        cmd: Helm command and arguments
+        timeout: Timeout in seconds
+        input: Optional text written to the command's stdin
 
     Returns:
-        True if namespace exists or was created
+        Tuple of (exit code, last lines of combined stdout/stderr)
+
+    Raises:
+        subprocess.TimeoutExpired: If the command runs longer than timeout
     """
-    with KubeconfigContext(kubeconfig):
-        try:
-            # Check if namespace exists
+    process = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE if input is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        close_fds=False,
+    )
+    if input is not None and process.stdin:
+        process.stdin.write(input)
+        process.stdin.close()
+
+    tail: collections.deque[str] = collections.deque(maxlen=_HELM_OUTPUT_TAIL)
+    timed_out = threading.Event()
+
+    def _kill() -> None:
+        timed_out.set()
+        process.kill()
+
+    watchdog = threading.Timer(timeout, _kill)
+    watchdog.start()
+    try:
+        for line in process.stdout or ():
+            tail.append(line)
+            console.print(f"  {line.rstrip()}", style="dim", markup=False, highlight=False)
+        returncode = process.wait()
+    finally:
+        watchdog.cancel()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout, output="".join(tail))
+    return returncode, "".join(tail)
+
+
+# Helm repositories known to be configured (loaded from `helm repo list` on
+# first use) and whether `helm repo update` already ran in this process
+_helm_repos: set[str] | None = None
+_helm_repos_updated = False
+_helm_repos_lock = threading.Lock()
+
+
+def _list_helm_repos() -> set[str]:
+    """Return the names of the Helm repositories already configured."""
+    result = subprocess.run(
+        [_HELM, "repo", "list", "-o", "json"],
+        capture_output=True,
+        text=True,
+        check=False,
+        timeout=30,
+        close_fds=False,
+    )
+    # helm exits non-zero when no repositories are configured
+    if result.returncode != 0:
+        return set()
+    try:
+        return {repo["name"] for repo in json.loads(result.stdout)}
+    except (ValueError, KeyError, TypeError):
+        return set()
+
+
+def _ensure_helm_repo(name: str, url: str, update: bool = True) -> None:
+    """Add a Helm repository if missing and refresh repository indexes once.
+
+    A newly added repository comes with a fresh index. For repositories that
+    were already configured, `helm repo update` runs at most once per process
+    (when update is True) instead of once per chart.
+    """
+    global _helm_repos, _helm_repos_updated
+
+    with _helm_repos_lock:
+        if _helm_repos is None:
+            _helm_repos = _list_helm_repos()
+
+        if name not in _helm_repos:
             result = subprocess.run(
-                ["kubectl", "get", "namespace", namespace],
+                [_HELM, "repo", "add", name, url],
                 capture_output=True,
                 check=False,
-                timeout=10,
+                timeout=30,
+                close_fds=False,
             )
             if result.returncode == 0:
-                return True
+                _helm_repos.add(name)
+            return
 
-            # Create namespace
-            result = subprocess.run(
-                ["kubectl", "create", "namespace", namespace],
+        if update and not _helm_repos_updated:
+            subprocess.run(
+                [_HELM, "repo", "update"],
                 capture_output=True,
                 check=False,
-                timeout=10,
+                timeout=60,
+                close_fds=False,
             )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+            _helm_repos_updated = True
 
 
 def install_cert_manager(kubeconfig: dict | None = None) -> bool:
@@ -159,70 +332,112 @@ def install_cert_manager(kubeconfig: dict | None = None) -> bool:
     Returns:
         True if cert-manager is installed or already present
     """
-    with KubeconfigContext(kubeconfig):
-        try:
-            # Check if cert-manager is already installed
-            result = subprocess.run(
-                ["kubectl", "get", "namespace", "cert-manager"],
-                capture_output=True,
-                check=False,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                console.print("[dim]cert-manager already installed[/dim]")
-                return True
-
-            console.print("[cyan]Installing cert-manager...[/cyan]")
-
-            # Add jetstack repo
-            subprocess.run(
-                ["helm", "repo", "add", "jetstack", "https://charts.jetstack.io"],
-                capture_output=True,
-                check=False,
-                timeout=30,
-            )
-
-            subprocess.run(
-                ["helm", "repo", "update"],
-                capture_output=True,
-                check=False,
-                timeout=60,
-            )
+    kube = kubeconfig_args(kubeconfig)
+    try:
+        # Check if cert-manager is already installed
+        result = subprocess.run(
+            [_KUBECTL, *kube, "get", "namespace", "cert-manager"],
+            capture_output=True,
+            check=False,
+            timeout=10,
+            close_fds=False,
+        )
+        if result.returncode == 0:
+            console.print("[dim]cert-manager already installed[/dim]")
+            return True
 
-            # Install cert-manager
-            result = subprocess.run(
-                [
-                    "helm",
-                    "install",
-                    "cert-manager",
-                    "jetstack/cert-manager",
-                    "--namespace",
-                    "cert-manager",
-                    "--create-namespace",
-                    "--set",
-                    "installCRDs=true",
-                    "--wait",
-                    "--timeout",
-                    "5m",
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=300,
-            )
-            if result.returncode == 0:
-                console.print("[green]cert-manager installed successfully[/green]")
-                return True
-            else:
-                console.print(f"[red]Failed to install cert-manager: {result.stderr}[/red]")
-                return False
-        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-            console.print(f"[red]Error installing cert-manager: {e}[/red]")
+        console.print("[cyan]Installing cert-manager...[/cyan]")
+
+        # Add jetstack repo
+        _ensure_helm_repo("jetstack", "https://charts.jetstack.io")
+
+        # Install cert-manager
+        helm_timeout, process_timeout = get_helm_timeout()
+        returncode, output = _run_helm_streaming(
+            [
+                _HELM,
+                *kube,
+                "install",
+                "cert-manager",
+                "jetstack/cert-manager",
+                "--namespace",
+                "cert-manager",
+                "--create-namespace",
+                "--set",
+                "installCRDs=true",
+                "--wait",
+                "--timeout",
+                helm_timeout,
+            ],
+            timeout=process_timeout,
+        )
+        if returncode == 0:
+            console.print("[green]cert-manager installed successfully[/green]")
+            return True
+        else:
+            console.print(f"[red]Failed to install cert-manager: {output}[/red]")
             return False
+    except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+        console.print(f"[red]Error installing cert-manager: {e}[/red]")
+        return False
 
 
 MONITORING_NAMESPACE = "monitoring"
 
+# kube-prometheus-stack values: Grafana with anonymous admin access
+_MONITORING_VALUES: dict[str, Any] = {
+    "grafana": {
+        "adminPassword": "admin",
+        "grafana.ini": {
+            "auth.anonymous": {"enabled": True, "org_role": "Admin"},
+            "auth": {"disable_login_form": True},
+        },
+    },
+}
+
+# DCGM exporter values: ServiceMonitor picked up by the Prometheus release
+_DCGM_EXPORTER_VALUES: dict[str, Any] = {
+    "serviceMonitor": {
+        "enabled": True,
+        "interval": "15s",
+        "additionalLabels": {"release": "prometheus"},
+    },
+    "nodeSelector": {"nvidia.com/gpu": "true"},
+    "resources": {
+        "requests": {"cpu": "100m", "memory": "256Mi"},
+        "limits": {"cpu": "500m", "memory": "512Mi"},
+    },
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _has_gpu_nodes(kube: tuple[str, ...]) -> bool:
+    """Check whether the cluster has NVIDIA GPU nodes (once per kubeconfig).
+
+    Only the first matching node's name is printed, so the response stays
+    small however many nodes the cluster has.
+    """
+    result = subprocess.run(
+        [
+            _KUBECTL,
+            *kube,
+            "get",
+            "nodes",
+            "-l",
+            "nvidia.com/gpu=true",
+            "-o",
+            "jsonpath={.items[0].metadata.name}",
+            "--request-timeout=5s",
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+        timeout=10,
+        close_fds=False,
+    )
+    # jsonpath fails on an empty item list, which also means no GPU nodes
+    return result.returncode == 0 and bool(result.stdout.strip())
+
 
 def _install_dcgm_exporter(kubeconfig: dict | None = None) -> bool:
     """Install NVIDIA DCGM Exporter for GPU metrics.
@@ -233,74 +448,113 @@ def _install_dcgm_exporter(kubeconfig: dict | None = None) -> bool:
     Returns:
         True if installed successfully or no GPU nodes exist
     """
-    with KubeconfigContext(kubeconfig):
-        try:
-            # Check if any nodes have NVIDIA GPUs
-            result = subprocess.run(
-                ["kubectl", "get", "nodes", "-l", "nvidia.com/gpu=true", "-o", "name"],
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=10,
-            )
-            if result.returncode != 0 or not result.stdout.strip():
-                console.print("[dim]No GPU nodes found, skipping DCGM exporter[/dim]")
-                return True
+    kube = kubeconfig_args(kubeconfig)
+    try:
+        if not _has_gpu_nodes(tuple(kube)):
+            console.print("[dim]No GPU nodes found, skipping DCGM exporter[/dim]")
+            return True
 
-            console.print("[cyan]Installing NVIDIA DCGM Exporter for GPU metrics...[/cyan]")
+        console.print("[cyan]Installing NVIDIA DCGM Exporter for GPU metrics...[/cyan]")
 
-            # Add NVIDIA helm repo
-            subprocess.run(
-                ["helm", "repo", "add", "gpu-helm-charts", "https://nvidia.github.io/dcgm-exporter/helm-charts"],
-                capture_output=True,
-                check=False,
-                timeout=30,
-            )
+        # Add NVIDIA helm repo
+        _ensure_helm_repo("gpu-helm-charts", "https://nvidia.github.io/dcgm-exporter/helm-charts", update=False)
 
-            # Install DCGM exporter with ServiceMonitor for Prometheus
-            values = """
-serviceMonitor:
-  enabled: true
-  interval: 15s
-  additionalLabels:
-    release: prometheus
-nodeSelector:
-  nvidia.com/gpu: "true"
-resources:
-  requests:
-    cpu: 100m
-    memory: 256Mi
-  limits:
-    cpu: 500m
-    memory: 512Mi
-"""
-            result = subprocess.run(
-                [
-                    "helm",
-                    "upgrade",
-                    "--install",
-                    "dcgm-exporter",
-                    "gpu-helm-charts/dcgm-exporter",
-                    "--namespace",
-                    MONITORING_NAMESPACE,
-                    "-f",
-                    "-",
-                ],
-                input=values,
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=300,
-            )
-            if result.returncode == 0:
-                console.print("[green]DCGM Exporter installed[/green]")
-                return True
-            else:
-                console.print(f"[yellow]DCGM Exporter installation failed: {result.stderr}[/yellow]")
-                return False
-        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-            console.print(f"[yellow]DCGM Exporter installation skipped: {e}[/yellow]")
+        # Install DCGM exporter with ServiceMonitor for Prometheus
+        result = subprocess.run(
+            [
+                _HELM,
+                *kube,
+                "upgrade",
+                "--install",
+                "dcgm-exporter",
+                "gpu-helm-charts/dcgm-exporter",
+                "--namespace",
+                MONITORING_NAMESPACE,
+                "-f",
+                "-",
+            ],
+            input=yaml.dump(_DCGM_EXPORTER_VALUES, Dumper=SafeDumper, sort_keys=False),
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=300,
+            close_fds=False,
+        )
+        if result.returncode == 0:
+            console.print("[green]DCGM Exporter installed[/green]")
+            return True
+        else:
+            console.print(f"[yellow]DCGM Exporter installation failed: {result.stderr}[/yellow]")
             return False
+    except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+        console.print(f"[yellow]DCGM Exporter installation skipped: {e}[/yellow]")
+        return False
+
+
+# NVIDIA DCGM exporter dashboard published on grafana.com
+GPU_DASHBOARD_URL = "https://grafana.com/api/dashboards/12239/revisions/2/download"
+
+
+# Dashboard revisions are immutable, so a downloaded copy is kept on disk
+GPU_DASHBOARD_CACHE = Path("linto") / "dashboards" / "12239-v2.json.gz"
+
+
+@functools.lru_cache(maxsize=1)
+def _fetch_gpu_dashboard() -> dict[str, Any]:
+    """Load the GPU dashboard definition, downloading it on first use."""
+    cache_file = Path.home() / ".cache" / GPU_DASHBOARD_CACHE
+    try:
+        return _json_loads(gzip.decompress(cache_file.read_bytes()))
+    except (OSError, EOFError, ValueError):
+        pass  # Not cached yet, or the cached copy is unreadable
+
+    with urllib.request.urlopen(GPU_DASHBOARD_URL, timeout=30) as response:
+        data = response.read()
+    dashboard = _json_loads(data)
+
+    # Caching is best effort: a read-only home must not fail the import
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(gzip.compress(data))
+    except OSError:
+        pass
+    return dashboard
+
+
+@contextmanager
+def _port_forward(
+    namespace: str,
+    target: str,
+    remote_port: int,
+    timeout: float = 30,
+    kubeconfig: dict | None = None,
+) -> Iterator[int]:
+    """Port-forward a cluster resource to an ephemeral local port.
+
+    Yields:
+        The local port chosen by kubectl
+    """
+    process = subprocess.Popen(
+        [_KUBECTL, *kubeconfig_args(kubeconfig), "port-forward", "-n", namespace, target, f"0:{remote_port}"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        close_fds=False,
+    )
+    # Don't wait forever on a port-forward that never reports readiness
+    watchdog = threading.Timer(timeout, process.kill)
+    watchdog.start()
+    try:
+        # kubectl reports "Forwarding from 127.0.0.1:<port> -> <remote_port>"
+        line = process.stdout.readline() if process.stdout else ""
+        match = re.search(r"127\.0\.0\.1:(\d+)", line)
+        if not match:
+            raise RuntimeError(f"kubectl port-forward to {target} did not start")
+        yield int(match.group(1))
+    finally:
+        watchdog.cancel()
+        process.terminate()
+        process.wait(timeout=10)
 
 
 def _import_gpu_dashboard(kubeconfig: dict | None = None) -> bool:
@@ -312,65 +566,37 @@ def _import_gpu_dashboard(kubeconfig: dict | None = None) -> bool:
     Returns:
         True if imported successfully
     """
-    import urllib.request
-
-    with KubeconfigContext(kubeconfig):
-        try:
-            # Download dashboard JSON from grafana.com
-            dashboard_url = "https://grafana.com/api/dashboards/12239/revisions/2/download"
-            with urllib.request.urlopen(dashboard_url, timeout=30) as response:
-                dashboard_json = response.read().decode("utf-8")
-
-            # Import via Grafana API (using kubectl port-forward)
-            import_payload = f'''{{
-                "dashboard": {dashboard_json},
-                "overwrite": true,
-                "inputs": [{{
+    try:
+        import_payload = {
+            "dashboard": _fetch_gpu_dashboard(),
+            "overwrite": True,
+            "inputs": [
+                {
                     "name": "DS_PROMETHEUS",
                     "type": "datasource",
                     "pluginId": "prometheus",
-                    "value": "prometheus"
-                }}],
-                "folderId": 0
-            }}'''
+                    "value": "prometheus",
+                }
+            ],
+            "folderId": 0,
+        }
 
-            # Use kubectl exec to call Grafana API from inside the cluster
-            result = subprocess.run(
-                [
-                    "kubectl",
-                    "run",
-                    "grafana-import",
-                    "--rm",
-                    "-i",
-                    "--restart=Never",
-                    "--namespace",
-                    MONITORING_NAMESPACE,
-                    "--image=curlimages/curl:latest",
-                    "--",
-                    "curl",
-                    "-s",
-                    "-X",
-                    "POST",
-                    "http://prometheus-grafana:80/api/dashboards/import",
-                    "-H",
-                    "Content-Type: application/json",
-                    "-d",
-                    import_payload,
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=120,
+        # POST to the Grafana API through a local port-forward
+        with _port_forward(MONITORING_NAMESPACE, "svc/prometheus-grafana", 80, kubeconfig=kubeconfig) as port:
+            request = urllib.request.Request(
+                f"http://127.0.0.1:{port}/api/dashboards/import",
+                data=json.dumps(import_payload).encode(),
+                headers={"Content-Type": "application/json"},
+                method="POST",
             )
-            if "imported" in result.stdout.lower() or result.returncode == 0:
-                console.print("[green]GPU dashboard imported[/green]")
-                return True
-            else:
-                console.print("[dim]GPU dashboard import skipped[/dim]")
-                return False
-        except Exception as e:
-            console.print(f"[dim]GPU dashboard import skipped: {e}[/dim]")
-            return False
+            with urllib.request.urlopen(request, timeout=10):
+                pass
+
+        console.print("[green]GPU dashboard imported[/green]")
+        return True
+    except Exception as e:
+        console.print(f"[dim]GPU dashboard import skipped: {e}[/dim]")
+        return False
 
 
 def install_monitoring(kubeconfig: dict | None = None) -> bool:
@@ -385,83 +611,70 @@ def install_monitoring(kubeconfig: dict | None = None) -> bool:
     Returns:
         True if monitoring was installed successfully
     """
-    with KubeconfigContext(kubeconfig):
-        try:
-            # Check if prometheus-grafana is already installed
-            result = subprocess.run(
-                ["kubectl", "get", "svc", "prometheus-grafana", "-n", MONITORING_NAMESPACE],
-                capture_output=True,
-                check=False,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                console.print("[dim]Monitoring stack already installed[/dim]")
-                # Still try to install DCGM exporter (idempotent)
-                _install_dcgm_exporter(kubeconfig)
-                return True
-
-            console.print(f"[cyan]Installing monitoring stack in namespace '{MONITORING_NAMESPACE}'...[/cyan]")
-
-            # Add prometheus-community repo
-            subprocess.run(
-                ["helm", "repo", "add", "prometheus-community", "https://prometheus-community.github.io/helm-charts"],
-                capture_output=True,
-                check=False,
-                timeout=30,
-            )
-
-            subprocess.run(
-                ["helm", "repo", "update"],
-                capture_output=True,
-                check=False,
-                timeout=60,
-            )
-
-            # Install kube-prometheus-stack with anonymous access enabled
-            result = subprocess.run(
-                [
-                    "helm",
-                    "upgrade",
-                    "--install",
-                    "prometheus",
-                    "prometheus-community/kube-prometheus-stack",
-                    "--namespace",
-                    MONITORING_NAMESPACE,
-                    "--create-namespace",
-                    "--set",
-                    "grafana.adminPassword=admin",
-                    "--set",
-                    "grafana.grafana\\.ini.auth\\.anonymous.enabled=true",
-                    "--set",
-                    "grafana.grafana\\.ini.auth\\.anonymous.org_role=Admin",
-                    "--set",
-                    "grafana.grafana\\.ini.auth.disable_login_form=true",
-                    "--wait",
-                    "--timeout",
-                    "10m",
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=600,
-            )
-            if result.returncode == 0:
-                console.print("[green]Monitoring stack installed successfully[/green]")
-
-                # Install DCGM exporter for GPU metrics
-                _install_dcgm_exporter(kubeconfig)
-
-                # Import GPU dashboard
-                _import_gpu_dashboard(kubeconfig)
+    kube = kubeconfig_args(kubeconfig)
+    try:
+        # Check if prometheus-grafana is already installed
+        result = subprocess.run(
+            [_KUBECTL, *kube, "get", "svc", "prometheus-grafana", "-n", MONITORING_NAMESPACE],
+            capture_output=True,
+            check=False,
+            timeout=10,
+            close_fds=False,
+        )
+        if result.returncode == 0:
+            console.print("[dim]Monitoring stack already installed[/dim]")
+            # Still try to install DCGM exporter (idempotent)
+            _install_dcgm_exporter(kubeconfig)
+            return True
 
-                console.print("[dim]Access Grafana with: linto grafana <profile>[/dim]")
-                return True
-            else:
-                console.print(f"[red]Failed to install monitoring stack: {result.stderr}[/red]")
-                return False
-        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-            console.print(f"[red]Error installing monitoring stack: {e}[/red]")
+        console.print(f"[cyan]Installing monitoring stack in namespace '{MONITORING_NAMESPACE}'...[/cyan]")
+
+        # Add prometheus-community repo
+        _ensure_helm_repo("prometheus-community", "https://prometheus-community.github.io/helm-charts")
+
+        # Install kube-prometheus-stack with anonymous access enabled
+        helm_timeout, process_timeout = get_helm_timeout()
+        returncode, output = _run_helm_streaming(
+            [
+                _HELM,
+                *kube,
+                "upgrade",
+                "--install",
+                "prometheus",
+                "prometheus-community/kube-prometheus-stack",
+                "--namespace",
+                MONITORING_NAMESPACE,
+                "--create-namespace",
+                "-f",
+                "-",
+                "--wait",
+                "--timeout",
+                helm_timeout,
+            ],
+            timeout=process_timeout,
+            input=yaml.dump(_MONITORING_VALUES, Dumper=SafeDumper, sort_keys=False),
+        )
+        if returncode == 0:
+            console.print("[green]Monitoring stack installed successfully[/green]")
+
+            # Install DCGM exporter for GPU metrics and import the GPU
+            # dashboard concurrently: they touch disjoint resources
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                steps = [
+                    pool.submit(_install_dcgm_exporter, kubeconfig),
+                    pool.submit(_import_gpu_dashboard, kubeconfig),
+                ]
+            for step in steps:
+                step.result()
+
+            console.print("[dim]Access Grafana with: linto grafana <profile>[/dim]")
+            return True
+        else:
+            console.print(f"[red]Failed to install monitoring stack: {output}[/red]")
             return False
+    except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+        console.print(f"[red]Error installing monitoring stack: {e}[/red]")
+        return False
 
 
 def uninstall_monitoring(kubeconfig: dict | None = None) -> bool:
@@ -473,42 +686,36 @@ def uninstall_monitoring(kubeconfig: dict | None = None) -> bool:
     Returns:
         True if monitoring was uninstalled successfully
     """
-    with KubeconfigContext(kubeconfig):
-        try:
-            # Uninstall DCGM exporter first
-            subprocess.run(
-                [
-                    "helm",
-                    "uninstall",
-                    "dcgm-exporter",
-                    "--namespace",
-                    MONITORING_NAMESPACE,
-                ],
+    kube = kubeconfig_args(kubeconfig)
+    try:
+        # The releases are independent (helm keeps the ServiceMonitor CRD
+        # the exporter relies on), so both uninstalls run concurrently
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            dcgm = pool.submit(
+                subprocess.run,
+                [_HELM, *kube, "uninstall", "dcgm-exporter", "--namespace", MONITORING_NAMESPACE],
                 capture_output=True,
                 check=False,
                 timeout=60,
+                close_fds=False,
             )
-
-            # Uninstall prometheus stack
-            result = subprocess.run(
-                [
-                    "helm",
-                    "uninstall",
-                    "prometheus",
-                    "--namespace",
-                    MONITORING_NAMESPACE,
-                ],
+            prometheus = pool.submit(
+                subprocess.run,
+                [_HELM, *kube, "uninstall", "prometheus", "--namespace", MONITORING_NAMESPACE],
                 capture_output=True,
                 text=True,
                 check=False,
                 timeout=120,
+                close_fds=False,
             )
-            if result.returncode == 0:
-                console.print("[green]Monitoring stack uninstalled[/green]")
-                return True
-            return False
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        dcgm.result()
+        result = prometheus.result()
+        if result.returncode == 0:
+            console.print("[green]Monitoring stack uninstalled[/green]")
+            return True
+        return False
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return False
 
 
 def backup_tls_certificates(
@@ -531,76 +738,76 @@ def backup_tls_certificates(
     Returns:
         True if backup succeeded or no certificates to backup
     """
-    import json
-
     if base_dir is None:
         base_dir = Path.cwd()
 
     backup_dir = base_dir / ".linto" / "certs" / profile_name
     backup_dir.mkdir(parents=True, exist_ok=True)
 
-    with KubeconfigContext(kubeconfig):
-        try:
-            # Get TLS secrets (created by cert-manager)
+    kube = kubeconfig_args(kubeconfig)
+    try:
+        # Get TLS secrets (created by cert-manager)
+        result = subprocess.run(
+            [
+                _KUBECTL,
+                *kube,
+                "get",
+                "secrets",
+                "-n",
+                namespace,
+                "-l",
+                "controller.cert-manager.io/fao=true",
+                "-o",
+                "json",
+            ],
+            capture_output=True,
+            check=False,
+            timeout=30,
+            close_fds=False,
+        )
+
+        if result.returncode != 0:
+            # Try alternative: get secrets of type kubernetes.io/tls
             result = subprocess.run(
                 [
-                    "kubectl",
+                    _KUBECTL,
+                    *kube,
                     "get",
                     "secrets",
                     "-n",
                     namespace,
-                    "-l",
-                    "controller.cert-manager.io/fao=true",
+                    "--field-selector",
+                    "type=kubernetes.io/tls",
                     "-o",
                     "json",
                 ],
                 capture_output=True,
-                text=True,
                 check=False,
                 timeout=30,
+                close_fds=False,
             )
 
-            if result.returncode != 0:
-                # Try alternative: get secrets of type kubernetes.io/tls
-                result = subprocess.run(
-                    [
-                        "kubectl",
-                        "get",
-                        "secrets",
-                        "-n",
-                        namespace,
-                        "--field-selector",
-                        "type=kubernetes.io/tls",
-                        "-o",
-                        "json",
-                    ],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                    timeout=30,
-                )
+        if result.returncode == 0:
+            # Output is kept as raw bytes: it is only parsed to count the
+            # secrets, then saved verbatim (restore reads the same JSON list)
+            items = _json_loads(result.stdout).get("items", [])
 
-            if result.returncode == 0:
-                secrets_data = json.loads(result.stdout)
-                items = secrets_data.get("items", [])
-
-                if items:
-                    # Save secrets
-                    secrets_file = backup_dir / "tls-secrets.json"
-                    with open(secrets_file, "w") as f:
-                        json.dump(secrets_data, f, indent=2)
-                    console.print(f"[green]Backed up {len(items)} TLS certificate(s) to {backup_dir}[/green]")
-                    return True
-                else:
-                    console.print("[dim]No TLS certificates found to backup[/dim]")
-                    return True
-
-            console.print("[dim]Could not retrieve TLS certificates for backup[/dim]")
-            return True  # Not a failure - just no certs
-
-        except Exception as e:
-            console.print(f"[yellow]Warning: Certificate backup failed: {e}[/yellow]")
-            return False
+            if items:
+                # Save secrets
+                secrets_file = backup_dir / "tls-secrets.json"
+                secrets_file.write_bytes(result.stdout)
+                console.print(f"[green]Backed up {len(items)} TLS certificate(s) to {backup_dir}[/green]")
+                return True
+            else:
+                console.print("[dim]No TLS certificates found to backup[/dim]")
+                return True
+
+        console.print("[dim]Could not retrieve TLS certificates for backup[/dim]")
+        return True  # Not a failure - just no certs
+
+    except Exception as e:
+        console.print(f"[yellow]Warning: Certificate backup failed: {e}[/yellow]")
+        return False
 
 
 def restore_tls_certificates(
@@ -620,8 +827,6 @@ def restore_tls_certificates(
     Returns:
         True if restore succeeded or no backup exists
     """
-    import json
-
     if base_dir is None:
         base_dir = Path.cwd()
 
@@ -632,47 +837,73 @@ def restore_tls_certificates(
         console.print("[dim]No certificate backup found - will request new certificates[/dim]")
         return True
 
-    with KubeconfigContext(kubeconfig):
-        try:
-            with open(secrets_file) as f:
-                secrets_data = json.load(f)
+    kube = kubeconfig_args(kubeconfig)
+    try:
+        secrets_data = _json_loads(secrets_file.read_bytes())
 
-            items = secrets_data.get("items", [])
-            if not items:
-                return True
+        items = secrets_data.get("items", [])
+        if not items:
+            return True
 
-            console.print(f"[cyan]Restoring {len(items)} TLS certificate(s) from backup...[/cyan]")
-
-            for secret in items:
-                # Update namespace in metadata
-                secret["metadata"]["namespace"] = namespace
-                # Remove resourceVersion and uid for re-creation
-                secret["metadata"].pop("resourceVersion", None)
-                secret["metadata"].pop("uid", None)
-                secret["metadata"].pop("creationTimestamp", None)
-
-                # Apply the secret
-                secret_json = json.dumps(secret)
-                result = subprocess.run(
-                    ["kubectl", "apply", "-f", "-"],
-                    input=secret_json,
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                    timeout=30,
-                )
+        console.print(f"[cyan]Restoring {len(items)} TLS certificate(s) from backup...[/cyan]")
+
+        for secret in items:
+            # Update namespace in metadata
+            secret["metadata"]["namespace"] = namespace
+            # Remove resourceVersion and uid for re-creation
+            secret["metadata"].pop("resourceVersion", None)
+            secret["metadata"].pop("uid", None)
+            secret["metadata"].pop("creationTimestamp", None)
+            # Server-side apply rejects objects that carry managedFields
+            secret["metadata"].pop("managedFields", None)
+
+        # Apply all secrets at once as a v1 List; `-o name` prints one
+        # "secret/<name>" line per object that was applied. Server-side
+        # apply sends one request per object instead of a client-side
+        # GET + merge PATCH, and takes ownership from earlier managers
+        result = subprocess.run(
+            [
+                _KUBECTL,
+                *kube,
+                "apply",
+                "--server-side",
+                "--field-manager=linto-restore",
+                "--force-conflicts",
+                "--request-timeout=10s",
+                "-o",
+                "name",
+                "-f",
+                "-",
+            ],
+            input=_json_dumps({"apiVersion": "v1", "kind": "List", "items": items}),
+            capture_output=True,
+            check=False,
+            timeout=60,
+            close_fds=False,
+        )
+        applied = set(result.stdout.decode().split())
 
-                secret_name = secret.get("metadata", {}).get("name", "unknown")
-                if result.returncode == 0:
-                    console.print(f"[green]Restored certificate: {secret_name}[/green]")
-                else:
-                    console.print(f"[yellow]Could not restore {secret_name}: {result.stderr}[/yellow]")
+        for secret in items:
+            secret_name = secret.get("metadata", {}).get("name", "unknown")
+            if f"secret/{secret_name}" in applied:
+                console.print(f"[green]Restored certificate: {secret_name}[/green]")
+            else:
+                console.print(f"[yellow]Could not restore {secret_name}: {result.stderr.decode()}[/yellow]")
 
-            return True
+        return True
+
+    except Exception as e:
+        console.print(f"[yellow]Warning: Certificate restore failed: {e}[/yellow]")
+        return False
 
-        except Exception as e:
-            console.print(f"[yellow]Warning: Certificate restore failed: {e}[/yellow]")
-            return False
+
+# Default database versions, used when the profile does not pin a db-<name> tag
+_DB_DEFAULTS = {
+    "mongo": "6.0.2",
+    "postgres": "15-alpine",
+    "redis-stack-server": "latest",
+    "eclipse-mosquitto": "2",
+}
 
 
 def get_service_tag(profile: ProfileConfig, service_name: str) -> str:
@@ -704,14 +935,39 @@ def get_database_tag(profile: ProfileConfig, db_name: str) -> str:
     tag = profile.service_tags.get(f"db-{db_name}")
     if tag:
         return tag
-    # Default database versions
-    defaults = {
-        "mongo": "6.0.2",
-        "postgres": "15-alpine",
-        "redis-stack-server": "latest",
-        "eclipse-mosquitto": "2",
+    return _DB_DEFAULTS.get(db_name, "latest")
+
+
+def _database_values(profile: ProfileConfig, db_name: str, size: str, password: str | None = None) -> dict[str, Any]:
+    """Build the values block for a chart's bundled database.
+
+    Args:
+        profile: Profile configuration
+        db_name: Database name (e.g., 'mongo', 'postgres')
+        size: Persistent volume size
+        password: Database password, or None for charts without one
+
+    Returns:
+        Values dictionary for the database
+    """
+    values: dict[str, Any] = {
+        "enabled": True,
+        "image": {
+            "tag": get_database_tag(profile, db_name),
+        },
+    }
+    if password is not None:
+        values["password"] = password
+    values["persistence"] = {
+        "enabled": True,
+        "size": size,
+    }
+    if profile.k3s_storage_class:
+        values["persistence"]["storageClass"] = profile.k3s_storage_class
+    values["resources"] = {
+        "limits": {},
     }
-    return defaults.get(db_name, "latest")
+    return values
 
 
 def get_llm_service_tag(profile: ProfileConfig, service_name: str) -> str:
@@ -737,44 +993,41 @@ def generate_global_values(profile: ProfileConfig, create_certificate: bool = Tr
     Returns:
         Global values dictionary
     """
-    tls_mode = profile.tls_mode.value if isinstance(profile.tls_mode, TLSMode) else profile.tls_mode
+    tls_mode = profile.tls_mode_str
     tls_enabled = tls_mode != "off"
 
+    tls: dict[str, Any] = {
+        "enabled": tls_enabled,
+        "mode": tls_mode,
+    }
+    if tls_enabled:
+        tls["secretName"] = profile.k3s_tls_secret_name
+        tls["createCertificate"] = create_certificate
+    if tls_mode == "acme" and profile.acme_email:
+        tls["acmeEmail"] = profile.acme_email
+
     global_values: dict[str, Any] = {
         "domain": profile.domain,
         "imageTag": profile.image_tag,
-        "tls": {
-            "enabled": tls_enabled,
-            "mode": tls_mode,
-        },
+        "tls": tls,
     }
 
-    if tls_enabled:
-        global_values["tls"]["secretName"] = profile.k3s_tls_secret_name
-        global_values["tls"]["createCertificate"] = create_certificate
-
-    if tls_mode == "acme" and profile.acme_email:
-        global_values["tls"]["acmeEmail"] = profile.acme_email
-
     if profile.k3s_storage_class:
         global_values["storageClass"] = profile.k3s_storage_class
 
     # Storage configuration
-    if profile.k3s_database_host_path or profile.k3s_files_host_path:
-        global_values["storage"] = {}
-        if profile.k3s_database_host_path:
-            global_values["storage"]["database"] = {
-                "hostPath": profile.k3s_database_host_path,
-            }
-            # Use node_selector if provided, otherwise convert node_role to selector
-            if profile.k3s_database_node_selector:
-                global_values["storage"]["database"]["nodeSelector"] = profile.k3s_database_node_selector
-            elif profile.k3s_database_node_role:
-                global_values["storage"]["database"]["nodeSelector"] = {"linto.ai/role": profile.k3s_database_node_role}
-        if profile.k3s_files_host_path:
-            global_values["storage"]["files"] = {
-                "hostPath": profile.k3s_files_host_path,
-            }
+    storage: dict[str, Any] = {}
+    if profile.k3s_database_host_path:
+        storage["database"] = {"hostPath": profile.k3s_database_host_path}
+        # Use node_selector if provided, otherwise convert node_role to selector
+        if profile.k3s_database_node_selector:
+            storage["database"]["nodeSelector"] = profile.k3s_database_node_selector
+        elif profile.k3s_database_node_role:
+            storage["database"]["nodeSelector"] = {"linto.ai/role": profile.k3s_database_node_role}
+    if profile.k3s_files_host_path:
+        storage["files"] = {"hostPath": profile.k3s_files_host_path}
+    if storage:
+        global_values["storage"] = storage
 
     return global_values
 
@@ -809,6 +1062,7 @@ def generate_studio_values(profile: ProfileConfig) -> dict[str, Any]:
                     "memory": "8Gi",
                 },
             },
+            "secrets": {},
         },
         "studioFrontend": {
             "enabled": True,
@@ -827,77 +1081,57 @@ def generate_studio_values(profile: ProfileConfig) -> dict[str, Any]:
                 "CM_JWT_SECRET": profile.jwt_secret or "",
             },
         },
-        "mongodb": {
-            "enabled": True,
-            "image": {
-                "tag": get_database_tag(profile, "mongo"),
-            },
-            "persistence": {
-                "enabled": True,
-                "size": "10Gi",
-            },
-            "resources": {
-                "limits": {},
-            },
-        },
+        "mongodb": _database_values(profile, "mongo", "10Gi"),
     }
 
+    api_env = values["studioApi"]["env"]
+    api_secrets = values["studioApi"]["secrets"]
+
     # Add service gateway URLs if STT/LLM enabled
     if profile.stt_enabled:
-        values["studioApi"]["env"]["GATEWAY_SERVICES"] = "http://linto-stt-api-gateway:80"
+        api_env["GATEWAY_SERVICES"] = "http://linto-stt-api-gateway:80"
     if profile.llm_enabled:
-        values["studioApi"]["env"]["LLM_GATEWAY_SERVICES"] = "http://linto-llm-llm-api:80"
-
-    if profile.k3s_storage_class:
-        values["mongodb"]["persistence"]["storageClass"] = profile.k3s_storage_class
+        api_env["LLM_GATEWAY_SERVICES"] = "http://linto-llm-llm-api:80"
 
     # Determine URL scheme based on TLS mode
-    tls_mode = profile.tls_mode.value if isinstance(profile.tls_mode, TLSMode) else profile.tls_mode
+    tls_mode = profile.tls_mode_str
     scheme = "https" if tls_mode != "off" else "http"
 
-    # Initialize secrets dict
-    if "secrets" not in values["studioApi"]:
-        values["studioApi"]["secrets"] = {}
-
     # SMTP configuration
     if profile.smtp_enabled:
-        values["studioApi"]["env"]["SMTP_HOST"] = profile.smtp_host or ""
-        values["studioApi"]["env"]["SMTP_PORT"] = str(profile.smtp_port)
-        values["studioApi"]["env"]["SMTP_SECURE"] = str(profile.smtp_secure).lower()
-        values["studioApi"]["env"]["SMTP_REQUIRE_TLS"] = str(profile.smtp_require_tls).lower()
-        values["studioApi"]["env"]["SMTP_AUTH"] = profile.smtp_auth or ""
-        values["studioApi"]["env"]["NO_REPLY_EMAIL"] = profile.smtp_no_reply_email or ""
-        values["studioApi"]["secrets"]["SMTP_PSWD"] = profile.smtp_password or ""
+        api_env["SMTP_HOST"] = profile.smtp_host or ""
+        api_env["SMTP_PORT"] = str(profile.smtp_port)
+        api_env["SMTP_SECURE"] = str(profile.smtp_secure).lower()
+        api_env["SMTP_REQUIRE_TLS"] = str(profile.smtp_require_tls).lower()
+        api_env["SMTP_AUTH"] = profile.smtp_auth or ""
+        api_env["NO_REPLY_EMAIL"] = profile.smtp_no_reply_email or ""
+        api_secrets["SMTP_PSWD"] = profile.smtp_password or ""
 
     # Google OIDC
     if profile.oidc_google_enabled:
-        values["studioApi"]["env"]["OIDC_GOOGLE_ENABLED"] = "true"
-        values["studioApi"]["env"]["GOOGLE_CLIENT_ID"] = profile.oidc_google_client_id or ""
-        values["studioApi"]["env"]["GOOGLE_OIDC_CALLBACK_URI"] = (
-            f"{scheme}://{profile.domain}/cm-api/auth/oidc/google/cb"
-        )
-        values["studioApi"]["secrets"]["GOOGLE_CLIENT_SECRET"] = profile.oidc_google_client_secret or ""
+        api_env["OIDC_GOOGLE_ENABLED"] = "true"
+        api_env["GOOGLE_CLIENT_ID"] = profile.oidc_google_client_id or ""
+        api_env["GOOGLE_OIDC_CALLBACK_URI"] = f"{scheme}://{profile.domain}/cm-api/auth/oidc/google/cb"
+        api_secrets["GOOGLE_CLIENT_SECRET"] = profile.oidc_google_client_secret or ""
 
     # GitHub OIDC
     if profile.oidc_github_enabled:
-        values["studioApi"]["env"]["OIDC_GITHUB_ENABLED"] = "true"
-        values["studioApi"]["env"]["GITHUB_CLIENT_ID"] = profile.oidc_github_client_id or ""
-        values["studioApi"]["env"]["GITHUB_OIDC_CALLBACK_URI"] = (
-            f"{scheme}://{profile.domain}/cm-api/auth/oidc/github/cb"
-        )
-        values["studioApi"]["secrets"]["GITHUB_CLIENT_SECRET"] = profile.oidc_github_client_secret or ""
+        api_env["OIDC_GITHUB_ENABLED"] = "true"
+        api_env["GITHUB_CLIENT_ID"] = profile.oidc_github_client_id or ""
+        api_env["GITHUB_OIDC_CALLBACK_URI"] = f"{scheme}://{profile.domain}/cm-api/auth/oidc/github/cb"
+        api_secrets["GITHUB_CLIENT_SECRET"] = profile.oidc_github_client_secret or ""
 
     # Native OIDC (Linagora)
     if profile.oidc_native_type:
-        values["studioApi"]["env"]["OIDC_TYPE"] = profile.oidc_native_type
-        values["studioApi"]["env"]["OIDC_CLIENT_ID"] = profile.oidc_native_client_id or ""
-        values["studioApi"]["env"]["OIDC_CALLBACK_URI"] = f"{scheme}://{profile.domain}/cm-api/auth/oidc/cb"
-        values["studioApi"]["env"]["OIDC_URL"] = profile.oidc_native_url or ""
-        values["studioApi"]["env"]["OIDC_SCOPE"] = profile.oidc_native_scope
-        values["studioApi"]["secrets"]["OIDC_CLIENT_SECRET"] = profile.oidc_native_client_secret or ""
+        api_env["OIDC_TYPE"] = profile.oidc_native_type
+        api_env["OIDC_CLIENT_ID"] = profile.oidc_native_client_id or ""
+        api_env["OIDC_CALLBACK_URI"] = f"{scheme}://{profile.domain}/cm-api/auth/oidc/cb"
+        api_env["OIDC_URL"] = profile.oidc_native_url or ""
+        api_env["OIDC_SCOPE"] = profile.oidc_native_scope
+        api_secrets["OIDC_CLIENT_SECRET"] = profile.oidc_native_client_secret or ""
         # Native OIDC also uses NO_REPLY_EMAIL
-        if profile.smtp_no_reply_email and "NO_REPLY_EMAIL" not in values["studioApi"]["env"]:
-            values["studioApi"]["env"]["NO_REPLY_EMAIL"] = profile.smtp_no_reply_email
+        if profile.smtp_no_reply_email and "NO_REPLY_EMAIL" not in api_env:
+            api_env["NO_REPLY_EMAIL"] = profile.smtp_no_reply_email
 
     return values
 
@@ -966,33 +1200,8 @@ def generate_stt_values(profile: ProfileConfig) -> dict[str, Any]:
                 "DEVICE": "cuda" if gpu_enabled else "cpu",
             },
         },
-        "redis": {
-            "enabled": True,
-            "image": {
-                "tag": get_database_tag(profile, "redis-stack-server"),
-            },
-            "password": profile.redis_password or "",
-            "persistence": {
-                "enabled": True,
-                "size": "5Gi",
-            },
-            "resources": {
-                "limits": {},
-            },
-        },
-        "mongodb": {
-            "enabled": True,
-            "image": {
-                "tag": get_database_tag(profile, "mongo"),
-            },
-            "persistence": {
-                "enabled": True,
-                "size": "10Gi",
-            },
-            "resources": {
-                "limits": {},
-            },
-        },
+        "redis": _database_values(profile, "redis-stack-server", "5Gi", profile.redis_password or ""),
+        "mongodb": _database_values(profile, "mongo", "10Gi"),
     }
 
     # GPU configuration: use replicasPerGpu for multi-GPU setups
@@ -1008,13 +1217,32 @@ def generate_stt_values(profile: ProfileConfig) -> dict[str, Any]:
         values["diarization"]["replicas"] = 1
         values["diarization"]["resources"] = {}
 
-    if profile.k3s_storage_class:
-        values["redis"]["persistence"]["storageClass"] = profile.k3s_storage_class
-        values["mongodb"]["persistence"]["storageClass"] = profile.k3s_storage_class
-
     return values
 
 
+# Image backing each streaming STT variant
+_STREAMING_STT_IMAGES = {
+    StreamingSTTVariant.WHISPER: "linto-stt-whisper",
+    StreamingSTTVariant.KALDI_FRENCH: "linto-stt-kaldi",
+    StreamingSTTVariant.NEMO_FRENCH: "linto-stt-nemo",
+    StreamingSTTVariant.NEMO_ENGLISH: "linto-stt-nemo",
+    StreamingSTTVariant.KYUTAI: "kyutai-moshi-stt-server-cuda",
+}
+
+# Streaming STT variants that request a GPU when GPU mode is enabled
+_GPU_STT_VARIANTS = frozenset(
+    {
+        StreamingSTTVariant.WHISPER,
+        StreamingSTTVariant.NEMO_FRENCH,
+        StreamingSTTVariant.NEMO_ENGLISH,
+        StreamingSTTVariant.KYUTAI,
+    }
+)
+
+# streamingStt values key for each variant (chart keys use underscores)
+_STREAMING_STT_KEYS = {variant: variant.value.replace("-", "_") for variant in StreamingSTTVariant}
+
+
 def generate_live_values(profile: ProfileConfig) -> dict[str, Any]:
     """Generate values for linto-live chart.
 
@@ -1077,20 +1305,7 @@ def generate_live_values(profile: ProfileConfig) -> dict[str, Any]:
                 },
             },
         },
-        "postgres": {
-            "enabled": True,
-            "image": {
-                "tag": get_database_tag(profile, "postgres"),
-            },
-            "password": profile.session_postgres_password or "",
-            "persistence": {
-                "enabled": True,
-                "size": "10Gi",
-            },
-            "resources": {
-                "limits": {},
-            },
-        },
+        "postgres": _database_values(profile, "postgres", "10Gi", profile.session_postgres_password or ""),
         "broker": {
             "enabled": True,
             "image": {
@@ -1104,32 +1319,17 @@ def generate_live_values(profile: ProfileConfig) -> dict[str, Any]:
     }
 
     # Add streaming STT variants with version tags
-    variant_image_map = {
-        StreamingSTTVariant.WHISPER: "linto-stt-whisper",
-        StreamingSTTVariant.KALDI_FRENCH: "linto-stt-kaldi",
-        StreamingSTTVariant.NEMO_FRENCH: "linto-stt-nemo",
-        StreamingSTTVariant.NEMO_ENGLISH: "linto-stt-nemo",
-        StreamingSTTVariant.KYUTAI: "kyutai-moshi-stt-server-cuda",
-    }
-
     for variant in profile.streaming_stt_variants:
-        variant_key = variant.value.replace("-", "_")
         variant_config: dict[str, Any] = {
             "enabled": True,
             "replicas": 1,
             "image": {
-                "tag": get_service_tag(profile, variant_image_map.get(variant, "linto-stt-whisper")),
+                "tag": get_service_tag(profile, _STREAMING_STT_IMAGES.get(variant, "linto-stt-whisper")),
             },
         }
 
         # GPU services need resource limits
-        gpu_services = [
-            StreamingSTTVariant.WHISPER,
-            StreamingSTTVariant.NEMO_FRENCH,
-            StreamingSTTVariant.NEMO_ENGLISH,
-            StreamingSTTVariant.KYUTAI,
-        ]
-        if variant in gpu_services and gpu_enabled:
+        if gpu_enabled and variant in _GPU_STT_VARIANTS:
             variant_config["resources"] = {
                 "limits": {"nvidia.com/gpu": "1"},
                 "requests": {"nvidia.com/gpu": "1"},
@@ -1139,10 +1339,7 @@ def generate_live_values(profile: ProfileConfig) -> dict[str, Any]:
         if variant == StreamingSTTVariant.KYUTAI and profile.kyutai_gpu_architecture:
             variant_config["gpuArchitecture"] = profile.kyutai_gpu_architecture.value
 
-        values["streamingStt"][variant_key] = variant_config
-
-    if profile.k3s_storage_class:
-        values["postgres"]["persistence"]["storageClass"] = profile.k3s_storage_class
+        values["streamingStt"][_STREAMING_STT_KEYS[variant]] = variant_config
 
     return values
 
@@ -1157,7 +1354,7 @@ def generate_llm_values(profile: ProfileConfig) -> dict[str, Any]:
         Values dictionary for llm chart
     """
     gpu_enabled = profile.gpu_mode != GPUMode.NONE
-    tls_mode = profile.tls_mode.value if isinstance(profile.tls_mode, TLSMode) else profile.tls_mode
+    tls_mode = profile.tls_mode_str
     protocol = "https" if tls_mode != "off" else "http"
 
     # Determine OpenAI API base
@@ -1199,34 +1396,8 @@ def generate_llm_values(profile: ProfileConfig) -> dict[str, Any]:
                 "password": profile.llm_admin_password or "",
             },
         },
-        "postgres": {
-            "enabled": True,
-            "image": {
-                "tag": get_database_tag(profile, "postgres"),
-            },
-            "password": profile.llm_postgres_password or "",
-            "persistence": {
-                "enabled": True,
-                "size": "10Gi",
-            },
-            "resources": {
-                "limits": {},
-            },
-        },
-        "redis": {
-            "enabled": True,
-            "image": {
-                "tag": get_database_tag(profile, "redis-stack-server"),
-            },
-            "password": profile.llm_redis_password or "",
-            "persistence": {
-                "enabled": True,
-                "size": "5Gi",
-            },
-            "resources": {
-                "limits": {},
-            },
-        },
+        "postgres": _database_values(profile, "postgres", "10Gi", profile.llm_postgres_password or ""),
+        "redis": _database_values(profile, "redis-stack-server", "5Gi", profile.llm_redis_password or ""),
         "vllm": {
             "enabled": profile.vllm_enabled,
             "replicas": 1,
@@ -1244,16 +1415,29 @@ def generate_llm_values(profile: ProfileConfig) -> dict[str, Any]:
             "requests": {"nvidia.com/gpu": "1"},
         }
 
-    if profile.k3s_storage_class:
-        values["postgres"]["persistence"]["storageClass"] = profile.k3s_storage_class
-        values["redis"]["persistence"]["storageClass"] = profile.k3s_storage_class
-
     return values
 
 
+# Charts in deployment order: (chart, enabled predicate, values generator)
+_CHART_VALUES: tuple[
+    tuple[str, Callable[[ProfileConfig], bool], Callable[[ProfileConfig], dict[str, Any]]],
+    ...,
+] = (
+    ("studio", lambda profile: profile.studio_enabled, generate_studio_values),
+    ("stt", lambda profile: profile.stt_enabled, generate_stt_values),
+    ("live", lambda profile: profile.live_session_enabled, generate_live_values),
+    ("llm", lambda profile: profile.llm_enabled, generate_llm_values),
+)
+
+
+_CHART_GENERATORS = {chart: generator for chart, _, generator in _CHART_VALUES}
+
+
 def generate_values(profile: ProfileConfig, chart: str) -> dict[str, Any]:
     """Generate values.yaml content for a specific chart.
 
+    Renders are memoized on the profile contents; each call gets its own copy.
+
     Args:
         profile: Profile configuration
         chart: Chart name (studio, stt, live, llm)
@@ -1261,16 +1445,42 @@ def generate_values(profile: ProfileConfig, chart: str) -> dict[str, Any]:
     Returns:
         Values dictionary
     """
-    if chart == "studio":
-        return generate_studio_values(profile)
-    elif chart == "stt":
-        return generate_stt_values(profile)
-    elif chart == "live":
-        return generate_live_values(profile)
-    elif chart == "llm":
-        return generate_llm_values(profile)
-    else:
+    if chart not in _CHART_GENERATORS:
         raise ValueError(f"Unknown chart: {chart}")
+    return copy.deepcopy(_chart_values_cached(chart, profile.model_dump_json()))
+
+
+@functools.lru_cache(maxsize=16)
+def _chart_values_cached(chart: str, profile_json: str) -> dict[str, Any]:
+    """Render a chart for a profile given as its JSON dump (shared result, do not mutate)."""
+    return _CHART_GENERATORS[chart](ProfileConfig.model_validate_json(profile_json))
+
+
+@functools.cache
+def _renderer_digest() -> bytes:
+    """Digest of this module's source, so renders are redone when it changes."""
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).digest()
+
+
+def _render_digest(profile_json: str) -> str:
+    """Fingerprint of a render: the profile contents and the renderer version."""
+    return hashlib.blake2b(_renderer_digest() + profile_json.encode(), digest_size=16).hexdigest()
+
+
+def _values_current(values_dir: Path, chart: str, digest: str) -> bool:
+    """Check whether a chart's values file is an untouched render for the given digest.
+
+    The sidecar records the render digest followed by a digest of the written
+    bytes, so hand-edited or corrupted values files are rendered again.
+    """
+    values_path = values_dir / f"{chart}-values.yaml"
+    digest_path = values_dir / f"{chart}-values.yaml.hash"
+    try:
+        recorded = digest_path.read_text().split()
+        data = values_path.read_bytes()
+    except OSError:
+        return False
+    return recorded == [digest, hashlib.blake2b(data, digest_size=16).hexdigest()]
 
 
 def render_k3s(profile: ProfileConfig, output_dir: Path) -> dict[str, Path]:
@@ -1286,41 +1496,32 @@ def render_k3s(profile: ProfileConfig, output_dir: Path) -> dict[str, Path]:
     values_dir = output_dir / "values"
     values_dir.mkdir(parents=True, exist_ok=True)
 
-    generated_files: dict[str, Path] = {}
-
-    # Generate studio values
-    if profile.studio_enabled:
-        values = generate_studio_values(profile)
-        values_path = values_dir / "studio-values.yaml"
-        with values_path.open("w") as f:
-            yaml.dump(values, f, default_flow_style=False, sort_keys=False)
-        generated_files["studio"] = values_path
-
-    # Generate STT values
-    if profile.stt_enabled:
-        values = generate_stt_values(profile)
-        values_path = values_dir / "stt-values.yaml"
-        with values_path.open("w") as f:
-            yaml.dump(values, f, default_flow_style=False, sort_keys=False)
-        generated_files["stt"] = values_path
-
-    # Generate Live values
-    if profile.live_session_enabled:
-        values = generate_live_values(profile)
-        values_path = values_dir / "live-values.yaml"
-        with values_path.open("w") as f:
-            yaml.dump(values, f, default_flow_style=False, sort_keys=False)
-        generated_files["live"] = values_path
-
-    # Generate LLM values
-    if profile.llm_enabled:
-        values = generate_llm_values(profile)
-        values_path = values_dir / "llm-values.yaml"
-        with values_path.open("w") as f:
-            yaml.dump(values, f, default_flow_style=False, sort_keys=False)
-        generated_files["llm"] = values_path
-
-    return generated_files
+    charts = [chart for chart, enabled, _ in _CHART_VALUES if enabled(profile)]
+    profile_json = profile.model_dump_json()
+    digest = _render_digest(profile_json)
+
+    def _write_values(chart: str) -> Path:
+        values_path = values_dir / f"{chart}-values.yaml"
+        # A values file is rewritten only when its recorded render digest is
+        # stale (profile or renderer changed) or the file is missing or modified
+        if _values_current(values_dir, chart, digest):
+            return values_path
+        # Only dumped here, so the shared cached render is safe. The dumper
+        # encodes the document to bytes in memory, which are written in one
+        # call rather than streamed to the file in per-scalar chunks
+        values = _chart_values_cached(chart, profile_json)
+        data = yaml.dump(values, Dumper=SafeDumper, default_flow_style=False, sort_keys=False, encoding="utf-8")
+        values_path.write_bytes(data)
+        data_digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        (values_dir / f"{chart}-values.yaml.hash").write_text(f"{digest} {data_digest}")
+        return values_path
+
+    # Charts are independent: generate and write them concurrently, keeping
+    # the results in chart order
+    with ThreadPoolExecutor(max_workers=len(_CHART_VALUES)) as pool:
+        paths = list(pool.map(_write_values, charts))
+
+    return dict(zip(charts, paths))
 
 
 def generate_k3s(
@@ -1375,7 +1576,7 @@ def _print_summary(
     table.add_column("Setting", style="cyan")
     table.add_column("Value", style="green")
 
-    tls_mode = profile.tls_mode.value if isinstance(profile.tls_mode, TLSMode) else profile.tls_mode
+    tls_mode = profile.tls_mode_str
 
     table.add_row("Profile", profile.name)
     table.add_row("Backend", "Kubernetes (k3s/Helm)")
@@ -1399,6 +1600,24 @@ def _print_summary(
         console.print(f"  - {chart}: {path}")
 
 
+def _deploy_one(chart_name: str, cmd: list[str], process_timeout: int) -> tuple[str, bool, str]:
+    """Run one chart's helm upgrade without printing anything.
+
+    Runs on a worker thread; the caller displays the command and the outcome.
+
+    Returns:
+        Tuple of (chart name, success, failure message)
+    """
+    try:
+        result = run_cmd(cmd, check=False, timeout=process_timeout, show=False, close_fds=False)
+    except subprocess.TimeoutExpired:
+        return chart_name, False, f"{chart_name} deployment timed out"
+
+    if result.returncode != 0:
+        return chart_name, False, f"Failed to deploy {chart_name}: {result.stderr}"
+    return chart_name, True, ""
+
+
 def apply_k3s(profile_name: str, base_dir: Path | None = None) -> None:
     """Apply a deployment profile using Helm.
 
@@ -1426,89 +1645,102 @@ def apply_k3s(profile_name: str, base_dir: Path | None = None) -> None:
         )
 
     # All kubectl/helm operations use the profile's kubeconfig
-    with KubeconfigContext(kubeconfig):
-        # Ensure namespace exists
-        if not ensure_namespace(namespace, kubeconfig):
-            raise ValidationError(
-                "NAMESPACE_CREATION_FAILED",
-                f"Failed to create namespace '{namespace}'",
-            )
-
-        # Install cert-manager if requested and using ACME
-        tls_mode = profile.tls_mode.value if isinstance(profile.tls_mode, TLSMode) else profile.tls_mode
-        if tls_mode == "acme" and profile.k3s_install_cert_manager:
-            if not install_cert_manager(kubeconfig):
-                console.print("[yellow]Warning: cert-manager installation failed[/yellow]")
+    kube = kubeconfig_args(kubeconfig)
 
-        # Restore TLS certificates from backup (if available)
-        if tls_mode == "acme":
-            restore_tls_certificates(namespace, profile_name, base_dir, kubeconfig)
+    # Ensure namespace exists
+    if not ensure_namespace(namespace, kubeconfig):
+        raise ValidationError(
+            "NAMESPACE_CREATION_FAILED",
+            f"Failed to create namespace '{namespace}'",
+        )
 
-        # Always regenerate values to ensure profile changes are applied
-        k3s_dir = base_dir / ".linto" / "render" / "k3s" / profile_name
-        values_dir = k3s_dir / "values"
+    # Install cert-manager if requested and using ACME
+    tls_mode = profile.tls_mode_str
+    if tls_mode == "acme" and profile.k3s_install_cert_manager:
+        if not install_cert_manager(kubeconfig):
+            console.print("[yellow]Warning: cert-manager installation failed[/yellow]")
+
+    # Restore TLS certificates from backup (if available)
+    if tls_mode == "acme":
+        restore_tls_certificates(namespace, profile_name, base_dir, kubeconfig)
+
+    # Regenerate values unless every enabled chart was already rendered from
+    # this exact profile (a profile missing secrets never matches, since the
+    # render records the profile after secrets are filled in)
+    k3s_dir = base_dir / ".linto" / "render" / "k3s" / profile_name
+    values_dir = k3s_dir / "values"
+    digest = _render_digest(profile.model_dump_json())
+    if all(_values_current(values_dir, chart, digest) for chart, enabled, _ in _CHART_VALUES if enabled(profile)):
+        console.print("[dim]Values files are up to date with the profile, skipping render[/dim]")
+    else:
         generate_k3s(profile_name, base_dir=base_dir)
 
-        console.print(f"[cyan]Deploying to namespace '{namespace}'...[/cyan]")
-
-        # Deploy each enabled chart
-        charts_to_deploy = []
-        if profile.studio_enabled:
-            charts_to_deploy.append(("linto-studio", "studio-values.yaml"))
-        if profile.stt_enabled:
-            charts_to_deploy.append(("linto-stt", "stt-values.yaml"))
-        if profile.live_session_enabled:
-            charts_to_deploy.append(("linto-live", "live-values.yaml"))
-        if profile.llm_enabled:
-            charts_to_deploy.append(("linto-llm", "llm-values.yaml"))
-
-        for chart_name, values_file in charts_to_deploy:
-            chart_path = get_charts_dir() / chart_name
-            values_path = values_dir / values_file
+    console.print(f"[cyan]Deploying to namespace '{namespace}'...[/cyan]")
 
-            if not chart_path.exists():
-                console.print(f"[red]Chart not found: {chart_path}[/red]")
-                continue
-
-            if not values_path.exists():
-                console.print(f"[yellow]Values file not found: {values_path}[/yellow]")
-                continue
-
-            release_name = f"linto-{chart_name.replace('linto-', '')}"
-
-            console.print(f"[cyan]Installing/upgrading {chart_name}...[/cyan]")
-
-            try:
-                result = run_cmd(
-                    [
-                        "helm",
-                        "upgrade",
-                        "--install",
-                        release_name,
-                        str(chart_path),
-                        "--namespace",
-                        namespace,
-                        "--values",
-                        str(values_path),
-                        "--wait",
-                        "--timeout",
-                        "10m",
-                    ],
-                    check=False,
-                    timeout=600,
-                )
-
-                if result.returncode != 0:
-                    console.print(f"[red]Failed to deploy {chart_name}: {result.stderr}[/red]")
-                else:
-                    console.print(f"[green]{chart_name} deployed successfully[/green]")
-            except subprocess.TimeoutExpired:
-                console.print(f"[red]{chart_name} deployment timed out[/red]")
+    # Deploy each enabled chart
+    charts_to_deploy = []
+    if profile.studio_enabled:
+        charts_to_deploy.append(("linto-studio", "studio-values.yaml"))
+    if profile.stt_enabled:
+        charts_to_deploy.append(("linto-stt", "stt-values.yaml"))
+    if profile.live_session_enabled:
+        charts_to_deploy.append(("linto-live", "live-values.yaml"))
+    if profile.llm_enabled:
+        charts_to_deploy.append(("linto-llm", "llm-values.yaml"))
+
+    helm_timeout, process_timeout = get_helm_timeout()
+
+    deployable = []
+    for chart_name, values_file in charts_to_deploy:
+        chart_path = get_charts_dir() / chart_name
+        values_path = values_dir / values_file
+
+        if not chart_path.exists():
+            console.print(f"[red]Chart not found: {chart_path}[/red]")
+            continue
+
+        if not values_path.exists():
+            console.print(f"[yellow]Values file not found: {values_path}[/yellow]")
+            continue
+
+        release_name = f"linto-{chart_name.replace('linto-', '')}"
+        cmd = [
+            _HELM,
+            *kube,
+            "upgrade",
+            "--install",
+            release_name,
+            str(chart_path),
+            "--namespace",
+            namespace,
+            "--values",
+            str(values_path),
+            "--wait",
+            "--timeout",
+            helm_timeout,
+        ]
 
-        # Deploy monitoring if enabled
-        if profile.monitoring_enabled:
-            if not install_monitoring(kubeconfig):
-                console.print("[yellow]Warning: Monitoring installation failed[/yellow]")
+        console.print(f"[cyan]Installing/upgrading {chart_name}...[/cyan]")
+        if get_show_commands():
+            stderr_console.print(f"[dim]$ {' '.join(quote_arg(arg) for arg in cmd)}[/dim]")
+        deployable.append((chart_name, cmd))
+
+    # The charts and the monitoring stack do not depend on each other, so their
+    # --wait periods overlap. Chart workers print nothing: the monitoring
+    # install streams its output from this thread, and the chart results are
+    # printed here once it is done, so the two never interleave.
+    with ThreadPoolExecutor(max_workers=max(len(deployable), 1)) as pool:
+        deployments = [pool.submit(_deploy_one, chart_name, cmd, process_timeout) for chart_name, cmd in deployable]
+
+        if profile.monitoring_enabled and not install_monitoring(kubeconfig):
+            console.print("[yellow]Warning: Monitoring installation failed[/yellow]")
+
+        for future in as_completed(deployments):
+            chart_name, ok, message = future.result()
+            if ok:
+                console.print(f"[green]{chart_name} deployed successfully[/green]")
+            else:
+                console.print(f"[red]{message}[/red]")
 
     console.print("[green]Deployment complete![/green]")
     console.print(f"[cyan]Access at: https://{profile.domain}[/cyan]")
@@ -1547,66 +1779,85 @@ def destroy_k3s(
         )
 
     # All kubectl/helm operations use the profile's kubeconfig
-    with KubeconfigContext(kubeconfig):
-        # Backup TLS certificates before destroying (to avoid Let's Encrypt rate limits)
-        tls_mode = profile.tls_mode.value if isinstance(profile.tls_mode, TLSMode) else profile.tls_mode
-        if tls_mode == "acme":
-            console.print("[cyan]Backing up TLS certificates...[/cyan]")
-            backup_tls_certificates(namespace, profile_name, base_dir, kubeconfig)
+    kube = kubeconfig_args(kubeconfig)
 
-        console.print(f"[yellow]Removing deployment from namespace '{namespace}'...[/yellow]")
+    # Backup TLS certificates before destroying (to avoid Let's Encrypt rate limits)
+    tls_mode = profile.tls_mode_str
+    if tls_mode == "acme":
+        console.print("[cyan]Backing up TLS certificates...[/cyan]")
+        backup_tls_certificates(namespace, profile_name, base_dir, kubeconfig)
 
-        # Uninstall monitoring if it was deployed
-        if profile.monitoring_enabled:
-            uninstall_monitoring(kubeconfig)
+    console.print(f"[yellow]Removing deployment from namespace '{namespace}'...[/yellow]")
 
-        # Uninstall each chart
-        charts = ["linto-studio", "linto-stt", "linto-live", "linto-llm"]
-        for chart_name in charts:
-            release_name = f"linto-{chart_name.replace('linto-', '')}"
+    # Uninstall monitoring if it was deployed
+    if profile.monitoring_enabled:
+        uninstall_monitoring(kubeconfig)
 
-            try:
-                result = run_cmd(
-                    [
-                        "helm",
-                        "uninstall",
-                        release_name,
-                        "--namespace",
-                        namespace,
-                    ],
-                    check=False,
-                    timeout=120,
-                )
-                if result.returncode == 0:
+    # Uninstall the LinTO releases in one helm call. helm stops at the first
+    # release it cannot find, so only releases present in the namespace are
+    # passed; --all keeps pending and failed releases in the listing.
+    releases = ["linto-studio", "linto-stt", "linto-live", "linto-llm"]
+    try:
+        listed = run_cmd(
+            [_HELM, *kube, "list", "--namespace", namespace, "--all", "--short"],
+            check=False,
+            timeout=30,
+            close_fds=False,
+        )
+        present = set(listed.stdout.split()) if listed.returncode == 0 else set(releases)
+        to_uninstall = [release for release in releases if release in present]
+
+        skipped = [release for release in releases if release not in present]
+        if skipped:
+            console.print(f"[dim]Not installed, skipping: {', '.join(skipped)}[/dim]")
+
+        if to_uninstall:
+            result = run_cmd(
+                [
+                    _HELM,
+                    *kube,
+                    "uninstall",
+                    *to_uninstall,
+                    "--namespace",
+                    namespace,
+                ],
+                check=False,
+                timeout=120 * len(to_uninstall),
+                close_fds=False,
+            )
+            if result.returncode == 0:
+                for release_name in to_uninstall:
                     console.print(f"[green]Uninstalled {release_name}[/green]")
-            except subprocess.TimeoutExpired:
-                console.print(f"[red]{release_name} uninstall timed out[/red]")
+            else:
+                console.print(f"[red]Failed to uninstall releases: {result.stderr}[/red]")
+    except subprocess.TimeoutExpired:
+        console.print("[red]Release uninstall timed out[/red]")
 
-        # Remove PVCs if requested
-        if remove_volumes:
-            console.print("[yellow]Removing PVCs...[/yellow]")
-            try:
-                subprocess.run(
-                    [
-                        "kubectl",
-                        "delete",
-                        "pvc",
-                        "--all",
-                        "--namespace",
-                        namespace,
-                    ],
-                    capture_output=True,
-                    check=False,
-                    timeout=120,
-                )
-                console.print("[green]PVCs removed[/green]")
-            except subprocess.TimeoutExpired:
-                console.print("[red]PVC removal timed out[/red]")
+    # Remove PVCs if requested
+    if remove_volumes:
+        console.print("[yellow]Removing PVCs...[/yellow]")
+        try:
+            subprocess.run(
+                [
+                    _KUBECTL,
+                    *kube,
+                    "delete",
+                    "pvc",
+                    "--all",
+                    "--namespace",
+                    namespace,
+                ],
+                capture_output=True,
+                check=False,
+                timeout=120,
+                close_fds=False,
+            )
+            console.print("[green]PVCs removed[/green]")
+        except subprocess.TimeoutExpired:
+            console.print("[red]PVC removal timed out[/red]")
 
     # Remove generated files if requested
     if remove_files:
-        import shutil
-
         k3s_dir = base_dir / ".linto" / "render" / "k3s" / profile_name
         if k3s_dir.exists():
             shutil.rmtree(k3s_dir)
@@ -1647,100 +1898,95 @@ def status_k3s(
     services = []
 
     # All kubectl/helm operations use the profile's kubeconfig
-    with KubeconfigContext(kubeconfig):
-        try:
-            # Get helm releases
-            result = run_cmd(
-                [
-                    "helm",
-                    "list",
-                    "--namespace",
-                    namespace,
-                    "--output",
-                    "json",
-                ],
-                check=False,
-                timeout=30,
-            )
-
-            if result.returncode == 0 and result.stdout.strip():
-                import json
-
-                releases = json.loads(result.stdout)
-                for release in releases:
-                    services.append(
-                        {
-                            "name": release.get("name", "unknown"),
-                            "status": release.get("status", "unknown"),
-                            "revision": release.get("revision", "0"),
-                            "chart": release.get("chart", "unknown"),
-                        }
-                    )
-
-            # Get pods
-            result = run_cmd(
-                [
-                    "kubectl",
-                    "get",
-                    "pods",
-                    "--namespace",
-                    namespace,
-                    "-o",
-                    "json",
-                ],
-                check=False,
-                timeout=30,
-            )
-
-            if result.returncode == 0 and result.stdout.strip():
-                import json
+    kube = kubeconfig_args(kubeconfig)
+
+    # Helm releases and pods are independent queries, so both run concurrently.
+    # Output is kept as bytes and parsed straight from the CLIs, with orjson
+    # when available
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        helm_list = pool.submit(
+            run_cmd,
+            [_HELM, *kube, "list", "--namespace", namespace, "--output", "json"],
+            check=False,
+            text=False,
+            timeout=30,
+            close_fds=False,
+        )
+        pods_list = pool.submit(
+            run_cmd,
+            [_KUBECTL, *kube, "get", "pods", "--namespace", namespace, "-o", "json"],
+            check=False,
+            text=False,
+            timeout=30,
+            close_fds=False,
+        )
 
-                pods_data = json.loads(result.stdout)
-                for pod in pods_data.get("items", []):
-                    pod_name = pod.get("metadata", {}).get("name", "unknown")
-                    creation_timestamp = pod.get("metadata", {}).get("creationTimestamp")
-                    phase = pod.get("status", {}).get("phase", "unknown")
+    try:
+        # Get helm releases
+        result = helm_list.result()
+
+        if result.returncode == 0 and result.stdout.strip():
+            releases = _json_loads(result.stdout)
+            for release in releases:
+                services.append(
+                    {
+                        "name": release.get("name", "unknown"),
+                        "status": release.get("status", "unknown"),
+                        "revision": release.get("revision", "0"),
+                        "chart": release.get("chart", "unknown"),
+                    }
+                )
 
-                    # Get detailed status from containerStatuses
-                    detailed_status = None
-                    container_statuses = pod.get("status", {}).get("containerStatuses", [])
-                    for cs in container_statuses:
+        # Get pods
+        result = pods_list.result()
+
+        if result.returncode == 0 and result.stdout.strip():
+            pods_data = _json_loads(result.stdout)
+            for pod in pods_data.get("items", []):
+                pod_name = pod.get("metadata", {}).get("name", "unknown")
+                creation_timestamp = pod.get("metadata", {}).get("creationTimestamp")
+                phase = pod.get("status", {}).get("phase", "unknown")
+
+                # Get detailed status from containerStatuses
+                detailed_status = None
+                container_statuses = pod.get("status", {}).get("containerStatuses", [])
+                for cs in container_statuses:
+                    state = cs.get("state", {})
+                    if "waiting" in state:
+                        reason = state["waiting"].get("reason", "Waiting")
+                        detailed_status = reason
+                        break
+                    elif "terminated" in state:
+                        reason = state["terminated"].get("reason", "Terminated")
+                        detailed_status = reason
+                        break
+
+                # Check init containers too (image pull often happens there)
+                if not detailed_status:
+                    init_statuses = pod.get("status", {}).get("initContainerStatuses", [])
+                    for cs in init_statuses:
                         state = cs.get("state", {})
                         if "waiting" in state:
                             reason = state["waiting"].get("reason", "Waiting")
-                            detailed_status = reason
-                            break
-                        elif "terminated" in state:
-                            reason = state["terminated"].get("reason", "Terminated")
-                            detailed_status = reason
+                            detailed_status = f"Init:{reason}"
                             break
 
-                    # Check init containers too (image pull often happens there)
-                    if not detailed_status:
-                        init_statuses = pod.get("status", {}).get("initContainerStatuses", [])
-                        for cs in init_statuses:
-                            state = cs.get("state", {})
-                            if "waiting" in state:
-                                reason = state["waiting"].get("reason", "Waiting")
-                                detailed_status = f"Init:{reason}"
-                                break
-
-                    # Check if pod is terminating (deletionTimestamp set)
-                    if pod.get("metadata", {}).get("deletionTimestamp"):
-                        detailed_status = "Terminating"
-
-                    services.append(
-                        {
-                            "name": f"pod/{pod_name}",
-                            "status": phase,
-                            "detailed_status": detailed_status,
-                            "creation_timestamp": creation_timestamp,
-                            "type": "pod",
-                        }
-                    )
-
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+                # Check if pod is terminating (deletionTimestamp set)
+                if pod.get("metadata", {}).get("deletionTimestamp"):
+                    detailed_status = "Terminating"
+
+                services.append(
+                    {
+                        "name": f"pod/{pod_name}",
+                        "status": phase,
+                        "detailed_status": detailed_status,
+                        "creation_timestamp": creation_timestamp,
+                        "type": "pod",
+                    }
+                )
+
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        pass
 
     return services
 
@@ -1785,8 +2031,10 @@ def logs_k3s(
             "Service/pod name is required for k3s logs",
         )
 
+    # All kubectl operations use the profile's kubeconfig
     cmd = [
-        "kubectl",
+        _KUBECTL,
+        *kubeconfig_args(kubeconfig),
         "logs",
         "--namespace",
         namespace,
@@ -1804,29 +2052,25 @@ def logs_k3s(
         # Try to find matching pod
         cmd.extend(["-l", f"app.kubernetes.io/name={service}"])
 
-    # All kubectl operations use the profile's kubeconfig
-    with KubeconfigContext(kubeconfig):
-        try:
-            if follow:
-                # For follow mode, print command then use Popen
-                from linto.utils.cmd import get_show_commands, quote_arg
-
-                if get_show_commands():
-                    cmd_str = " ".join(quote_arg(arg) for arg in cmd)
-                    stderr_console.print(f"[dim]$ {cmd_str}[/dim]")
-                process = subprocess.Popen(cmd)
-                try:
-                    process.wait()
-                except KeyboardInterrupt:
-                    process.terminate()
-                    console.print("\n[yellow]Stopped following logs.[/yellow]")
-            else:
-                run_cmd(cmd, check=False, capture_output=False)
-        except subprocess.SubprocessError as e:
-            raise ValidationError(
-                "LOGS_FAILED",
-                f"kubectl logs failed: {e}",
-            ) from e
+    try:
+        if follow:
+            # For follow mode, print command then use Popen
+            if get_show_commands():
+                cmd_str = " ".join(quote_arg(arg) for arg in cmd)
+                stderr_console.print(f"[dim]$ {cmd_str}[/dim]")
+            process = subprocess.Popen(cmd, close_fds=False)
+            try:
+                process.wait()
+            except KeyboardInterrupt:
+                process.terminate()
+                console.print("\n[yellow]Stopped following logs.[/yellow]")
+        else:
+            run_cmd(cmd, check=False, capture_output=False, close_fds=False)
+    except subprocess.SubprocessError as e:
+        raise ValidationError(
+            "LOGS_FAILED",
+            f"kubectl logs failed: {e}",
+        ) from e
 
 
 # Module-level exports matching Backend protocol
@@ -41,7 +41,7 @@ from linto.catalog.services import (
     _vllm_service,
     get_streaming_stt_service,
 )
-from linto.model.profile import ProfileConfig, TLSMode
+from linto.model.profile import ProfileConfig
 from linto.model.validation import ValidationError, load_profile, save_profile
 from linto.tls.mkcert import generate_certs
 from linto.utils.docker import run_docker_stack_deploy, run_docker_stack_rm
@@ -68,7 +68,7 @@ def render_stack(profile: ProfileConfig) -> dict[str, Any]:
     }
     volumes: dict[str, Any] = {}
 
-    tls_mode = profile.tls_mode.value if isinstance(profile.tls_mode, TLSMode) else profile.tls_mode
+    tls_mode = profile.tls_mode_str
 
     # Always add traefik
     traefik = _traefik_service(profile.domain, tls_mode)
@@ -274,7 +274,7 @@ def generate_stack(
     profile = generate_secrets(profile)
     save_profile(profile, base_dir)
 
-    tls_mode = profile.tls_mode.value if isinstance(profile.tls_mode, TLSMode) else profile.tls_mode
+    tls_mode = profile.tls_mode_str
 
     # Determine output directory
     if output_dir:
@@ -295,8 +295,7 @@ def generate_stack(
         traefik_dynamic_dir.mkdir(parents=True, exist_ok=True)
         dynamic_config = generate_traefik_dynamic_config(profile.domain)
         dynamic_config_path = traefik_dynamic_dir / "tls.yml"
-        with dynamic_config_path.open("w") as f:
-            yaml.dump(dynamic_config, f, default_flow_style=False)
+        dynamic_config_path.write_text(yaml.dump(dynamic_config, default_flow_style=False))
 
     elif tls_mode == "acme":
         # Setup ACME storage
@@ -323,8 +322,7 @@ def generate_stack(
             traefik_dynamic_dir.mkdir(parents=True, exist_ok=True)
             dynamic_config = generate_traefik_dynamic_config(profile.domain)
             dynamic_config_path = traefik_dynamic_dir / "tls.yml"
-            with dynamic_config_path.open("w") as f:
-                yaml.dump(dynamic_config, f, default_flow_style=False)
+            dynamic_config_path.write_text(yaml.dump(dynamic_config, default_flow_style=False))
 
     # Create LLM config directories if LLM enabled
     if profile.llm_enabled:
@@ -338,8 +336,7 @@ def generate_stack(
 
     # Write stack.yml
     stack_path = stack_dir / "stack.yml"
-    with stack_path.open("w") as f:
-        yaml.dump(stack_dict, f, default_flow_style=False, sort_keys=False)
+    stack_path.write_text(yaml.dump(stack_dict, default_flow_style=False, sort_keys=False))
 
     # Print summary
     _print_summary(profile, stack_path)
@@ -353,7 +350,7 @@ def _print_summary(profile: ProfileConfig, stack_path: Path) -> None:
     table.add_column("Setting", style="cyan")
     table.add_column("Value", style="green")
 
-    tls_mode = profile.tls_mode.value if isinstance(profile.tls_mode, TLSMode) else profile.tls_mode
+    tls_mode = profile.tls_mode_str
 
     table.add_row("Profile", profile.name)
     table.add_row("Backend", "Docker Swarm")
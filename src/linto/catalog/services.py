@@ -1,5 +1,7 @@
 """Service definitions catalog."""
 
+import functools
+
 from linto.model.profile import GPUArchitecture, StreamingSTTVariant
 from linto.model.service import (
     DeployConfig,
@@ -47,11 +49,16 @@ def get_networks_for_swarm() -> dict:
     }
 
 
+# Factories decorated with functools.lru_cache only depend on hashable str
+# arguments and return frozen ServiceDefinition instances, so repeated renders
+# share them instead of rebuilding identical definitions
+
 # ============================================================================
 # Infrastructure Services
 # ============================================================================
 
 
+@functools.lru_cache(maxsize=32)
 def _api_gateway_service(image_tag: str) -> ServiceDefinition:
     """Create API Gateway service definition for STT routing.
 
@@ -81,6 +88,7 @@ def _api_gateway_service(image_tag: str) -> ServiceDefinition:
     )
 
 
+@functools.lru_cache(maxsize=32)
 def _traefik_service(domain: str, tls_mode: str) -> ServiceDefinition:
     """Create Traefik service definition."""
     volumes = [
@@ -182,6 +190,7 @@ def _traefik_service(domain: str, tls_mode: str) -> ServiceDefinition:
 # ============================================================================
 
 
+@functools.lru_cache(maxsize=32)
 def _studio_mongodb_service() -> ServiceDefinition:
     """Create Studio MongoDB service definition."""
     return ServiceDefinition(
@@ -340,6 +349,7 @@ def _studio_websocket_service(
 # ============================================================================
 
 
+@functools.lru_cache(maxsize=32)
 def _stt_mongo_service() -> ServiceDefinition:
     """Create STT MongoDB service definition."""
     return ServiceDefinition(
@@ -360,6 +370,7 @@ def _stt_mongo_service() -> ServiceDefinition:
     )
 
 
+@functools.lru_cache(maxsize=32)
 def _task_broker_redis_service(redis_password: str) -> ServiceDefinition:
     """Create Redis task broker service definition."""
     return ServiceDefinition(
@@ -487,6 +498,7 @@ def _diarization_pyannote_service(
 # ============================================================================
 
 
+@functools.lru_cache(maxsize=32)
 def _session_postgres_service(password: str) -> ServiceDefinition:
     """Create Session PostgreSQL service definition."""
     return ServiceDefinition(
@@ -545,6 +557,7 @@ def _session_postgres_migration_service(
     )
 
 
+@functools.lru_cache(maxsize=32)
 def _session_broker_service() -> ServiceDefinition:
     """Create Session MQTT broker service definition."""
     return ServiceDefinition(
@@ -822,6 +835,7 @@ def get_streaming_stt_service(
 # ============================================================================
 
 
+@functools.lru_cache(maxsize=32)
 def _llm_postgres_service(password: str) -> ServiceDefinition:
     """Create LLM PostgreSQL service definition."""
     return ServiceDefinition(
@@ -852,6 +866,7 @@ def _llm_postgres_service(password: str) -> ServiceDefinition:
     )
 
 
+@functools.lru_cache(maxsize=32)
 def _llm_redis_service(password: str) -> ServiceDefinition:
     """Create LLM Redis service definition."""
     return ServiceDefinition(
@@ -956,6 +971,7 @@ def _llm_gateway_frontend_service(
     )
 
 
+@functools.lru_cache(maxsize=32)
 def _vllm_service() -> ServiceDefinition:
     """Create vLLM service definition."""
     return ServiceDefinition(
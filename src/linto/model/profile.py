@@ -198,6 +198,11 @@ class ProfileConfig(BaseModel):
             raise ValueError(msg)
         return v
 
+    @property
+    def tls_mode_str(self) -> str:
+        """TLS mode as a plain string, as consumed by the renderers."""
+        return self.tls_mode.value if isinstance(self.tls_mode, TLSMode) else self.tls_mode
+
     @field_validator("super_admin_password")
     @classmethod
     def validate_password(cls, v: str | None) -> str | None:
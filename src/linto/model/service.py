@@ -2,7 +2,7 @@
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class VolumeMount(BaseModel):
@@ -60,6 +60,9 @@ class DeployConfig(BaseModel):
 class ServiceDefinition(BaseModel):
     """Definition of a Docker service."""
 
+    # Immutable so catalog factories can safely return cached instances
+    model_config = ConfigDict(frozen=True)
+
     name: str
     category: Literal["studio", "stt", "infra", "live", "llm"]
     image: str
@@ -1,5 +1,7 @@
 """Kubeconfig utilities for embedded cluster credentials."""
 
+import atexit
+import functools
 import os
 import tempfile
 from pathlib import Path
@@ -72,6 +74,34 @@ def extract_current_context() -> dict[str, Any] | None:
         return None
 
 
+@functools.lru_cache(maxsize=8)
+def _materialize_kubeconfig(content: str) -> Path:
+    """Write kubeconfig YAML to a private temp file removed at exit."""
+    fd, path = tempfile.mkstemp(suffix=".yaml", prefix="kubeconfig-")
+    with os.fdopen(fd, "w") as f:
+        f.write(content)
+    atexit.register(Path(path).unlink, missing_ok=True)
+    return Path(path)
+
+
+def kubeconfig_args(kubeconfig: dict | None) -> list[str]:
+    """Build the --kubeconfig flag pointing kubectl/helm at an embedded kubeconfig.
+
+    Unlike KubeconfigContext, this leaves the process environment untouched,
+    so commands for different clusters can run from concurrent threads. The
+    file is written once per distinct kubeconfig and reused until exit.
+
+    Args:
+        kubeconfig: Kubeconfig dict, or None to use the default configuration
+
+    Returns:
+        Arguments to insert after the kubectl/helm executable (empty for None)
+    """
+    if kubeconfig is None:
+        return []
+    return ["--kubeconfig", str(_materialize_kubeconfig(yaml.dump(kubeconfig)))]
+
+
 class KubeconfigContext:
     """Context manager for using profile's embedded kubeconfig."""
 
@@ -41,36 +41,40 @@ def generate_fernet_key() -> str:
 def generate_secrets(profile: ProfileConfig) -> ProfileConfig:
     """Fill in any missing secrets with generated values.
 
-    Returns a new ProfileConfig with all secrets populated.
+    Returns a new ProfileConfig with all secrets populated, or the profile
+    itself when nothing is missing (so repeated calls are cheap).
     """
-    data = profile.model_dump()
+    generated: dict[str, str] = {}
 
     # Core secrets
-    if not data.get("redis_password"):
-        data["redis_password"] = generate_password()
-    if not data.get("jwt_secret"):
-        data["jwt_secret"] = generate_password()
-    if not data.get("jwt_refresh_secret"):
-        data["jwt_refresh_secret"] = generate_password()
-    if not data.get("super_admin_password"):
-        data["super_admin_password"] = generate_password(16)
+    if not profile.redis_password:
+        generated["redis_password"] = generate_password()
+    if not profile.jwt_secret:
+        generated["jwt_secret"] = generate_password()
+    if not profile.jwt_refresh_secret:
+        generated["jwt_refresh_secret"] = generate_password()
+    if not profile.super_admin_password:
+        generated["super_admin_password"] = generate_password(16)
 
     # Session secrets (for Live Session)
-    if data.get("live_session_enabled"):
-        if not data.get("session_postgres_password"):
-            data["session_postgres_password"] = generate_password()
-        if not data.get("session_crypt_key"):
-            data["session_crypt_key"] = generate_crypt_key(10)
+    if profile.live_session_enabled:
+        if not profile.session_postgres_password:
+            generated["session_postgres_password"] = generate_password()
+        if not profile.session_crypt_key:
+            generated["session_crypt_key"] = generate_crypt_key(10)
 
     # LLM secrets
-    if data.get("llm_enabled"):
-        if not data.get("llm_postgres_password"):
-            data["llm_postgres_password"] = generate_password()
-        if not data.get("llm_redis_password"):
-            data["llm_redis_password"] = generate_password()
-        if not data.get("llm_encryption_key"):
-            data["llm_encryption_key"] = generate_fernet_key()
-        if not data.get("llm_admin_password"):
-            data["llm_admin_password"] = generate_password(16)
-
-    return ProfileConfig(**data)
+    if profile.llm_enabled:
+        if not profile.llm_postgres_password:
+            generated["llm_postgres_password"] = generate_password()
+        if not profile.llm_redis_password:
+            generated["llm_redis_password"] = generate_password()
+        if not profile.llm_encryption_key:
+            generated["llm_encryption_key"] = generate_fernet_key()
+        if not profile.llm_admin_password:
+            generated["llm_admin_password"] = generate_password(16)
+
+    if not generated:
+        return profile
+
+    return ProfileConfig(**{**profile.model_dump(), **generated})
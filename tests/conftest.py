@@ -1,6 +1,8 @@
 """Pytest configuration and shared fixtures."""
 
+import importlib.util
 import json
+from pathlib import Path
 
 import pytest
 from typer.testing import CliRunner
@@ -82,3 +84,25 @@ def create_profile(temp_profiles_dir):
         return profile_path
 
     return _create
+
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+
+
+@pytest.fixture
+def load_script(monkeypatch):
+    """Factory fixture to import a maintenance script from scripts/ by file name.
+
+    The scripts are not a package and need requests, which is not a dependency
+    of linto itself, so tests using them are skipped when it is missing.
+    """
+    pytest.importorskip("requests")
+    monkeypatch.syspath_prepend(str(SCRIPTS_DIR))
+
+    def _load(filename: str):
+        spec = importlib.util.spec_from_file_location(Path(filename).stem.replace("-", "_"), SCRIPTS_DIR / filename)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    return _load
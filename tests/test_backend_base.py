@@ -0,0 +1,89 @@
+"""Tests for shared backend rendering helpers."""
+
+import yaml
+
+from linto.backends.base import (
+    format_traefik_dynamic_config,
+    generate_traefik_dynamic_config,
+    generate_traefik_labels,
+    service_to_compose_dict,
+    service_to_swarm_dict,
+)
+from linto.model.service import DeployConfig, Resources, ResourceSpec, RestartPolicy, ServiceDefinition
+
+
+class TestTraefikLabels:
+    """Test Traefik label generation."""
+
+    def test_path_prefix_with_strip_and_acme(self):
+        """Test labels for a prefixed route with prefix stripping over ACME TLS."""
+        labels = generate_traefik_labels("studio-api", "/api", "example.com", True, True, "acme", 8080)
+
+        assert "traefik.http.routers.studio_api.entrypoints=websecure" in labels
+        assert "traefik.http.services.studio_api.loadbalancer.server.port=8080" in labels
+        assert "traefik.http.routers.studio_api.rule=Host(`example.com`) && PathPrefix(`/api`)" in labels
+        assert "traefik.http.routers.studio_api.tls.certresolver=leresolver" in labels
+        assert "traefik.http.middlewares.studio_api_strip.stripPrefix.prefixes=/api" in labels
+
+    def test_root_route_has_low_priority_and_no_strip(self):
+        """Test that the catch-all route gets priority 1 and never strips."""
+        labels = generate_traefik_labels("frontend", "/", "example.com", True, False, "off")
+
+        assert "traefik.http.routers.frontend.entrypoints=web" in labels
+        assert "traefik.http.routers.frontend.priority=1" in labels
+        assert not any("stripPrefix" in label for label in labels)
+
+    def test_returned_list_is_not_shared(self):
+        """Test that extending the returned labels does not affect later calls."""
+        args = ("studio-api", "/api", "example.com", False, False, "off")
+        first = generate_traefik_labels(*args)
+        first.append("extra=label")
+
+        assert "extra=label" not in generate_traefik_labels(*args)
+
+    def test_extra_labels_do_not_leak_between_services(self):
+        """Test that extra labels on one service do not appear on another with the same routing."""
+        with_extra = ServiceDefinition(
+            name="svc", category="infra", image="img", traefik_endpoint="/x", extra_labels=["custom=1"]
+        )
+        without_extra = ServiceDefinition(name="svc", category="infra", image="img", traefik_endpoint="/x")
+
+        assert "custom=1" in service_to_compose_dict(with_extra, "example.com", "off")["labels"]
+        assert "custom=1" not in service_to_swarm_dict(without_extra, "example.com", "off")["deploy"]["labels"]
+
+
+class TestSwarmDeploy:
+    """Test the deploy section of Swarm service dicts."""
+
+    def test_unset_resource_fields_are_dropped(self):
+        """Test that only set resource fields and non-empty specs are rendered."""
+        service = ServiceDefinition(
+            name="worker",
+            category="stt",
+            image="img",
+            deploy=DeployConfig(
+                resources=Resources(limits=ResourceSpec(memory="2G"), reservations=ResourceSpec()),
+                restart_policy=RestartPolicy(condition="any", delay="5s"),
+            ),
+        )
+
+        deploy = service_to_swarm_dict(service, "example.com", "off")["deploy"]
+
+        assert deploy["resources"] == {"limits": {"memory": "2G"}}
+        assert deploy["restart_policy"] == {"condition": "any", "delay": "5s"}
+
+    def test_default_deploy(self):
+        """Test the default deploy section when the service has none."""
+        service = ServiceDefinition(name="worker", category="stt", image="img")
+
+        assert service_to_swarm_dict(service, "example.com", "off")["deploy"] == {"mode": "replicated", "replicas": 1}
+
+
+class TestTraefikDynamicConfig:
+    """Test the Traefik dynamic TLS configuration."""
+
+    def test_formatted_text_matches_yaml_dump(self):
+        """Test that the hand-formatted tls.yml matches dumping the config dict."""
+        for domain in ("localhost", "example.com", "linto.sub-domain.example.org"):
+            expected = yaml.safe_dump(generate_traefik_dynamic_config(domain), default_flow_style=False)
+            assert format_traefik_dynamic_config(domain) == expected
@@ -0,0 +1,46 @@
+"""Tests for the RC build script's tag commit cache."""
+
+import pytest
+
+
+@pytest.fixture
+def build_rc(load_script, monkeypatch):
+    """The build-rc script module, loaded without a manifest cache configured."""
+    monkeypatch.delenv("MANIFEST_CACHE", raising=False)
+    return load_script("build-rc.py")
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    """Path of the SQLite manifest cache shared by successive runs."""
+    return str(tmp_path / "cache" / "manifests.sqlite")
+
+
+class TestManifestCache:
+    """Test that tag commits persist across RC builds until they expire."""
+
+    def test_tag_commit_persists_across_runs(self, build_rc, cache_path):
+        """Test that the commit a Git version tag resolved to is reused."""
+        build_rc.ManifestCache(cache_path).put_commit("https://github.com/linto-ai/x", "1.6.0", "a" * 40)
+
+        assert build_rc.ManifestCache(cache_path).get_commit("https://github.com/linto-ai/x", "1.6.0") == "a" * 40
+
+    def test_entries_expire_after_ttl(self, build_rc, cache_path, monkeypatch):
+        """Test that cached entries are ignored once CACHE_TTL has elapsed."""
+        now = 1_700_000_000.0
+        monkeypatch.setattr(build_rc.time, "time", lambda: now)
+        cache = build_rc.ManifestCache(cache_path)
+        cache.put_commit("https://github.com/linto-ai/x", "1.6.0", "a" * 40)
+
+        monkeypatch.setattr(build_rc.time, "time", lambda: now + build_rc.CACHE_TTL - 1)
+        assert cache.get_commit("https://github.com/linto-ai/x", "1.6.0") is not None
+
+        monkeypatch.setattr(build_rc.time, "time", lambda: now + build_rc.CACHE_TTL + 1)
+        assert cache.get_commit("https://github.com/linto-ai/x", "1.6.0") is None
+
+    def test_disabled_without_path(self, build_rc):
+        """Test that a cache without a path never serves entries."""
+        cache = build_rc.ManifestCache(None)
+        cache.put_commit("https://github.com/linto-ai/x", "1.6.0", "a" * 40)
+
+        assert cache.get_commit("https://github.com/linto-ai/x", "1.6.0") is None
@@ -0,0 +1,157 @@
+"""Tests for k3s values rendering and its up-to-date checks."""
+
+import subprocess
+
+import pytest
+
+from linto.backends import k3s
+from linto.model.profile import ProfileConfig
+from linto.model.validation import load_profile, save_profile
+
+
+@pytest.fixture
+def profile():
+    """Minimal k3s profile with the studio chart only."""
+    return ProfileConfig(
+        name="test-k3s",
+        domain="test.local",
+        backend="k3s",
+        stt_enabled=False,
+        live_session_enabled=False,
+        llm_enabled=False,
+        tls_mode="off",
+    )
+
+
+@pytest.fixture
+def render_calls(monkeypatch):
+    """Record which charts are actually generated by render_k3s."""
+    calls = []
+    generate = k3s._chart_values_cached
+
+    def recording(chart, profile_json):
+        calls.append(chart)
+        return generate(chart, profile_json)
+
+    monkeypatch.setattr(k3s, "_chart_values_cached", recording)
+    return calls
+
+
+@pytest.fixture
+def apply_renders(monkeypatch):
+    """Run apply_k3s offline and record each full render it triggers."""
+    renders = []
+    generate = k3s.generate_k3s
+
+    def recording(profile_name, output_dir=None, base_dir=None):
+        renders.append(profile_name)
+        return generate(profile_name, output_dir=output_dir, base_dir=base_dir)
+
+    monkeypatch.setattr(k3s, "generate_k3s", recording)
+    monkeypatch.setattr(k3s, "check_k3s_prerequisites", lambda profile: [])
+    monkeypatch.setattr(k3s, "ensure_namespace", lambda namespace, kubeconfig=None: True)
+    monkeypatch.setattr(k3s, "run_cmd", lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 0, "", ""))
+    return renders
+
+
+class TestRenderK3s:
+    """Test that values files are only rewritten when stale."""
+
+    def test_unchanged_render_is_skipped(self, profile, tmp_path, render_calls):
+        """Test that rendering the same profile twice writes the values once."""
+        k3s.render_k3s(profile, tmp_path)
+        k3s.render_k3s(profile, tmp_path)
+
+        assert render_calls == ["studio"]
+
+    def test_profile_change_rerenders(self, profile, tmp_path, render_calls):
+        """Test that a changed profile rewrites the values file."""
+        files = k3s.render_k3s(profile, tmp_path)
+        k3s.render_k3s(profile.model_copy(update={"domain": "other.local"}), tmp_path)
+
+        assert render_calls == ["studio", "studio"]
+        assert "other.local" in files["studio"].read_text()
+
+    def test_missing_values_file_is_restored(self, profile, tmp_path, render_calls):
+        """Test that a deleted values file is rendered again."""
+        files = k3s.render_k3s(profile, tmp_path)
+        files["studio"].unlink()
+        k3s.render_k3s(profile, tmp_path)
+
+        assert render_calls == ["studio", "studio"]
+        assert files["studio"].exists()
+
+    def test_modified_values_file_is_restored(self, profile, tmp_path, render_calls):
+        """Test that a hand-edited values file is overwritten by a fresh render."""
+        files = k3s.render_k3s(profile, tmp_path)
+        original = files["studio"].read_bytes()
+        files["studio"].write_text("tampered: true\n")
+        k3s.render_k3s(profile, tmp_path)
+
+        assert render_calls == ["studio", "studio"]
+        assert files["studio"].read_bytes() == original
+
+
+class TestApplyK3sRender:
+    """Test that apply_k3s only skips the render when values are current."""
+
+    def _apply_twice(self, profile, tmp_path, renders):
+        """Save the profile, apply it, and return the renders of a second apply."""
+        save_profile(profile, tmp_path)
+        k3s.apply_k3s(profile.name, tmp_path)
+        renders.clear()
+        k3s.apply_k3s(profile.name, tmp_path)
+        return list(renders)
+
+    def _values_dir(self, tmp_path, profile):
+        """Directory apply_k3s renders the profile's values files into."""
+        return tmp_path / ".linto" / "render" / "k3s" / profile.name / "values"
+
+    def test_unchanged_profile_skips_render(self, profile, tmp_path, apply_renders):
+        """Test that re-applying an unchanged profile does not render again."""
+        assert self._apply_twice(profile, tmp_path, apply_renders) == []
+
+    def test_missing_secrets_render(self, profile, tmp_path, apply_renders):
+        """Test that a profile without generated secrets is rendered."""
+        save_profile(profile, tmp_path)
+        k3s.apply_k3s(profile.name, tmp_path)
+
+        assert apply_renders == [profile.name]
+        assert load_profile(profile.name, tmp_path).jwt_secret
+
+    def test_profile_change_renders(self, profile, tmp_path, apply_renders):
+        """Test that a changed profile is rendered again."""
+        self._apply_twice(profile, tmp_path, apply_renders)
+        changed = load_profile(profile.name, tmp_path).model_copy(update={"domain": "other.local"})
+        save_profile(changed, tmp_path)
+        k3s.apply_k3s(profile.name, tmp_path)
+
+        assert apply_renders == [profile.name]
+
+    def test_newly_enabled_chart_renders(self, profile, tmp_path, apply_renders):
+        """Test that enabling another chart renders its values."""
+        self._apply_twice(profile, tmp_path, apply_renders)
+        changed = load_profile(profile.name, tmp_path).model_copy(update={"stt_enabled": True})
+        save_profile(changed, tmp_path)
+        k3s.apply_k3s(profile.name, tmp_path)
+
+        assert apply_renders == [profile.name]
+        assert (self._values_dir(tmp_path, profile) / "stt-values.yaml").exists()
+
+    def test_missing_values_file_renders(self, profile, tmp_path, apply_renders):
+        """Test that a deleted values file is rendered before deploying."""
+        self._apply_twice(profile, tmp_path, apply_renders)
+        (self._values_dir(tmp_path, profile) / "studio-values.yaml").unlink()
+        k3s.apply_k3s(profile.name, tmp_path)
+
+        assert apply_renders == [profile.name]
+
+    def test_modified_values_file_renders(self, profile, tmp_path, apply_renders):
+        """Test that a locally edited values file is re-rendered, not deployed."""
+        self._apply_twice(profile, tmp_path, apply_renders)
+        values_path = self._values_dir(tmp_path, profile) / "studio-values.yaml"
+        values_path.write_text("tampered: true\n")
+        k3s.apply_k3s(profile.name, tmp_path)
+
+        assert apply_renders == [profile.name]
+        assert "tampered" not in values_path.read_text()
@@ -1,4 +1,4 @@
-"""Tests for KubeconfigContext utility."""
+"""Tests for KubeconfigContext and kubeconfig_args utilities."""
 
 import os
 from pathlib import Path
@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 import yaml
 
-from linto.utils.kubeconfig import KubeconfigContext
+from linto.utils.kubeconfig import KubeconfigContext, kubeconfig_args
 
 
 @pytest.fixture
@@ -147,3 +147,29 @@ class TestKubeconfigContext:
         """Test that path property returns None when kubeconfig is None."""
         with KubeconfigContext(None) as ctx:
             assert ctx.path is None
+
+
+class TestKubeconfigArgs:
+    """Tests for kubeconfig_args."""
+
+    def test_kubeconfig_args_with_none(self):
+        """None kubeconfig adds no flag."""
+        assert kubeconfig_args(None) == []
+
+    def test_kubeconfig_args_points_to_file(self, sample_kubeconfig):
+        """The flag points to a file holding the kubeconfig."""
+        flag, path = kubeconfig_args(sample_kubeconfig)
+        assert flag == "--kubeconfig"
+        with Path(path).open() as f:
+            loaded = yaml.safe_load(f)
+        assert loaded == sample_kubeconfig
+
+    def test_kubeconfig_args_reuses_file(self, sample_kubeconfig):
+        """The same kubeconfig is written only once."""
+        assert kubeconfig_args(sample_kubeconfig) == kubeconfig_args(dict(sample_kubeconfig))
+
+    def test_kubeconfig_args_leaves_env_untouched(self, sample_kubeconfig):
+        """KUBECONFIG is not modified."""
+        original = os.environ.get("KUBECONFIG")
+        kubeconfig_args(sample_kubeconfig)
+        assert os.environ.get("KUBECONFIG") == original
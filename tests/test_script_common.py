@@ -0,0 +1,64 @@
+"""Tests for helpers shared by the version-maintenance scripts."""
+
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture
+def common(load_script):
+    """The scripts' shared helper module."""
+    return load_script("common.py")
+
+
+def _response(status_code=200, remaining=None, reset=None):
+    """Minimal GitHub response carrying rate-limit headers."""
+    headers = {}
+    if remaining is not None:
+        headers["X-RateLimit-Remaining"] = str(remaining)
+    if reset is not None:
+        headers["X-RateLimit-Reset"] = str(int(reset))
+    return SimpleNamespace(status_code=status_code, headers=headers)
+
+
+class TestTokenPool:
+    """Test GitHub token rotation and rate-limit tracking."""
+
+    def test_rotates_round_robin(self, common):
+        """Test that healthy tokens are handed out in turn."""
+        pool = common.TokenPool(["a", "b", "c"])
+
+        assert [pool.get_next_token() for _ in range(4)] == ["a", "b", "c", "a"]
+
+    def test_empty_pool_has_no_token(self, common):
+        """Test that a pool without tokens yields None."""
+        assert common.TokenPool([]).get_next_token() is None
+
+    def test_skips_exhausted_token_until_reset(self, common, monkeypatch):
+        """Test that a token with low remaining quota is skipped until it resets."""
+        now = 1_700_000_000.0
+        monkeypatch.setattr(common.time, "time", lambda: now)
+        pool = common.TokenPool(["a", "b"])
+        pool.sync("a", _response(remaining=3, reset=now + 600))
+
+        assert [pool.get_next_token() for _ in range(3)] == ["b", "b", "b"]
+
+        monkeypatch.setattr(common.time, "time", lambda: now + 601)
+        assert {pool.get_next_token() for _ in range(2)} == {"a", "b"}
+
+    def test_all_exhausted_returns_soonest_reset(self, common, monkeypatch):
+        """Test that with every token exhausted, the one resetting first is used."""
+        now = 1_700_000_000.0
+        monkeypatch.setattr(common.time, "time", lambda: now)
+        pool = common.TokenPool(["a", "b"])
+        pool.sync("a", _response(remaining=0, reset=now + 900))
+        pool.sync("b", _response(remaining=0, reset=now + 60))
+
+        assert pool.get_next_token() == "b"
+
+    def test_rejected_token_is_disabled(self, common):
+        """Test that a token answered with 401 is never handed out again."""
+        pool = common.TokenPool(["a", "b"])
+        pool.sync("a", _response(status_code=401))
+
+        assert [pool.get_next_token() for _ in range(3)] == ["b", "b", "b"]
@@ -0,0 +1,66 @@
+"""Tests for the single-service rc.yaml update script."""
+
+import pytest
+import yaml
+
+COMMIT = "a" * 40
+
+
+@pytest.fixture
+def rc_file(tmp_path):
+    """rc.yaml already recording a digest for studio-api at latest + COMMIT."""
+    path = tmp_path / "versions" / "rc.yaml"
+    path.parent.mkdir()
+    path.write_text(
+        yaml.safe_dump(
+            {
+                "linto": {
+                    "studio-api": {
+                        "image": "lintoai/studio-api",
+                        "tag": "latest",
+                        "commit": COMMIT,
+                        "digest": "sha256:old",
+                    }
+                }
+            }
+        )
+    )
+    return path
+
+
+@pytest.fixture
+def update_rc_service(load_script, rc_file, monkeypatch):
+    """The update-rc-service script module, pointed at rc_file."""
+    module = load_script("update-rc-service.py")
+    monkeypatch.setattr(module, "__file__", str(rc_file.parent.parent / "scripts" / "update-rc-service.py"))
+    monkeypatch.setenv("SERVICE", "studio-api")
+    monkeypatch.setenv("TAG", "latest")
+    monkeypatch.setenv("COMMIT_SHA", COMMIT)
+    monkeypatch.delenv("DIGEST", raising=False)
+    return module
+
+
+class TestDigest:
+    """Test where the recorded digest comes from."""
+
+    def test_rebuilt_tag_is_looked_up_again(self, update_rc_service, rc_file, monkeypatch):
+        """Test that a re-pushed tag + commit gets its new digest instead of the recorded one."""
+        lookups = []
+
+        def get_dockerhub_tag_info(image, tag):
+            lookups.append((image, tag))
+            return {"tag": tag, "digest": "sha256:new", "last_pushed": None}
+
+        monkeypatch.setattr(update_rc_service, "get_dockerhub_tag_info", get_dockerhub_tag_info)
+        update_rc_service.main()
+
+        assert lookups == [("lintoai/studio-api", "latest")]
+        assert yaml.safe_load(rc_file.read_text())["linto"]["studio-api"]["digest"] == "sha256:new"
+
+    def test_provided_digest_skips_lookup(self, update_rc_service, rc_file, monkeypatch):
+        """Test that a DIGEST passed by the build is recorded without querying DockerHub."""
+        monkeypatch.setenv("DIGEST", "sha256:pushed")
+        monkeypatch.setattr(update_rc_service, "get_dockerhub_tag_info", lambda image, tag: pytest.fail("looked up"))
+        update_rc_service.main()
+
+        assert yaml.safe_load(rc_file.read_text())["linto"]["studio-api"]["digest"] == "sha256:pushed"
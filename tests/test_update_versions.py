@@ -0,0 +1,137 @@
+"""Tests for the versions update script's persistent HTTP response cache."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+URL = "https://hub.docker.com/v2/repositories/lintoai/studio-api/tags/latest"
+
+
+@pytest.fixture
+def update_versions(load_script, monkeypatch):
+    """The update-versions script module, loaded without a cache file configured."""
+    monkeypatch.delenv("HTTP_CACHE", raising=False)
+    return load_script("update-versions.py")
+
+
+@pytest.fixture
+def session(update_versions, monkeypatch):
+    """Fake SESSION answering requests from a queue and recording request headers."""
+    fake = SimpleNamespace(responses=[], requests=[])
+
+    def request(method, url, headers=None, params=None, timeout=None, **kwargs):
+        fake.requests.append(dict(headers or {}))
+        status_code, response_headers, body = fake.responses.pop(0)
+        return SimpleNamespace(status_code=status_code, headers=response_headers, json=lambda: body)
+
+    fake.request = request
+    monkeypatch.setattr(update_versions, "SESSION", fake)
+    monkeypatch.setattr(update_versions, "RESPONSE_CACHE", update_versions.ResponseCache())
+    return fake
+
+
+class TestCachedGet:
+    """Test freshness and revalidation of cached responses."""
+
+    def test_fresh_entry_is_served_without_request(self, update_versions, session):
+        """Test that a response within its max-age is reused locally."""
+        session.responses.append((200, {"Cache-Control": "max-age=600", "ETag": '"v1"'}, {"name": "latest"}))
+
+        assert update_versions._cached_get(URL) == (200, {"name": "latest"})
+        assert update_versions._cached_get(URL) == (200, {"name": "latest"})
+        assert len(session.requests) == 1
+
+    def test_expired_entry_is_revalidated(self, update_versions, session, monkeypatch):
+        """Test that an entry past its max-age is requested again with its validators."""
+        now = 1_700_000_000.0
+        monkeypatch.setattr(update_versions.time, "time", lambda: now)
+        session.responses.append(
+            (200, {"Cache-Control": "max-age=60", "ETag": '"v1"', "Last-Modified": "Mon"}, {"name": "old"})
+        )
+        update_versions._cached_get(URL)
+
+        monkeypatch.setattr(update_versions.time, "time", lambda: now + 61)
+        session.responses.append((200, {"ETag": '"v2"'}, {"name": "new"}))
+
+        assert update_versions._cached_get(URL) == (200, {"name": "new"})
+        assert session.requests[1] == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon"}
+
+    def test_not_modified_reuses_stored_body(self, update_versions, session):
+        """Test that a 304 answer returns the body stored with the validator."""
+        session.responses.append((200, {"ETag": '"v1"'}, {"name": "latest"}))
+        update_versions._cached_get(URL)
+        session.responses.append((304, {}, None))
+
+        assert update_versions._cached_get(URL) == (200, {"name": "latest"})
+        assert session.requests[1] == {"If-None-Match": '"v1"'}
+
+    def test_no_store_response_is_not_cached(self, update_versions, session):
+        """Test that responses marked no-store are fetched every time."""
+        session.responses.append((200, {"Cache-Control": "no-store", "ETag": '"v1"'}, {"name": "latest"}))
+        session.responses.append((200, {"Cache-Control": "no-store", "ETag": '"v1"'}, {"name": "latest"}))
+        update_versions._cached_get(URL)
+        update_versions._cached_get(URL)
+
+        assert session.requests == [{}, {}]
+
+    def test_transient_error_is_retried(self, update_versions, session, monkeypatch):
+        """Test that 429/5xx responses go through the shared, capped backoff policy."""
+        monkeypatch.setattr(update_versions.time, "sleep", lambda seconds: None)
+        session.responses.append((503, {}, None))
+        session.responses.append((429, {"Retry-After": "1"}, None))
+        session.responses.append((200, {}, {"name": "latest"}))
+
+        assert update_versions._cached_get(URL) == (200, {"name": "latest"})
+        assert len(session.requests) == 3
+
+    def test_long_rate_limit_is_not_waited_out(self, update_versions, session, monkeypatch):
+        """Test that a Retry-After beyond MAX_RETRY_WAIT returns the 429 instead of sleeping."""
+        monkeypatch.setattr(update_versions.time, "sleep", lambda seconds: pytest.fail("slept"))
+        session.responses.append((429, {"Retry-After": "3600"}, None))
+
+        assert update_versions._cached_get(URL) == (429, None)
+
+
+class TestResponseCacheFile:
+    """Test loading and saving the cache file."""
+
+    def test_round_trip(self, update_versions, tmp_path):
+        """Test that saved entries are loaded by the next run."""
+        path = tmp_path / "cache" / "http.json"
+        cache = update_versions.ResponseCache(str(path))
+        cache.put(URL, {"etag": '"v1"', "body": {"name": "latest"}})
+        cache.save()
+
+        assert update_versions.ResponseCache(str(path)).get(URL) == {"etag": '"v1"', "body": {"name": "latest"}}
+
+    def test_missing_file_starts_empty(self, update_versions, tmp_path):
+        """Test that a cache file that does not exist yet is treated as empty."""
+        assert update_versions.ResponseCache(str(tmp_path / "http.json")).get(URL) is None
+
+    def test_corrupt_file_is_ignored(self, update_versions, tmp_path, capsys):
+        """Test that an unreadable cache file is reported and treated as empty."""
+        path = tmp_path / "http.json"
+        path.write_text("{not json")
+
+        cache = update_versions.ResponseCache(str(path))
+
+        assert cache.get(URL) is None
+        assert "Ignoring unreadable HTTP cache" in capsys.readouterr().err
+        cache.put(URL, {"body": 1})
+        cache.save()
+        assert json.loads(path.read_text()) == {URL: {"body": 1}}
+
+    def test_failed_save_keeps_previous_file(self, update_versions, tmp_path):
+        """Test that a save interrupted mid-write leaves the previous cache file intact."""
+        path = tmp_path / "http.json"
+        cache = update_versions.ResponseCache(str(path))
+        cache.put(URL, {"body": 1})
+        cache.save()
+
+        cache.put(URL, {"body": object()})
+        with pytest.raises(TypeError):
+            cache.save()
+
+        assert json.loads(path.read_text()) == {URL: {"body": 1}}
+        assert list(tmp_path.iterdir()) == [path]